@@ -0,0 +1,1075 @@
+# Generated by utils/vocabulary.py from ontologies/EC1990.ttl; do not edit.
+# Regenerate with: python -m utils.vocabulary
+from sys import intern as _i
+
+SOURCE_SHA256 = '42e9f1a4bf5a384fb0645e2d1f6f25319d41fe4137ab26b78ec5a34e5e8638b8'
+NAMESPACE = 'http://www.w3id.org/eurocodes/ec1990#'
+
+# Classes
+AccelerationEffect = _i('http://www.w3id.org/eurocodes/ec1990#AccelerationEffect')
+AccessibleRoofs = _i('http://www.w3id.org/eurocodes/ec1990#AccessibleRoofs')
+AccidentalAction = _i('http://www.w3id.org/eurocodes/ec1990#AccidentalAction')
+AccidentalCombination = _i('http://www.w3id.org/eurocodes/ec1990#AccidentalCombination')
+AccidentalDesignSituation = _i('http://www.w3id.org/eurocodes/ec1990#AccidentalDesignSituation')
+AccompanyingVariableAction = _i('http://www.w3id.org/eurocodes/ec1990#AccompanyingVariableAction')
+Action = _i('http://www.w3id.org/eurocodes/ec1990#Action')
+AngularDeformation = _i('http://www.w3id.org/eurocodes/ec1990#AngularDeformation')
+AreaWithTables = _i('http://www.w3id.org/eurocodes/ec1990#AreaWithTables')
+AreasWithFixedSeats = _i('http://www.w3id.org/eurocodes/ec1990#AreasWithFixedSeats')
+AreasWithoutObstacle = _i('http://www.w3id.org/eurocodes/ec1990#AreasWithoutObstacle')
+AxialForce = _i('http://www.w3id.org/eurocodes/ec1990#AxialForce')
+BendingMoment = _i('http://www.w3id.org/eurocodes/ec1990#BendingMoment')
+BendingMomentResistance = _i('http://www.w3id.org/eurocodes/ec1990#BendingMomentResistance')
+Building = _i('http://www.w3id.org/eurocodes/ec1990#Building')
+CharacteristicCombination = _i('http://www.w3id.org/eurocodes/ec1990#CharacteristicCombination')
+CharacteristicValue = _i('http://www.w3id.org/eurocodes/ec1990#CharacteristicValue')
+CivilEngineeringWork = _i('http://www.w3id.org/eurocodes/ec1990#CivilEngineeringWork')
+CombinationOfActions = _i('http://www.w3id.org/eurocodes/ec1990#CombinationOfActions')
+CompressiveStrength = _i('http://www.w3id.org/eurocodes/ec1990#CompressiveStrength')
+Concrete = _i('http://www.w3id.org/eurocodes/ec1990#Concrete')
+CongregationArea = _i('http://www.w3id.org/eurocodes/ec1990#CongregationArea')
+ConstructionWork = _i('http://www.w3id.org/eurocodes/ec1990#ConstructionWork')
+CreepEffect = _i('http://www.w3id.org/eurocodes/ec1990#CreepEffect')
+DeadLoad = _i('http://www.w3id.org/eurocodes/ec1990#DeadLoad')
+Deflection = _i('http://www.w3id.org/eurocodes/ec1990#Deflection')
+Deformation = _i('http://www.w3id.org/eurocodes/ec1990#Deformation')
+DeformationEffect = _i('http://www.w3id.org/eurocodes/ec1990#DeformationEffect')
+Density = _i('http://www.w3id.org/eurocodes/ec1990#Density')
+DepartmentStore = _i('http://www.w3id.org/eurocodes/ec1990#DepartmentStore')
+DesignAction = _i('http://www.w3id.org/eurocodes/ec1990#DesignAction')
+DesignSituation = _i('http://www.w3id.org/eurocodes/ec1990#DesignSituation')
+DesignValue = _i('http://www.w3id.org/eurocodes/ec1990#DesignValue')
+DirectAction = _i('http://www.w3id.org/eurocodes/ec1990#DirectAction')
+Displacement = _i('http://www.w3id.org/eurocodes/ec1990#Displacement')
+DynamicAction = _i('http://www.w3id.org/eurocodes/ec1990#DynamicAction')
+DynamicEffect = _i('http://www.w3id.org/eurocodes/ec1990#DynamicEffect')
+EffectOfAction = _i('http://www.w3id.org/eurocodes/ec1990#EffectOfAction')
+EurocodeZone = _i('http://www.w3id.org/eurocodes/ec1990#EurocodeZone')
+FatigueAction = _i('http://www.w3id.org/eurocodes/ec1990#FatigueAction')
+FatigueEffect = _i('http://www.w3id.org/eurocodes/ec1990#FatigueEffect')
+FavourableAction = _i('http://www.w3id.org/eurocodes/ec1990#FavourableAction')
+FixedAction = _i('http://www.w3id.org/eurocodes/ec1990#FixedAction')
+FreeAction = _i('http://www.w3id.org/eurocodes/ec1990#FreeAction')
+FrequentCombination = _i('http://www.w3id.org/eurocodes/ec1990#FrequentCombination')
+FundamentalCombination = _i('http://www.w3id.org/eurocodes/ec1990#FundamentalCombination')
+GeneralRetailShops = _i('http://www.w3id.org/eurocodes/ec1990#GeneralRetailShops')
+GeometricalProperty = _i('http://www.w3id.org/eurocodes/ec1990#GeometricalProperty')
+GeotechnicalAction = _i('http://www.w3id.org/eurocodes/ec1990#GeotechnicalAction')
+HelicopterLandingAreas = _i('http://www.w3id.org/eurocodes/ec1990#HelicopterLandingAreas')
+ImposedLoad = _i('http://www.w3id.org/eurocodes/ec1990#ImposedLoad')
+IndirectAction = _i('http://www.w3id.org/eurocodes/ec1990#IndirectAction')
+IndustrialUse = _i('http://www.w3id.org/eurocodes/ec1990#IndustrialUse')
+IndustrialandStorage = _i('http://www.w3id.org/eurocodes/ec1990#IndustrialandStorage')
+InternalForce = _i('http://www.w3id.org/eurocodes/ec1990#InternalForce')
+LargeCrowdsAreas = _i('http://www.w3id.org/eurocodes/ec1990#LargeCrowdsAreas')
+LeadingVariableAction = _i('http://www.w3id.org/eurocodes/ec1990#LeadingVariableAction')
+LightVehicleTraffic = _i('http://www.w3id.org/eurocodes/ec1990#LightVehicleTraffic')
+LimitState = _i('http://www.w3id.org/eurocodes/ec1990#LimitState')
+LimitStateValue = _i('http://www.w3id.org/eurocodes/ec1990#LimitStateValue')
+LimitingServicabilityCriterion = _i('http://www.w3id.org/eurocodes/ec1990#LimitingServicabilityCriterion')
+LinearDeformation = _i('http://www.w3id.org/eurocodes/ec1990#LinearDeformation')
+LowerBoundValue = _i('http://www.w3id.org/eurocodes/ec1990#LowerBoundValue')
+Material = _i('http://www.w3id.org/eurocodes/ec1990#Material')
+MaterialProperty = _i('http://www.w3id.org/eurocodes/ec1990#MaterialProperty')
+MeanValue = _i('http://www.w3id.org/eurocodes/ec1990#MeanValue')
+MechanicalEffect = _i('http://www.w3id.org/eurocodes/ec1990#MechanicalEffect')
+MediumVehicleTraffic = _i('http://www.w3id.org/eurocodes/ec1990#MediumVehicleTraffic')
+NominalValue = _i('http://www.w3id.org/eurocodes/ec1990#NominalValue')
+NormalStress = _i('http://www.w3id.org/eurocodes/ec1990#NormalStress')
+OfficeArea = _i('http://www.w3id.org/eurocodes/ec1990#OfficeArea')
+PermanentAction = _i('http://www.w3id.org/eurocodes/ec1990#PermanentAction')
+PersistentDesignSituation = _i('http://www.w3id.org/eurocodes/ec1990#PersistentDesignSituation')
+PhysicalActivitiesAreas = _i('http://www.w3id.org/eurocodes/ec1990#PhysicalActivitiesAreas')
+PrincipalStress = _i('http://www.w3id.org/eurocodes/ec1990#PrincipalStress')
+QuasiPermanentCombination = _i('http://www.w3id.org/eurocodes/ec1990#QuasiPermanentCombination')
+QuasiStaticAction = _i('http://www.w3id.org/eurocodes/ec1990#QuasiStaticAction')
+Reaction = _i('http://www.w3id.org/eurocodes/ec1990#Reaction')
+RepresentativeAction = _i('http://www.w3id.org/eurocodes/ec1990#RepresentativeAction')
+RepresentativeValue = _i('http://www.w3id.org/eurocodes/ec1990#RepresentativeValue')
+Residential = _i('http://www.w3id.org/eurocodes/ec1990#Residential')
+ResidentialBuilding = _i('http://www.w3id.org/eurocodes/ec1990#ResidentialBuilding')
+Resistance = _i('http://www.w3id.org/eurocodes/ec1990#Resistance')
+Roof = _i('http://www.w3id.org/eurocodes/ec1990#Roof')
+Rotation = _i('http://www.w3id.org/eurocodes/ec1990#Rotation')
+SLSCombination = _i('http://www.w3id.org/eurocodes/ec1990#SLSCombination')
+SeismicAction = _i('http://www.w3id.org/eurocodes/ec1990#SeismicAction')
+SeismicCombination = _i('http://www.w3id.org/eurocodes/ec1990#SeismicCombination')
+SeismicDesignSituation = _i('http://www.w3id.org/eurocodes/ec1990#SeismicDesignSituation')
+SelfWeight = _i('http://www.w3id.org/eurocodes/ec1990#SelfWeight')
+ServiceabilityLimitState = _i('http://www.w3id.org/eurocodes/ec1990#ServiceabilityLimitState')
+ShearForce = _i('http://www.w3id.org/eurocodes/ec1990#ShearForce')
+ShearStress = _i('http://www.w3id.org/eurocodes/ec1990#ShearStress')
+ShoppingAreas = _i('http://www.w3id.org/eurocodes/ec1990#ShoppingAreas')
+ShrinkageEffect = _i('http://www.w3id.org/eurocodes/ec1990#ShrinkageEffect')
+SnowLoad = _i('http://www.w3id.org/eurocodes/ec1990#SnowLoad')
+StaticAction = _i('http://www.w3id.org/eurocodes/ec1990#StaticAction')
+StorageAreas = _i('http://www.w3id.org/eurocodes/ec1990#StorageAreas')
+Strain = _i('http://www.w3id.org/eurocodes/ec1990#Strain')
+Stress = _i('http://www.w3id.org/eurocodes/ec1990#Stress')
+StructuralMember = _i('http://www.w3id.org/eurocodes/ec1990#StructuralMember')
+StructuralSystem = _i('http://www.w3id.org/eurocodes/ec1990#StructuralSystem')
+Structure = _i('http://www.w3id.org/eurocodes/ec1990#Structure')
+ThermalAction = _i('http://www.w3id.org/eurocodes/ec1990#ThermalAction')
+Thickness = _i('http://www.w3id.org/eurocodes/ec1990#Thickness')
+TimeDependentEffect = _i('http://www.w3id.org/eurocodes/ec1990#TimeDependentEffect')
+TorsionalMoment = _i('http://www.w3id.org/eurocodes/ec1990#TorsionalMoment')
+TransientDesignSituation = _i('http://www.w3id.org/eurocodes/ec1990#TransientDesignSituation')
+Twist = _i('http://www.w3id.org/eurocodes/ec1990#Twist')
+ULSCombination = _i('http://www.w3id.org/eurocodes/ec1990#ULSCombination')
+UltimateLimitState = _i('http://www.w3id.org/eurocodes/ec1990#UltimateLimitState')
+UnfavourableAction = _i('http://www.w3id.org/eurocodes/ec1990#UnfavourableAction')
+UpperBoundValue = _i('http://www.w3id.org/eurocodes/ec1990#UpperBoundValue')
+VariableAction = _i('http://www.w3id.org/eurocodes/ec1990#VariableAction')
+VibrationResponse = _i('http://www.w3id.org/eurocodes/ec1990#VibrationResponse')
+VolumetricDeformation = _i('http://www.w3id.org/eurocodes/ec1990#VolumetricDeformation')
+WindAction = _i('http://www.w3id.org/eurocodes/ec1990#WindAction')
+
+# Object properties
+appliesTo = _i('http://www.w3id.org/eurocodes/ec1990#appliesTo')
+causesEffect = _i('http://www.w3id.org/eurocodes/ec1990#causesEffect')
+containsStructuralMember = _i('http://www.w3id.org/eurocodes/ec1990#containsStructuralMember')
+forLimitState = _i('http://www.w3id.org/eurocodes/ec1990#forLimitState')
+hasCharacteristicValue = _i('http://www.w3id.org/eurocodes/ec1990#hasCharacteristicValue')
+hasDesignValue = _i('http://www.w3id.org/eurocodes/ec1990#hasDesignValue')
+hasEffect = _i('http://www.w3id.org/eurocodes/ec1990#hasEffect')
+hasGeometricalProperty = _i('http://www.w3id.org/eurocodes/ec1990#hasGeometricalProperty')
+hasLimitStateValue = _i('http://www.w3id.org/eurocodes/ec1990#hasLimitStateValue')
+hasLowerBoundValue = _i('http://www.w3id.org/eurocodes/ec1990#hasLowerBoundValue')
+hasMaterialProperty = _i('http://www.w3id.org/eurocodes/ec1990#hasMaterialProperty')
+hasMeanValue = _i('http://www.w3id.org/eurocodes/ec1990#hasMeanValue')
+hasNominalValue = _i('http://www.w3id.org/eurocodes/ec1990#hasNominalValue')
+hasRepresentativeValue = _i('http://www.w3id.org/eurocodes/ec1990#hasRepresentativeValue')
+hasStructuralMember = _i('http://www.w3id.org/eurocodes/ec1990#hasStructuralMember')
+hasStructure = _i('http://www.w3id.org/eurocodes/ec1990#hasStructure')
+hasSystem = _i('http://www.w3id.org/eurocodes/ec1990#hasSystem')
+hasUpperBoundValue = _i('http://www.w3id.org/eurocodes/ec1990#hasUpperBoundValue')
+imposesCombination = _i('http://www.w3id.org/eurocodes/ec1990#imposesCombination')
+isDesignedFor = _i('http://www.w3id.org/eurocodes/ec1990#isDesignedFor')
+isMadeOf = _i('http://www.w3id.org/eurocodes/ec1990#isMadeOf')
+isVerifiedFor = _i('http://www.w3id.org/eurocodes/ec1990#isVerifiedFor')
+requiresVerficationOf = _i('http://www.w3id.org/eurocodes/ec1990#requiresVerficationOf')
+usesActionValue = _i('http://www.w3id.org/eurocodes/ec1990#usesActionValue')
+verifiedAgainstEffect = _i('http://www.w3id.org/eurocodes/ec1990#verifiedAgainstEffect')
+
+# Datatype properties
+hasCombinationFactor = _i('http://www.w3id.org/eurocodes/ec1990#hasCombinationFactor')
+hasDesignWorkingLife = _i('http://www.w3id.org/eurocodes/ec1990#hasDesignWorkingLife')
+hasFrequentFactor = _i('http://www.w3id.org/eurocodes/ec1990#hasFrequentFactor')
+hasNationallyDefinedValue = _i('http://www.w3id.org/eurocodes/ec1990#hasNationallyDefinedValue')
+hasPartialFactor = _i('http://www.w3id.org/eurocodes/ec1990#hasPartialFactor')
+hasQuasiPermanentFactor = _i('http://www.w3id.org/eurocodes/ec1990#hasQuasiPermanentFactor')
+hasReductionFactor = _i('http://www.w3id.org/eurocodes/ec1990#hasReductionFactor')
+isSatisfied = _i('http://www.w3id.org/eurocodes/ec1990#isSatisfied')
+
+# Individuals
+AgriculturalStructure = _i('http://www.w3id.org/eurocodes/ec1990#AgriculturalStructure')
+BridgeStructure = _i('http://www.w3id.org/eurocodes/ec1990#BridgeStructure')
+BuildingStructure = _i('http://www.w3id.org/eurocodes/ec1990#BuildingStructure')
+CivilEngineeringStructure = _i('http://www.w3id.org/eurocodes/ec1990#CivilEngineeringStructure')
+EQU = _i('http://www.w3id.org/eurocodes/ec1990#EQU')
+Execution = _i('http://www.w3id.org/eurocodes/ec1990#Execution')
+ExplosionDesignSituation = _i('http://www.w3id.org/eurocodes/ec1990#ExplosionDesignSituation')
+FAT = _i('http://www.w3id.org/eurocodes/ec1990#FAT')
+FireDesignSituation = _i('http://www.w3id.org/eurocodes/ec1990#FireDesignSituation')
+GEO = _i('http://www.w3id.org/eurocodes/ec1990#GEO')
+HYD = _i('http://www.w3id.org/eurocodes/ec1990#HYD')
+ISLS = _i('http://www.w3id.org/eurocodes/ec1990#ISLS')
+ImpactDesignSituation = _i('http://www.w3id.org/eurocodes/ec1990#ImpactDesignSituation')
+LocalizedFailureDesignSituation = _i('http://www.w3id.org/eurocodes/ec1990#LocalizedFailureDesignSituation')
+MonumentalBuldingStructure = _i('http://www.w3id.org/eurocodes/ec1990#MonumentalBuldingStructure')
+RSLS = _i('http://www.w3id.org/eurocodes/ec1990#RSLS')
+Repair = _i('http://www.w3id.org/eurocodes/ec1990#Repair')
+ReplacableStructuralElements = _i('http://www.w3id.org/eurocodes/ec1990#ReplacableStructuralElements')
+STR = _i('http://www.w3id.org/eurocodes/ec1990#STR')
+TemporaryStructure = _i('http://www.w3id.org/eurocodes/ec1990#TemporaryStructure')
+UPL = _i('http://www.w3id.org/eurocodes/ec1990#UPL')
+
+CLASSES = (
+    AccelerationEffect,
+    AccessibleRoofs,
+    AccidentalAction,
+    AccidentalCombination,
+    AccidentalDesignSituation,
+    AccompanyingVariableAction,
+    Action,
+    AngularDeformation,
+    AreaWithTables,
+    AreasWithFixedSeats,
+    AreasWithoutObstacle,
+    AxialForce,
+    BendingMoment,
+    BendingMomentResistance,
+    Building,
+    CharacteristicCombination,
+    CharacteristicValue,
+    CivilEngineeringWork,
+    CombinationOfActions,
+    CompressiveStrength,
+    Concrete,
+    CongregationArea,
+    ConstructionWork,
+    CreepEffect,
+    DeadLoad,
+    Deflection,
+    Deformation,
+    DeformationEffect,
+    Density,
+    DepartmentStore,
+    DesignAction,
+    DesignSituation,
+    DesignValue,
+    DirectAction,
+    Displacement,
+    DynamicAction,
+    DynamicEffect,
+    EffectOfAction,
+    EurocodeZone,
+    FatigueAction,
+    FatigueEffect,
+    FavourableAction,
+    FixedAction,
+    FreeAction,
+    FrequentCombination,
+    FundamentalCombination,
+    GeneralRetailShops,
+    GeometricalProperty,
+    GeotechnicalAction,
+    HelicopterLandingAreas,
+    ImposedLoad,
+    IndirectAction,
+    IndustrialUse,
+    IndustrialandStorage,
+    InternalForce,
+    LargeCrowdsAreas,
+    LeadingVariableAction,
+    LightVehicleTraffic,
+    LimitState,
+    LimitStateValue,
+    LimitingServicabilityCriterion,
+    LinearDeformation,
+    LowerBoundValue,
+    Material,
+    MaterialProperty,
+    MeanValue,
+    MechanicalEffect,
+    MediumVehicleTraffic,
+    NominalValue,
+    NormalStress,
+    OfficeArea,
+    PermanentAction,
+    PersistentDesignSituation,
+    PhysicalActivitiesAreas,
+    PrincipalStress,
+    QuasiPermanentCombination,
+    QuasiStaticAction,
+    Reaction,
+    RepresentativeAction,
+    RepresentativeValue,
+    Residential,
+    ResidentialBuilding,
+    Resistance,
+    Roof,
+    Rotation,
+    SLSCombination,
+    SeismicAction,
+    SeismicCombination,
+    SeismicDesignSituation,
+    SelfWeight,
+    ServiceabilityLimitState,
+    ShearForce,
+    ShearStress,
+    ShoppingAreas,
+    ShrinkageEffect,
+    SnowLoad,
+    StaticAction,
+    StorageAreas,
+    Strain,
+    Stress,
+    StructuralMember,
+    StructuralSystem,
+    Structure,
+    ThermalAction,
+    Thickness,
+    TimeDependentEffect,
+    TorsionalMoment,
+    TransientDesignSituation,
+    Twist,
+    ULSCombination,
+    UltimateLimitState,
+    UnfavourableAction,
+    UpperBoundValue,
+    VariableAction,
+    VibrationResponse,
+    VolumetricDeformation,
+    WindAction,
+)
+OBJECT_PROPERTIES = (
+    appliesTo,
+    causesEffect,
+    containsStructuralMember,
+    forLimitState,
+    hasCharacteristicValue,
+    hasDesignValue,
+    hasEffect,
+    hasGeometricalProperty,
+    hasLimitStateValue,
+    hasLowerBoundValue,
+    hasMaterialProperty,
+    hasMeanValue,
+    hasNominalValue,
+    hasRepresentativeValue,
+    hasStructuralMember,
+    hasStructure,
+    hasSystem,
+    hasUpperBoundValue,
+    imposesCombination,
+    isDesignedFor,
+    isMadeOf,
+    isVerifiedFor,
+    requiresVerficationOf,
+    usesActionValue,
+    verifiedAgainstEffect,
+)
+DATATYPE_PROPERTIES = (
+    hasCombinationFactor,
+    hasDesignWorkingLife,
+    hasFrequentFactor,
+    hasNationallyDefinedValue,
+    hasPartialFactor,
+    hasQuasiPermanentFactor,
+    hasReductionFactor,
+    isSatisfied,
+)
+INDIVIDUALS = (
+    AgriculturalStructure,
+    BridgeStructure,
+    BuildingStructure,
+    CivilEngineeringStructure,
+    EQU,
+    Execution,
+    ExplosionDesignSituation,
+    FAT,
+    FireDesignSituation,
+    GEO,
+    HYD,
+    ISLS,
+    ImpactDesignSituation,
+    LocalizedFailureDesignSituation,
+    MonumentalBuldingStructure,
+    RSLS,
+    Repair,
+    ReplacableStructuralElements,
+    STR,
+    TemporaryStructure,
+    UPL,
+)
+
+# rdfs:label of every term
+LABELS = {
+    AccelerationEffect: 'Acceleration effect',
+    AccessibleRoofs: 'Category I - accessible roofs',
+    AccidentalAction: 'Accidental action',
+    AccidentalCombination: 'Accidental combination',
+    AccidentalDesignSituation: 'Accidental design situation',
+    AccompanyingVariableAction: 'Accompanying variable action',
+    Action: 'Action',
+    AngularDeformation: 'Angular deformation',
+    AreaWithTables: 'Category C1 - areas with tables',
+    AreasWithFixedSeats: 'Category C2 - areas with fixed seats',
+    AreasWithoutObstacle: 'Category C3 - areas without obstacles',
+    AxialForce: 'Axial force',
+    BendingMoment: 'Bending moment',
+    BendingMomentResistance: 'Bending moment resistance',
+    Building: 'Building',
+    CharacteristicCombination: 'Characteristic combination',
+    CharacteristicValue: 'Characteristic value',
+    CivilEngineeringWork: 'Civil engineering work',
+    CombinationOfActions: 'Combination of actions',
+    CompressiveStrength: 'Compressive strength',
+    Concrete: 'Concrete',
+    CongregationArea: 'Category C - congregation areas',
+    ConstructionWork: 'Construction works',
+    CreepEffect: 'Creep effect',
+    DeadLoad: 'Dead load',
+    Deflection: 'Deflection',
+    Deformation: 'Deformation',
+    DeformationEffect: 'Deformation effect',
+    Density: 'Density',
+    DepartmentStore: 'Category D2 - department stores',
+    DesignAction: 'Design action',
+    DesignSituation: 'Design situation',
+    DesignValue: 'Design value',
+    DirectAction: 'Direct action',
+    Displacement: 'Displacement',
+    DynamicAction: 'Dynamic action',
+    DynamicEffect: 'Dynamic effect',
+    EffectOfAction: 'Effect of action',
+    EurocodeZone: 'Eurocode zone',
+    FatigueAction: 'Fatigue action',
+    FatigueEffect: 'Fatigue effect',
+    FavourableAction: 'Favourable action',
+    FixedAction: 'Fixed action',
+    FreeAction: 'Free action',
+    FrequentCombination: 'Frequent combination',
+    FundamentalCombination: 'Fundamental combination',
+    GeneralRetailShops: 'Category D1 - general retail shops',
+    GeometricalProperty: 'Geometrical data',
+    GeotechnicalAction: 'Geotechnical action',
+    HelicopterLandingAreas: 'Category K - helicopter landing areas',
+    ImposedLoad: 'Imposed load',
+    IndirectAction: 'Indirect action',
+    IndustrialUse: 'Category E2 - industrial use',
+    IndustrialandStorage: 'Category E - storage and industrial',
+    InternalForce: 'Internal force',
+    LargeCrowdsAreas: 'Category C5 - large crowds areas',
+    LeadingVariableAction: 'Leading variable action',
+    LightVehicleTraffic: 'Category F - light vehicle traffic',
+    LimitState: 'Limit state',
+    LimitStateValue: 'Limit state value',
+    LimitingServicabilityCriterion: 'Limiting serviceability criterion',
+    LinearDeformation: 'Linear deformation',
+    LowerBoundValue: 'Lower bound value',
+    Material: 'Material',
+    MaterialProperty: 'Material property',
+    MeanValue: 'Mean value',
+    MechanicalEffect: 'Mechanical effect',
+    MediumVehicleTraffic: 'Category G - medium vehicle traffic',
+    NominalValue: 'Nominal value',
+    NormalStress: 'Normal stress',
+    OfficeArea: 'Category B - office areas',
+    PermanentAction: 'Permanent action',
+    PersistentDesignSituation: 'Persistent design situation',
+    PhysicalActivitiesAreas: 'Category C4 - physical activities areas',
+    PrincipalStress: 'Principal stress',
+    QuasiPermanentCombination: 'Quasi-permanent combination',
+    QuasiStaticAction: 'Quasi-static action',
+    Reaction: 'Reaction',
+    RepresentativeAction: 'Representative action',
+    RepresentativeValue: 'Representative value',
+    Residential: 'Category A - domestic and residential',
+    ResidentialBuilding: 'Residential building',
+    Resistance: 'Resistance',
+    Roof: 'Category H - roofs',
+    Rotation: 'Rotation',
+    SLSCombination: 'Serviceability Limit State combination',
+    SeismicAction: 'Seismic action',
+    SeismicCombination: 'Seismic combination',
+    SeismicDesignSituation: 'Seismic design situation',
+    SelfWeight: 'Self-weight',
+    ServiceabilityLimitState: 'Serviceability Limit State',
+    ShearForce: 'Shear force',
+    ShearStress: 'Shear stress',
+    ShoppingAreas: 'Category D - shopping areas',
+    ShrinkageEffect: 'Shrinkage effect',
+    SnowLoad: 'Snow load',
+    StaticAction: 'Static action',
+    StorageAreas: 'Category E1 - storage areas',
+    Strain: 'Strain',
+    Stress: 'Stress',
+    StructuralMember: 'Structural member',
+    StructuralSystem: 'Structural system',
+    Structure: 'Structure',
+    ThermalAction: 'Thermal action',
+    Thickness: 'Thickness',
+    TimeDependentEffect: 'Time-dependent effect',
+    TorsionalMoment: 'Torsional moment',
+    TransientDesignSituation: 'Transient design situation',
+    Twist: 'Twist',
+    ULSCombination: 'Ultimate Limit State combination',
+    UltimateLimitState: 'Ultimate Limit State',
+    UnfavourableAction: 'UnfavourableAction action',
+    UpperBoundValue: 'Upper bound value',
+    VariableAction: 'Variable action',
+    VibrationResponse: 'Vibration response',
+    VolumetricDeformation: 'Volumetric Deformation',
+    WindAction: 'Wind action',
+    appliesTo: 'applies to',
+    causesEffect: 'causes effect',
+    containsStructuralMember: 'contains structural member',
+    forLimitState: 'for limit state',
+    hasCharacteristicValue: 'has characteristic value',
+    hasDesignValue: 'has design value',
+    hasEffect: 'has effect',
+    hasGeometricalProperty: 'has geometrical property',
+    hasLimitStateValue: 'has limit state value',
+    hasLowerBoundValue: 'has lower bound value',
+    hasMaterialProperty: 'has material property',
+    hasMeanValue: 'has mean value',
+    hasNominalValue: 'has nominal value',
+    hasRepresentativeValue: 'has representative value',
+    hasStructuralMember: 'has structural member',
+    hasStructure: 'has structure',
+    hasSystem: 'has system',
+    hasUpperBoundValue: 'has upper bound value',
+    imposesCombination: 'imposes combination',
+    isDesignedFor: 'is designed for',
+    isMadeOf: 'is made of',
+    isVerifiedFor: 'is verified for',
+    requiresVerficationOf: 'requires verification of',
+    usesActionValue: 'uses action value',
+    verifiedAgainstEffect: 'has limit state value',
+    hasCombinationFactor: 'has combination factor',
+    hasDesignWorkingLife: 'has design working life',
+    hasFrequentFactor: 'has frequent factor',
+    hasNationallyDefinedValue: 'has nationally defined value',
+    hasPartialFactor: 'has partial factor',
+    hasQuasiPermanentFactor: 'has quasi-permanent factor',
+    hasReductionFactor: 'has reduction factor',
+    isSatisfied: 'is satisfied',
+    AgriculturalStructure: 'Agricultural structure',
+    BridgeStructure: 'Bridge structure',
+    BuildingStructure: 'Building structure',
+    CivilEngineeringStructure: 'Civil engineering structure',
+    EQU: 'Static equilibrium',
+    Execution: 'Execution',
+    ExplosionDesignSituation: 'Explosion design situation',
+    FAT: 'Fatigue failure',
+    FireDesignSituation: 'Fire design situation',
+    GEO: 'Geotechnical failure',
+    HYD: 'Hydraulic failure',
+    ISLS: 'Irreversible Serviceability Limit State',
+    ImpactDesignSituation: 'Impact design situation',
+    LocalizedFailureDesignSituation: 'Localized failure design situation',
+    MonumentalBuldingStructure: 'Monumental building structure',
+    RSLS: 'Reversible Serviceability Limit State',
+    Repair: 'Repair',
+    ReplacableStructuralElements: 'Structure with replaceable elements',
+    STR: 'Structural resistance',
+    TemporaryStructure: 'Temporary structure',
+    UPL: 'Uplift failure',
+}
+
+# skos:definition of every term
+DEFINITIONS = {
+    AccelerationEffect: 'Effect involving acceleration of the structure or structural members.',
+    AccessibleRoofs: 'Roof accessible with occupancy according to categories A to G',
+    AccidentalAction: 'Action, usually of short duration but of significant magnitude, that is unlikely to occur on a given structure during the design working life.',
+    AccidentalCombination: 'Combination of actions for accidental design situations.',
+    AccidentalDesignSituation: 'Design situation involving exceptional conditions of the structure or its exposure, including fire, explosion, impact or local failure.',
+    AccompanyingVariableAction: 'Variable action that accompanies the leading action in a combination.',
+    Action: 'Set of forces (loads) applied to the structure (direct action) or set of imposed deformations or accelerations caused for example, by temperature changes, moisture variation, uneven settlement or earthquakes (indirect action).',
+    AngularDeformation: 'Deformation involving rotation or angular change in the structure.',
+    AreaWithTables: 'Area with tables',
+    AreasWithFixedSeats: 'Area with fixed seats',
+    AreasWithoutObstacle: 'Area without obstacles for moving people',
+    AxialForce: 'Internal force acting along the axis of structural members.',
+    BendingMoment: 'Internal moment causing bending in structural members.',
+    BendingMomentResistance: 'Design value of the maximum bending moment that a structural cross-section can safely resist without failure.',
+    Building: 'Type of construction work for building purposes such as dwelling houses, office buildings, etc.',
+    CharacteristicCombination: 'Serviceability combination normally used for irreversible limit states.',
+    CharacteristicValue: 'A statistically defined value of a physical quantity with a specified probability of non-exceedance.',
+    CivilEngineeringWork: 'Type of construction work for civil engineering purposes such as bridges, retaining walls, etc.',
+    CombinationOfActions: 'Set of design values used for the verification of the structural reliability for a limit state under the simultaneous influence of different actions.',
+    CompressiveStrength: 'Compressive strength of a material.',
+    Concrete: 'A composite material consisting of a mixture of cement, water, aggregates (coarse and fine), and, where appropriate, admixtures and additions, which develops its strength by hydration of the cement. ',
+    CongregationArea: 'Area where people may congregate (except areas under category A, B, and D)',
+    ConstructionWork: 'Everything that is constructed or results from construction operations. The term covers both building and civil engineering works comprising structural, non-structural and geotechnical elements.',
+    CreepEffect: 'Long-term deformation effect due to sustained loading.',
+    DeadLoad: '.',
+    Deflection: 'Vertical deflction of a structural member.',
+    Deformation: 'Change in shape or size of a structure or structural member due to actions.',
+    DeformationEffect: 'Effect of actions in the form of deformations of the structure or structural members.',
+    Density: 'Mass per unit volume of a material.',
+    DepartmentStore: 'Area in department stores',
+    DesignAction: 'Value ofan action used for limit state verification. A design valueo is btained by multiplying the representative value by the partial factor.',
+    DesignSituation: 'Sets of physical conditions representing the real conditions occurring during a certain time interval for which the design will demonstrate that relevant limit states are not exceeded.',
+    DesignValue: 'A value used in structural design verification, derived from a representative value (typically characteristic) through application of partial safety factors.',
+    DirectAction: 'Set of forces (loads) applied to the structure.',
+    Displacement: 'Horizontal displacement of a structure or structural member.',
+    DynamicAction: 'Action that causes significant acceleration of the structure or structural members.',
+    DynamicEffect: 'Effect of actions involving dynamic response, acceleration, or vibration.',
+    EffectOfAction: 'Effect of actions on structural members (e.g. internal force, moment, stress, strain) or on the whole structure (e.g. deflection, rotation).',
+    EurocodeZone: 'A space classified according to EN 1991-1-1 usage categories',
+    FatigueAction: "Repeated or fluctuating mechanical action applied over time, which may cause failure even if the individual stress cycles are below the material's static strength.",
+    FatigueEffect: 'Progressive damage effect due to repeated loading cycles.',
+    FavourableAction: 'Action that reduces the effect of other actions on a structure, or otherwise contributes to structural safety.',
+    FixedAction: 'Action that has a fixed distribution and position over the structure or structural member such that the magnitude and direction of the action are determined unambiguously for the whole structure.',
+    FreeAction: 'Action that may have various spatial distributions over the structure.',
+    FrequentCombination: 'Serviceability combination normally used for reversible limit states.',
+    FundamentalCombination: 'Combination of actions for persistent or transient design situations.',
+    GeneralRetailShops: 'Area in general retail shops',
+    GeometricalProperty: 'Geometrical properties and dimensions of structural elements.',
+    GeotechnicalAction: 'Action transmitted to the structure by the ground, fill or groundwater.',
+    HelicopterLandingAreas: 'Roof accessible for special services, such as helicopter landing areas',
+    ImposedLoad: 'Loads that is not permanent and arise from the intended use or occupancy of the structure.',
+    IndirectAction: 'Set of imposed deformations or accelerations caused for example, by temperature changes, moisture variation, uneven settlement or earthquakes.',
+    IndustrialUse: 'Industrial use area',
+    IndustrialandStorage: 'Storage and industrial area',
+    InternalForce: 'Effect of actions in the form of internal forces in structural members.',
+    LargeCrowdsAreas: 'Area susceptible to large crowds',
+    LeadingVariableAction: 'Variable action that, in a particular combination of actions, has the most significant effect on the design outcome and is considered as the primary representative of the variable actions in that combination.',
+    LightVehicleTraffic: 'Traffic and parking area for light vehicles (≤ 30 kN gross vehicle weight and ≤ 8 seats not including driver)',
+    LimitState: 'State beyond which the structure no longer fulfils the relevant design criteria.',
+    LimitStateValue: 'Design resistance or serviceability criterion used for verificatinon of a limit state.',
+    LimitingServicabilityCriterion: 'Limiting design value of the relevant serviceability criterion.',
+    LinearDeformation: 'Deformation involving linear displacement of points in the structure.',
+    LowerBoundValue: 'A conservative or code-specified minimum value of a physical quantity, used to ensure safety under unfavorable conditions.',
+    Material: 'Indication of the principal structural material.',
+    MaterialProperty: 'Physical or mechanical property of construction materials.',
+    MeanValue: 'Arithmetic average of a set of observations; used to represent the expected or central value of a physical quantity in structural design.',
+    MechanicalEffect: 'Effect of actions in the form of forces, stresses, or strains in structural members.',
+    MediumVehicleTraffic: 'Traffic and parking area for medium vehicles (>30 kN, ≤ 160 kN gross vehicle weight, on 2 axles)',
+    NominalValue: 'A conventional or assigned value of a physical quantity used for reference in design.',
+    NormalStress: 'Stress acting in the direction normal to a surface.',
+    OfficeArea: 'Office area',
+    PermanentAction: 'Action that is likely to act throughout a given reference period and for which the variation in magnitude with time is negligible, or for which the variation is always in the same direction (monotonic) until the action attains a certain limit value.',
+    PersistentDesignSituation: 'Design situation that is relevant during a period of the same order as the design working life of the structure. Generally refers to conditions of normal use.',
+    PhysicalActivitiesAreas: 'Area with possible physical activities',
+    PrincipalStress: 'Maximum or minimum normal stress at a point.',
+    QuasiPermanentCombination: 'Serviceability combination normally used for long-term effects and the appearance of the structure.',
+    QuasiStaticAction: 'Dynamic action represented by an equivalent static action in a static model.',
+    Reaction: 'Support reaction force or moment at structural supports.',
+    RepresentativeAction: 'Value ofan action used for limit state verification. A representative value may be the characteristic value or an accompanying value.',
+    RepresentativeValue: 'A value that approximates a physical parameter in a way that reflects its expected role in structural analysis or verification.',
+    Residential: 'Area for domestic and residential activities',
+    ResidentialBuilding: 'Building intended primarily for the accommodation and permanent or temporary residence of individuals or households.',
+    Resistance: 'Capacity of a member or component, or a cross-section of a member or component of a structure, to withstand actions without mechanical failure.',
+    Roof: 'Roof not accessible except for normal maintenance and repair',
+    Rotation: 'Angular rotation of a structure or structural member.',
+    SLSCombination: 'Combinations of actions for verifying serviceability limit states.',
+    SeismicAction: 'Action that arises due to earthquake ground motions.',
+    SeismicCombination: 'Combination of actions for seismic design situations.',
+    SeismicDesignSituation: 'Design situation involving exceptional conditions of the structure when subjected to a seismic event.',
+    SelfWeight: 'Weight of the structure itself, including all permanent construction elements, finishes, fixed equipment, and any other permanently attached components.',
+    ServiceabilityLimitState: 'State that correspond to conditions beyond which specified service requirements for a structure or structural member are no longer met.',
+    ShearForce: 'Internal force acting perpendicular to the axis of structural members.',
+    ShearStress: 'Stress acting in the direction parallel (tangential) to a surface.',
+    ShoppingAreas: 'Shopping area',
+    ShrinkageEffect: 'Deformation effect due to material shrinkage over time.',
+    SnowLoad: 'Variable climatic action caused by the accumulation of snow on the surface of structures.',
+    StaticAction: 'Action that does not cause significant acceleration of the structure or structural members.',
+    StorageAreas: 'Area susceptible to accumulation of goods, including access areas',
+    Strain: 'Deformation per unit length in structural members.',
+    Stress: 'Internal stress in structural members due to actions.',
+    StructuralMember: 'Physically distinguishable part of a structure, e.g. a column, a beam, a slab, a foundation pile.',
+    StructuralSystem: 'Load-bearing members of a building or civil engineering works and the way in which these members function together.',
+    Structure: 'Organised combination of connected parts designed to carry loads and provide adequate rigidity.',
+    ThermalAction: 'Actions that arises from the changes of temperature fields within a specified time interval.',
+    Thickness: 'Dimension of a structural element measured perpendicular to its plane or surface.',
+    TimeDependentEffect: 'Effect of actions that varies with time due to material behavior or other time-related factors.',
+    TorsionalMoment: 'Internal moment causing twisting in structural members.',
+    TransientDesignSituation: 'Design situation that is relevant during a period much shorter than the design working life of the structure and which has a high probability of occurrence, e.g. during construction or repair.',
+    Twist: 'Angular deformation about the longitudinal axis.',
+    ULSCombination: 'Combination of actions for verifying ultimate limit states.',
+    UltimateLimitState: 'State associated with collapse or with other similar forms of structural failure. They generally correspond to the maximum load-carrying resistance of a structure or structural member.',
+    UnfavourableAction: 'An action that increases the effect of other actions on a structure, or otherwise reduces structural safety.',
+    UpperBoundValue: 'A conservative or code-specified maximum value of a physical quantity, used to limit overestimation of capacity or underestimation of actions.',
+    VariableAction: 'Action for which the variation in magnitude with time is neither negligible nor monotonic.',
+    VibrationResponse: 'Dynamic response of structures to oscillatory actions, important for serviceability considerations.',
+    VolumetricDeformation: 'Deformation involving change in volume of structural elements.',
+    WindAction: 'Variable climatic action resulting from the movement of air relative to the surface of the Earth. These action acts as external pressure or suction on surfaces and can also induce internal pressure.',
+    appliesTo: 'Relates an action to the structural member or structure it acts upon.',
+    causesEffect: 'Relates a combination of actions to the effects it causes in the structure.',
+    containsStructuralMember: 'Relates a a structural element with the structural system.',
+    forLimitState: 'Relates a limit state value with its corresponding limit state.',
+    hasCharacteristicValue: 'Relates a Quantity  with its Characteristic Value.',
+    hasDesignValue: 'Relates a Quantity  with its Design Value.',
+    hasEffect: 'Relates a structural member to the effect of action.',
+    hasGeometricalProperty: 'Relates a structural member with its geometrical properties.',
+    hasLimitStateValue: 'Relates a structural member to its capacity for the effect of action.',
+    hasLowerBoundValue: 'Relates a Quantity  with its Lower Bound Value.',
+    hasMaterialProperty: 'Relates a material with its properties.',
+    hasMeanValue: 'Relates a Quantity  with its Mean Value.',
+    hasNominalValue: 'Relates a Quantity  with its Nominal Value.',
+    hasRepresentativeValue: 'Relates a Quantity  with its Representative Value.',
+    hasStructuralMember: 'Relates a a structural element with the zone.',
+    hasStructure: 'Relates a contrution work with the structure.',
+    hasSystem: 'Relates a structure with its structural system.',
+    hasUpperBoundValue: 'Relates a Quantity  with its Upper Bound Value.',
+    imposesCombination: 'Relates a design situation to the relevant combination.',
+    isDesignedFor: 'Relates a structural memeber with the design situation it is designed for.',
+    isMadeOf: 'Relates a structural member to the material which it is made of.',
+    isVerifiedFor: 'Relates a limit state to the combination of actions used for its verification.',
+    requiresVerficationOf: 'Relates a limit state to the combination of actions used for its verification.',
+    usesActionValue: 'Relates a combination of actions to the individual actions it contains.',
+    verifiedAgainstEffect: 'Relates a limitstate value with the Action Effect that needs to be verified against.',
+    hasCombinationFactor: 'Factor for combination value of a variable action used in ultimate limit state verifications.',
+    hasDesignWorkingLife: 'Period during which a structure or structural component is intended to remain functional and to fulfill its performance requirements without major repair or replacement, assuming appropriate maintenance.',
+    hasFrequentFactor: 'Factor for frequent value of a variable action, determined so that either the total time within the reference period during which it is exceeded is only a small given part of the reference period, or the frequency of it being exceeded is limited to a given value.',
+    hasNationallyDefinedValue: 'Defines whether parameter has specific value defined in NA.',
+    hasPartialFactor: 'Safety factor applied to actions or material properties to account for uncertainties.',
+    hasQuasiPermanentFactor: 'Factor for quasi-permanent value of a variable action, determined so that the total period of time for which it will be exceeded is a large fraction of the reference period.',
+    hasReductionFactor: 'Reduction factor for unfavourable permanent action.',
+    isSatisfied: 'Result of verification of the limit state.',
+    AgriculturalStructure: 'A building or construction primarily designed and used for farming-related activities.',
+    BridgeStructure: 'Engineered construction designed to span physical obstacles such as rivers, valleys, roads, or railways, providing a safe passage for vehicles, pedestrians, or utilities.',
+    BuildingStructure: 'Load-bearing framework or system designed to support and transfer all applied loads safely to the foundation and ultimately to the ground.',
+    CivilEngineeringStructure: 'Constructed system composed of interconnected physical elements designed, analyzed, and built to withstand environmental and operational loads, enabling the provision of essential services such as transport, shelter, water management, or energy distribution.',
+    EQU: 'Loss of static equilibrium of the structure or any part of it considered as a rigid body.',
+    Execution: 'Transient design situation during execution of a construction work.',
+    ExplosionDesignSituation: 'Accidental design situation involving explosion conditions.',
+    FAT: 'Fatigue failure of the structure or structural members.',
+    FireDesignSituation: 'Accidental design situation involving fire conditions requiring specific design considerations.',
+    GEO: 'Failure or excessive deformation of the ground where the strengths of soil or rock are significant in providing resistance.',
+    HYD: 'Hydraulic heave, internal erosion and piping in the ground caused by hydraulic gradients.',
+    ISLS: 'Serviceability limit state where some consequences of actions exceeding the specified service requirements will remain when the actions are removed.',
+    ImpactDesignSituation: 'Accidental design situation involving impact conditions.',
+    LocalizedFailureDesignSituation: 'Accidental design situation involving local failure conditions.',
+    MonumentalBuldingStructure: 'Large-scale, architecturally significant structure designed to serve as a landmark, memorial, or symbol of cultural, historical, or civic importance.',
+    RSLS: 'Serviceability limit state where no consequences of actions exceeding the specified service requirements will remain when the actions are removed.',
+    Repair: 'Transient design situation during repair of a construction work.',
+    ReplacableStructuralElements: 'Structure designed such that certain primary or secondary structural components can be removed, replaced, or upgraded during its service life without compromising the overall stability, integrity, or usability of the structure.',
+    STR: 'Internal failure or excessive deformation of the structure or structural members where the strength of construction materials governs.',
+    TemporaryStructure: 'Structre that is intended to be used for a limited period of time, typically to support, protect, or provide access during the execution of permanent works, or to serve a short-term purpose.',
+    UPL: 'Loss of equilibrium of the structure or the ground due to uplift by water pressure (buoyancy) or other vertical actions.',
+}
+
+# skos:altLabel (Eurocode notation)
+SYMBOLS = {
+    AccidentalAction: 'A',
+    Action: 'F',
+    AxialForce: 'N',
+    BendingMoment: 'M',
+    BendingMomentResistance: 'M_Rd',
+    Deflection: 'w',
+    Displacement: 'u',
+    EffectOfAction: 'E',
+    PermanentAction: 'G',
+    Resistance: 'R',
+    SeismicAction: 'A_E',
+    ServiceabilityLimitState: 'SLS',
+    ShearForce: 'V',
+    TorsionalMoment: 'T',
+    UltimateLimitState: 'ULS',
+    VariableAction: 'Q',
+    hasCombinationFactor: 'ψ_0',
+    hasFrequentFactor: 'ψ_1',
+    hasPartialFactor: 'γ_f',
+    hasQuasiPermanentFactor: 'ψ_2',
+    hasReductionFactor: 'ξ',
+}
+
+# Direct superclasses and superproperties
+PARENTS = {
+    AccelerationEffect: (DynamicEffect,),
+    AccessibleRoofs: (EurocodeZone,),
+    AccidentalAction: (Action,),
+    AccidentalCombination: (ULSCombination,),
+    AccidentalDesignSituation: (DesignSituation,),
+    AccompanyingVariableAction: (VariableAction,),
+    Action: ('http://purl.obolibrary.org/obo/BFO_0000140', 'http://qudt.org/3.1.2/schema/qudt/Quantity'),
+    AngularDeformation: (Deformation,),
+    AreaWithTables: (CongregationArea,),
+    AreasWithFixedSeats: (CongregationArea,),
+    AreasWithoutObstacle: (CongregationArea,),
+    AxialForce: (InternalForce,),
+    BendingMoment: (InternalForce,),
+    BendingMomentResistance: (Resistance,),
+    Building: (ConstructionWork,),
+    CharacteristicCombination: (SLSCombination,),
+    CharacteristicValue: ('http://qudt.org/3.1.2/schema/qudt/QuantityValue',),
+    CivilEngineeringWork: (ConstructionWork,),
+    CombinationOfActions: ('http://purl.obolibrary.org/obo/BFO_0000140',),
+    CompressiveStrength: (MaterialProperty,),
+    Concrete: (Material,),
+    CongregationArea: (EurocodeZone,),
+    ConstructionWork: ('http://purl.obolibrary.org/obo/BFO_0000040',),
+    CreepEffect: (TimeDependentEffect,),
+    DeadLoad: (PermanentAction,),
+    Deflection: (LinearDeformation,),
+    Deformation: (DeformationEffect,),
+    DeformationEffect: (EffectOfAction,),
+    Density: (MaterialProperty,),
+    DepartmentStore: (ShoppingAreas,),
+    DesignAction: (Action,),
+    DesignValue: ('http://qudt.org/3.1.2/schema/qudt/QuantityValue',),
+    DirectAction: (Action,),
+    Displacement: (LinearDeformation,),
+    DynamicAction: (Action,),
+    DynamicEffect: (EffectOfAction,),
+    EffectOfAction: ('http://purl.obolibrary.org/obo/BFO_0000140', 'http://qudt.org/3.1.2/schema/qudt/Quantity'),
+    EurocodeZone: ('http://purl.obolibrary.org/obo/BFO_0000040', 'https://w3id.org/bot#Zone'),
+    FatigueAction: (Action,),
+    FatigueEffect: (TimeDependentEffect,),
+    FavourableAction: (Action,),
+    FixedAction: (Action,),
+    FreeAction: (Action,),
+    FrequentCombination: (SLSCombination,),
+    FundamentalCombination: (ULSCombination,),
+    GeneralRetailShops: (ShoppingAreas,),
+    GeometricalProperty: ('http://purl.obolibrary.org/obo/BFO_0000019', 'http://qudt.org/3.1.2/schema/qudt/Quantity'),
+    GeotechnicalAction: (Action,),
+    HelicopterLandingAreas: (EurocodeZone,),
+    ImposedLoad: (VariableAction,),
+    IndirectAction: (Action,),
+    IndustrialUse: (IndustrialandStorage,),
+    IndustrialandStorage: (EurocodeZone,),
+    InternalForce: (MechanicalEffect,),
+    LargeCrowdsAreas: (CongregationArea,),
+    LeadingVariableAction: (VariableAction,),
+    LightVehicleTraffic: (EurocodeZone,),
+    LimitStateValue: ('http://qudt.org/3.1.2/schema/qudt/Quantity',),
+    LimitingServicabilityCriterion: (LimitStateValue,),
+    LinearDeformation: (Deformation,),
+    LowerBoundValue: ('http://qudt.org/3.1.2/schema/qudt/QuantityValue',),
+    MaterialProperty: ('http://purl.obolibrary.org/obo/BFO_0000019', 'http://qudt.org/3.1.2/schema/qudt/Quantity'),
+    MeanValue: ('http://qudt.org/3.1.2/schema/qudt/QuantityValue',),
+    MechanicalEffect: (EffectOfAction,),
+    MediumVehicleTraffic: (EurocodeZone,),
+    NominalValue: ('http://qudt.org/3.1.2/schema/qudt/QuantityValue',),
+    NormalStress: (Stress,),
+    OfficeArea: (EurocodeZone,),
+    PermanentAction: (Action,),
+    PersistentDesignSituation: (DesignSituation,),
+    PhysicalActivitiesAreas: (CongregationArea,),
+    PrincipalStress: (Stress,),
+    QuasiPermanentCombination: (SLSCombination,),
+    QuasiStaticAction: (DynamicAction,),
+    Reaction: (EffectOfAction,),
+    RepresentativeAction: (Action,),
+    RepresentativeValue: ('http://qudt.org/3.1.2/schema/qudt/QuantityValue',),
+    Residential: (EurocodeZone,),
+    ResidentialBuilding: (Building,),
+    Resistance: (LimitStateValue,),
+    Roof: (EurocodeZone,),
+    Rotation: (AngularDeformation,),
+    SLSCombination: (CombinationOfActions,),
+    SeismicAction: (AccidentalAction,),
+    SeismicCombination: (ULSCombination,),
+    SeismicDesignSituation: (DesignSituation,),
+    SelfWeight: (PermanentAction,),
+    ServiceabilityLimitState: (LimitState,),
+    ShearForce: (InternalForce,),
+    ShearStress: (Stress,),
+    ShoppingAreas: (EurocodeZone,),
+    ShrinkageEffect: (TimeDependentEffect,),
+    SnowLoad: (VariableAction,),
+    StaticAction: (Action,),
+    StorageAreas: (IndustrialandStorage,),
+    Strain: (MechanicalEffect,),
+    Stress: (MechanicalEffect,),
+    StructuralMember: ('http://purl.obolibrary.org/obo/BFO_0000040', 'https://w3id.org/bot#Element'),
+    StructuralSystem: ('http://purl.obolibrary.org/obo/BFO_0000040',),
+    Structure: ('http://purl.obolibrary.org/obo/BFO_0000040',),
+    ThermalAction: (VariableAction,),
+    Thickness: (GeometricalProperty,),
+    TimeDependentEffect: (EffectOfAction,),
+    TorsionalMoment: (InternalForce,),
+    TransientDesignSituation: (DesignSituation,),
+    Twist: (AngularDeformation,),
+    ULSCombination: (CombinationOfActions,),
+    UltimateLimitState: (LimitState,),
+    UnfavourableAction: (Action,),
+    UpperBoundValue: ('http://qudt.org/3.1.2/schema/qudt/QuantityValue',),
+    VariableAction: (Action,),
+    VibrationResponse: (DynamicEffect,),
+    VolumetricDeformation: (Deformation,),
+    WindAction: (VariableAction,),
+    containsStructuralMember: ('https://w3id.org/bot#hasElement',),
+    hasCharacteristicValue: ('http://qudt.org/3.1.2/schema/qudt/quantityValue',),
+    hasDesignValue: ('http://qudt.org/3.1.2/schema/qudt/quantityValue',),
+    hasLowerBoundValue: ('http://qudt.org/3.1.2/schema/qudt/quantityValue',),
+    hasMeanValue: ('http://qudt.org/3.1.2/schema/qudt/quantityValue',),
+    hasNominalValue: ('http://qudt.org/3.1.2/schema/qudt/quantityValue',),
+    hasRepresentativeValue: ('http://qudt.org/3.1.2/schema/qudt/quantityValue',),
+    hasStructuralMember: ('https://w3id.org/bot#hasElement',),
+    hasStructure: ('https://w3id.org/bot#hasElement',),
+    hasUpperBoundValue: ('http://qudt.org/3.1.2/schema/qudt/quantityValue',),
+}
+
+# Direct subclasses and subproperties
+CHILDREN = {
+    'http://purl.obolibrary.org/obo/BFO_0000019': (GeometricalProperty, MaterialProperty),
+    'http://purl.obolibrary.org/obo/BFO_0000040': (ConstructionWork, EurocodeZone, StructuralMember, StructuralSystem, Structure),
+    'http://purl.obolibrary.org/obo/BFO_0000140': (Action, CombinationOfActions, EffectOfAction),
+    'http://qudt.org/3.1.2/schema/qudt/Quantity': (Action, EffectOfAction, GeometricalProperty, LimitStateValue, MaterialProperty),
+    'http://qudt.org/3.1.2/schema/qudt/QuantityValue': (CharacteristicValue, DesignValue, LowerBoundValue, MeanValue, NominalValue, RepresentativeValue, UpperBoundValue),
+    'http://qudt.org/3.1.2/schema/qudt/quantityValue': (hasCharacteristicValue, hasDesignValue, hasLowerBoundValue, hasMeanValue, hasNominalValue, hasRepresentativeValue, hasUpperBoundValue),
+    AccidentalAction: (SeismicAction,),
+    Action: (AccidentalAction, DesignAction, DirectAction, DynamicAction, FatigueAction, FavourableAction, FixedAction, FreeAction, GeotechnicalAction, IndirectAction, PermanentAction, RepresentativeAction, StaticAction, UnfavourableAction, VariableAction),
+    AngularDeformation: (Rotation, Twist),
+    Building: (ResidentialBuilding,),
+    CombinationOfActions: (SLSCombination, ULSCombination),
+    CongregationArea: (AreaWithTables, AreasWithFixedSeats, AreasWithoutObstacle, LargeCrowdsAreas, PhysicalActivitiesAreas),
+    ConstructionWork: (Building, CivilEngineeringWork),
+    Deformation: (AngularDeformation, LinearDeformation, VolumetricDeformation),
+    DeformationEffect: (Deformation,),
+    DesignSituation: (AccidentalDesignSituation, PersistentDesignSituation, SeismicDesignSituation, TransientDesignSituation),
+    DynamicAction: (QuasiStaticAction,),
+    DynamicEffect: (AccelerationEffect, VibrationResponse),
+    EffectOfAction: (DeformationEffect, DynamicEffect, MechanicalEffect, Reaction, TimeDependentEffect),
+    EurocodeZone: (AccessibleRoofs, CongregationArea, HelicopterLandingAreas, IndustrialandStorage, LightVehicleTraffic, MediumVehicleTraffic, OfficeArea, Residential, Roof, ShoppingAreas),
+    GeometricalProperty: (Thickness,),
+    IndustrialandStorage: (IndustrialUse, StorageAreas),
+    InternalForce: (AxialForce, BendingMoment, ShearForce, TorsionalMoment),
+    LimitState: (ServiceabilityLimitState, UltimateLimitState),
+    LimitStateValue: (LimitingServicabilityCriterion, Resistance),
+    LinearDeformation: (Deflection, Displacement),
+    Material: (Concrete,),
+    MaterialProperty: (CompressiveStrength, Density),
+    MechanicalEffect: (InternalForce, Strain, Stress),
+    PermanentAction: (DeadLoad, SelfWeight),
+    Resistance: (BendingMomentResistance,),
+    SLSCombination: (CharacteristicCombination, FrequentCombination, QuasiPermanentCombination),
+    ShoppingAreas: (DepartmentStore, GeneralRetailShops),
+    Stress: (NormalStress, PrincipalStress, ShearStress),
+    TimeDependentEffect: (CreepEffect, FatigueEffect, ShrinkageEffect),
+    ULSCombination: (AccidentalCombination, FundamentalCombination, SeismicCombination),
+    VariableAction: (AccompanyingVariableAction, ImposedLoad, LeadingVariableAction, SnowLoad, ThermalAction, WindAction),
+    'https://w3id.org/bot#Element': (StructuralMember,),
+    'https://w3id.org/bot#Zone': (EurocodeZone,),
+    'https://w3id.org/bot#hasElement': (containsStructuralMember, hasStructuralMember, hasStructure),
+}
+
+# Classes of the individuals
+TYPES = {
+    AgriculturalStructure: (Structure,),
+    BridgeStructure: (Structure,),
+    BuildingStructure: (Structure,),
+    CivilEngineeringStructure: (Structure,),
+    EQU: (UltimateLimitState,),
+    Execution: (TransientDesignSituation,),
+    ExplosionDesignSituation: (AccidentalDesignSituation,),
+    FAT: (UltimateLimitState,),
+    FireDesignSituation: (AccidentalDesignSituation,),
+    GEO: (UltimateLimitState,),
+    HYD: (UltimateLimitState,),
+    ISLS: (ServiceabilityLimitState,),
+    ImpactDesignSituation: (AccidentalDesignSituation,),
+    LocalizedFailureDesignSituation: (AccidentalDesignSituation,),
+    MonumentalBuldingStructure: (Structure,),
+    RSLS: (ServiceabilityLimitState,),
+    Repair: (TransientDesignSituation,),
+    ReplacableStructuralElements: (Structure,),
+    STR: (UltimateLimitState,),
+    TemporaryStructure: (Structure,),
+    UPL: (UltimateLimitState,),
+}
+
+# Transitive superclasses and superproperties
+ANCESTORS = {
+    AccelerationEffect: frozenset(('http://purl.obolibrary.org/obo/BFO_0000140', 'http://qudt.org/3.1.2/schema/qudt/Quantity', DynamicEffect, EffectOfAction)),
+    AccessibleRoofs: frozenset(('http://purl.obolibrary.org/obo/BFO_0000040', EurocodeZone, 'https://w3id.org/bot#Zone')),
+    AccidentalAction: frozenset(('http://purl.obolibrary.org/obo/BFO_0000140', 'http://qudt.org/3.1.2/schema/qudt/Quantity', Action)),
+    AccidentalCombination: frozenset(('http://purl.obolibrary.org/obo/BFO_0000140', CombinationOfActions, ULSCombination)),
+    AccidentalDesignSituation: frozenset((DesignSituation,)),
+    AccompanyingVariableAction: frozenset(('http://purl.obolibrary.org/obo/BFO_0000140', 'http://qudt.org/3.1.2/schema/qudt/Quantity', Action, VariableAction)),
+    Action: frozenset(('http://purl.obolibrary.org/obo/BFO_0000140', 'http://qudt.org/3.1.2/schema/qudt/Quantity')),
+    AngularDeformation: frozenset(('http://purl.obolibrary.org/obo/BFO_0000140', 'http://qudt.org/3.1.2/schema/qudt/Quantity', Deformation, DeformationEffect, EffectOfAction)),
+    AreaWithTables: frozenset(('http://purl.obolibrary.org/obo/BFO_0000040', CongregationArea, EurocodeZone, 'https://w3id.org/bot#Zone')),
+    AreasWithFixedSeats: frozenset(('http://purl.obolibrary.org/obo/BFO_0000040', CongregationArea, EurocodeZone, 'https://w3id.org/bot#Zone')),
+    AreasWithoutObstacle: frozenset(('http://purl.obolibrary.org/obo/BFO_0000040', CongregationArea, EurocodeZone, 'https://w3id.org/bot#Zone')),
+    AxialForce: frozenset(('http://purl.obolibrary.org/obo/BFO_0000140', 'http://qudt.org/3.1.2/schema/qudt/Quantity', EffectOfAction, InternalForce, MechanicalEffect)),
+    BendingMoment: frozenset(('http://purl.obolibrary.org/obo/BFO_0000140', 'http://qudt.org/3.1.2/schema/qudt/Quantity', EffectOfAction, InternalForce, MechanicalEffect)),
+    BendingMomentResistance: frozenset(('http://qudt.org/3.1.2/schema/qudt/Quantity', LimitStateValue, Resistance)),
+    Building: frozenset(('http://purl.obolibrary.org/obo/BFO_0000040', ConstructionWork)),
+    CharacteristicCombination: frozenset(('http://purl.obolibrary.org/obo/BFO_0000140', CombinationOfActions, SLSCombination)),
+    CharacteristicValue: frozenset(('http://qudt.org/3.1.2/schema/qudt/QuantityValue',)),
+    CivilEngineeringWork: frozenset(('http://purl.obolibrary.org/obo/BFO_0000040', ConstructionWork)),
+    CombinationOfActions: frozenset(('http://purl.obolibrary.org/obo/BFO_0000140',)),
+    CompressiveStrength: frozenset(('http://purl.obolibrary.org/obo/BFO_0000019', 'http://qudt.org/3.1.2/schema/qudt/Quantity', MaterialProperty)),
+    Concrete: frozenset((Material,)),
+    CongregationArea: frozenset(('http://purl.obolibrary.org/obo/BFO_0000040', EurocodeZone, 'https://w3id.org/bot#Zone')),
+    ConstructionWork: frozenset(('http://purl.obolibrary.org/obo/BFO_0000040',)),
+    CreepEffect: frozenset(('http://purl.obolibrary.org/obo/BFO_0000140', 'http://qudt.org/3.1.2/schema/qudt/Quantity', EffectOfAction, TimeDependentEffect)),
+    DeadLoad: frozenset(('http://purl.obolibrary.org/obo/BFO_0000140', 'http://qudt.org/3.1.2/schema/qudt/Quantity', Action, PermanentAction)),
+    Deflection: frozenset(('http://purl.obolibrary.org/obo/BFO_0000140', 'http://qudt.org/3.1.2/schema/qudt/Quantity', Deformation, DeformationEffect, EffectOfAction, LinearDeformation)),
+    Deformation: frozenset(('http://purl.obolibrary.org/obo/BFO_0000140', 'http://qudt.org/3.1.2/schema/qudt/Quantity', DeformationEffect, EffectOfAction)),
+    DeformationEffect: frozenset(('http://purl.obolibrary.org/obo/BFO_0000140', 'http://qudt.org/3.1.2/schema/qudt/Quantity', EffectOfAction)),
+    Density: frozenset(('http://purl.obolibrary.org/obo/BFO_0000019', 'http://qudt.org/3.1.2/schema/qudt/Quantity', MaterialProperty)),
+    DepartmentStore: frozenset(('http://purl.obolibrary.org/obo/BFO_0000040', EurocodeZone, ShoppingAreas, 'https://w3id.org/bot#Zone')),
+    DesignAction: frozenset(('http://purl.obolibrary.org/obo/BFO_0000140', 'http://qudt.org/3.1.2/schema/qudt/Quantity', Action)),
+    DesignValue: frozenset(('http://qudt.org/3.1.2/schema/qudt/QuantityValue',)),
+    DirectAction: frozenset(('http://purl.obolibrary.org/obo/BFO_0000140', 'http://qudt.org/3.1.2/schema/qudt/Quantity', Action)),
+    Displacement: frozenset(('http://purl.obolibrary.org/obo/BFO_0000140', 'http://qudt.org/3.1.2/schema/qudt/Quantity', Deformation, DeformationEffect, EffectOfAction, LinearDeformation)),
+    DynamicAction: frozenset(('http://purl.obolibrary.org/obo/BFO_0000140', 'http://qudt.org/3.1.2/schema/qudt/Quantity', Action)),
+    DynamicEffect: frozenset(('http://purl.obolibrary.org/obo/BFO_0000140', 'http://qudt.org/3.1.2/schema/qudt/Quantity', EffectOfAction)),
+    EffectOfAction: frozenset(('http://purl.obolibrary.org/obo/BFO_0000140', 'http://qudt.org/3.1.2/schema/qudt/Quantity')),
+    EurocodeZone: frozenset(('http://purl.obolibrary.org/obo/BFO_0000040', 'https://w3id.org/bot#Zone')),
+    FatigueAction: frozenset(('http://purl.obolibrary.org/obo/BFO_0000140', 'http://qudt.org/3.1.2/schema/qudt/Quantity', Action)),
+    FatigueEffect: frozenset(('http://purl.obolibrary.org/obo/BFO_0000140', 'http://qudt.org/3.1.2/schema/qudt/Quantity', EffectOfAction, TimeDependentEffect)),
+    FavourableAction: frozenset(('http://purl.obolibrary.org/obo/BFO_0000140', 'http://qudt.org/3.1.2/schema/qudt/Quantity', Action)),
+    FixedAction: frozenset(('http://purl.obolibrary.org/obo/BFO_0000140', 'http://qudt.org/3.1.2/schema/qudt/Quantity', Action)),
+    FreeAction: frozenset(('http://purl.obolibrary.org/obo/BFO_0000140', 'http://qudt.org/3.1.2/schema/qudt/Quantity', Action)),
+    FrequentCombination: frozenset(('http://purl.obolibrary.org/obo/BFO_0000140', CombinationOfActions, SLSCombination)),
+    FundamentalCombination: frozenset(('http://purl.obolibrary.org/obo/BFO_0000140', CombinationOfActions, ULSCombination)),
+    GeneralRetailShops: frozenset(('http://purl.obolibrary.org/obo/BFO_0000040', EurocodeZone, ShoppingAreas, 'https://w3id.org/bot#Zone')),
+    GeometricalProperty: frozenset(('http://purl.obolibrary.org/obo/BFO_0000019', 'http://qudt.org/3.1.2/schema/qudt/Quantity')),
+    GeotechnicalAction: frozenset(('http://purl.obolibrary.org/obo/BFO_0000140', 'http://qudt.org/3.1.2/schema/qudt/Quantity', Action)),
+    HelicopterLandingAreas: frozenset(('http://purl.obolibrary.org/obo/BFO_0000040', EurocodeZone, 'https://w3id.org/bot#Zone')),
+    ImposedLoad: frozenset(('http://purl.obolibrary.org/obo/BFO_0000140', 'http://qudt.org/3.1.2/schema/qudt/Quantity', Action, VariableAction)),
+    IndirectAction: frozenset(('http://purl.obolibrary.org/obo/BFO_0000140', 'http://qudt.org/3.1.2/schema/qudt/Quantity', Action)),
+    IndustrialUse: frozenset(('http://purl.obolibrary.org/obo/BFO_0000040', EurocodeZone, IndustrialandStorage, 'https://w3id.org/bot#Zone')),
+    IndustrialandStorage: frozenset(('http://purl.obolibrary.org/obo/BFO_0000040', EurocodeZone, 'https://w3id.org/bot#Zone')),
+    InternalForce: frozenset(('http://purl.obolibrary.org/obo/BFO_0000140', 'http://qudt.org/3.1.2/schema/qudt/Quantity', EffectOfAction, MechanicalEffect)),
+    LargeCrowdsAreas: frozenset(('http://purl.obolibrary.org/obo/BFO_0000040', CongregationArea, EurocodeZone, 'https://w3id.org/bot#Zone')),
+    LeadingVariableAction: frozenset(('http://purl.obolibrary.org/obo/BFO_0000140', 'http://qudt.org/3.1.2/schema/qudt/Quantity', Action, VariableAction)),
+    LightVehicleTraffic: frozenset(('http://purl.obolibrary.org/obo/BFO_0000040', EurocodeZone, 'https://w3id.org/bot#Zone')),
+    LimitStateValue: frozenset(('http://qudt.org/3.1.2/schema/qudt/Quantity',)),
+    LimitingServicabilityCriterion: frozenset(('http://qudt.org/3.1.2/schema/qudt/Quantity', LimitStateValue)),
+    LinearDeformation: frozenset(('http://purl.obolibrary.org/obo/BFO_0000140', 'http://qudt.org/3.1.2/schema/qudt/Quantity', Deformation, DeformationEffect, EffectOfAction)),
+    LowerBoundValue: frozenset(('http://qudt.org/3.1.2/schema/qudt/QuantityValue',)),
+    MaterialProperty: frozenset(('http://purl.obolibrary.org/obo/BFO_0000019', 'http://qudt.org/3.1.2/schema/qudt/Quantity')),
+    MeanValue: frozenset(('http://qudt.org/3.1.2/schema/qudt/QuantityValue',)),
+    MechanicalEffect: frozenset(('http://purl.obolibrary.org/obo/BFO_0000140', 'http://qudt.org/3.1.2/schema/qudt/Quantity', EffectOfAction)),
+    MediumVehicleTraffic: frozenset(('http://purl.obolibrary.org/obo/BFO_0000040', EurocodeZone, 'https://w3id.org/bot#Zone')),
+    NominalValue: frozenset(('http://qudt.org/3.1.2/schema/qudt/QuantityValue',)),
+    NormalStress: frozenset(('http://purl.obolibrary.org/obo/BFO_0000140', 'http://qudt.org/3.1.2/schema/qudt/Quantity', EffectOfAction, MechanicalEffect, Stress)),
+    OfficeArea: frozenset(('http://purl.obolibrary.org/obo/BFO_0000040', EurocodeZone, 'https://w3id.org/bot#Zone')),
+    PermanentAction: frozenset(('http://purl.obolibrary.org/obo/BFO_0000140', 'http://qudt.org/3.1.2/schema/qudt/Quantity', Action)),
+    PersistentDesignSituation: frozenset((DesignSituation,)),
+    PhysicalActivitiesAreas: frozenset(('http://purl.obolibrary.org/obo/BFO_0000040', CongregationArea, EurocodeZone, 'https://w3id.org/bot#Zone')),
+    PrincipalStress: frozenset(('http://purl.obolibrary.org/obo/BFO_0000140', 'http://qudt.org/3.1.2/schema/qudt/Quantity', EffectOfAction, MechanicalEffect, Stress)),
+    QuasiPermanentCombination: frozenset(('http://purl.obolibrary.org/obo/BFO_0000140', CombinationOfActions, SLSCombination)),
+    QuasiStaticAction: frozenset(('http://purl.obolibrary.org/obo/BFO_0000140', 'http://qudt.org/3.1.2/schema/qudt/Quantity', Action, DynamicAction)),
+    Reaction: frozenset(('http://purl.obolibrary.org/obo/BFO_0000140', 'http://qudt.org/3.1.2/schema/qudt/Quantity', EffectOfAction)),
+    RepresentativeAction: frozenset(('http://purl.obolibrary.org/obo/BFO_0000140', 'http://qudt.org/3.1.2/schema/qudt/Quantity', Action)),
+    RepresentativeValue: frozenset(('http://qudt.org/3.1.2/schema/qudt/QuantityValue',)),
+    Residential: frozenset(('http://purl.obolibrary.org/obo/BFO_0000040', EurocodeZone, 'https://w3id.org/bot#Zone')),
+    ResidentialBuilding: frozenset(('http://purl.obolibrary.org/obo/BFO_0000040', Building, ConstructionWork)),
+    Resistance: frozenset(('http://qudt.org/3.1.2/schema/qudt/Quantity', LimitStateValue)),
+    Roof: frozenset(('http://purl.obolibrary.org/obo/BFO_0000040', EurocodeZone, 'https://w3id.org/bot#Zone')),
+    Rotation: frozenset(('http://purl.obolibrary.org/obo/BFO_0000140', 'http://qudt.org/3.1.2/schema/qudt/Quantity', AngularDeformation, Deformation, DeformationEffect, EffectOfAction)),
+    SLSCombination: frozenset(('http://purl.obolibrary.org/obo/BFO_0000140', CombinationOfActions)),
+    SeismicAction: frozenset(('http://purl.obolibrary.org/obo/BFO_0000140', 'http://qudt.org/3.1.2/schema/qudt/Quantity', AccidentalAction, Action)),
+    SeismicCombination: frozenset(('http://purl.obolibrary.org/obo/BFO_0000140', CombinationOfActions, ULSCombination)),
+    SeismicDesignSituation: frozenset((DesignSituation,)),
+    SelfWeight: frozenset(('http://purl.obolibrary.org/obo/BFO_0000140', 'http://qudt.org/3.1.2/schema/qudt/Quantity', Action, PermanentAction)),
+    ServiceabilityLimitState: frozenset((LimitState,)),
+    ShearForce: frozenset(('http://purl.obolibrary.org/obo/BFO_0000140', 'http://qudt.org/3.1.2/schema/qudt/Quantity', EffectOfAction, InternalForce, MechanicalEffect)),
+    ShearStress: frozenset(('http://purl.obolibrary.org/obo/BFO_0000140', 'http://qudt.org/3.1.2/schema/qudt/Quantity', EffectOfAction, MechanicalEffect, Stress)),
+    ShoppingAreas: frozenset(('http://purl.obolibrary.org/obo/BFO_0000040', EurocodeZone, 'https://w3id.org/bot#Zone')),
+    ShrinkageEffect: frozenset(('http://purl.obolibrary.org/obo/BFO_0000140', 'http://qudt.org/3.1.2/schema/qudt/Quantity', EffectOfAction, TimeDependentEffect)),
+    SnowLoad: frozenset(('http://purl.obolibrary.org/obo/BFO_0000140', 'http://qudt.org/3.1.2/schema/qudt/Quantity', Action, VariableAction)),
+    StaticAction: frozenset(('http://purl.obolibrary.org/obo/BFO_0000140', 'http://qudt.org/3.1.2/schema/qudt/Quantity', Action)),
+    StorageAreas: frozenset(('http://purl.obolibrary.org/obo/BFO_0000040', EurocodeZone, IndustrialandStorage, 'https://w3id.org/bot#Zone')),
+    Strain: frozenset(('http://purl.obolibrary.org/obo/BFO_0000140', 'http://qudt.org/3.1.2/schema/qudt/Quantity', EffectOfAction, MechanicalEffect)),
+    Stress: frozenset(('http://purl.obolibrary.org/obo/BFO_0000140', 'http://qudt.org/3.1.2/schema/qudt/Quantity', EffectOfAction, MechanicalEffect)),
+    StructuralMember: frozenset(('http://purl.obolibrary.org/obo/BFO_0000040', 'https://w3id.org/bot#Element')),
+    StructuralSystem: frozenset(('http://purl.obolibrary.org/obo/BFO_0000040',)),
+    Structure: frozenset(('http://purl.obolibrary.org/obo/BFO_0000040',)),
+    ThermalAction: frozenset(('http://purl.obolibrary.org/obo/BFO_0000140', 'http://qudt.org/3.1.2/schema/qudt/Quantity', Action, VariableAction)),
+    Thickness: frozenset(('http://purl.obolibrary.org/obo/BFO_0000019', 'http://qudt.org/3.1.2/schema/qudt/Quantity', GeometricalProperty)),
+    TimeDependentEffect: frozenset(('http://purl.obolibrary.org/obo/BFO_0000140', 'http://qudt.org/3.1.2/schema/qudt/Quantity', EffectOfAction)),
+    TorsionalMoment: frozenset(('http://purl.obolibrary.org/obo/BFO_0000140', 'http://qudt.org/3.1.2/schema/qudt/Quantity', EffectOfAction, InternalForce, MechanicalEffect)),
+    TransientDesignSituation: frozenset((DesignSituation,)),
+    Twist: frozenset(('http://purl.obolibrary.org/obo/BFO_0000140', 'http://qudt.org/3.1.2/schema/qudt/Quantity', AngularDeformation, Deformation, DeformationEffect, EffectOfAction)),
+    ULSCombination: frozenset(('http://purl.obolibrary.org/obo/BFO_0000140', CombinationOfActions)),
+    UltimateLimitState: frozenset((LimitState,)),
+    UnfavourableAction: frozenset(('http://purl.obolibrary.org/obo/BFO_0000140', 'http://qudt.org/3.1.2/schema/qudt/Quantity', Action)),
+    UpperBoundValue: frozenset(('http://qudt.org/3.1.2/schema/qudt/QuantityValue',)),
+    VariableAction: frozenset(('http://purl.obolibrary.org/obo/BFO_0000140', 'http://qudt.org/3.1.2/schema/qudt/Quantity', Action)),
+    VibrationResponse: frozenset(('http://purl.obolibrary.org/obo/BFO_0000140', 'http://qudt.org/3.1.2/schema/qudt/Quantity', DynamicEffect, EffectOfAction)),
+    VolumetricDeformation: frozenset(('http://purl.obolibrary.org/obo/BFO_0000140', 'http://qudt.org/3.1.2/schema/qudt/Quantity', Deformation, DeformationEffect, EffectOfAction)),
+    WindAction: frozenset(('http://purl.obolibrary.org/obo/BFO_0000140', 'http://qudt.org/3.1.2/schema/qudt/Quantity', Action, VariableAction)),
+    containsStructuralMember: frozenset(('https://w3id.org/bot#hasElement',)),
+    hasCharacteristicValue: frozenset(('http://qudt.org/3.1.2/schema/qudt/quantityValue',)),
+    hasDesignValue: frozenset(('http://qudt.org/3.1.2/schema/qudt/quantityValue',)),
+    hasLowerBoundValue: frozenset(('http://qudt.org/3.1.2/schema/qudt/quantityValue',)),
+    hasMeanValue: frozenset(('http://qudt.org/3.1.2/schema/qudt/quantityValue',)),
+    hasNominalValue: frozenset(('http://qudt.org/3.1.2/schema/qudt/quantityValue',)),
+    hasRepresentativeValue: frozenset(('http://qudt.org/3.1.2/schema/qudt/quantityValue',)),
+    hasStructuralMember: frozenset(('https://w3id.org/bot#hasElement',)),
+    hasStructure: frozenset(('https://w3id.org/bot#hasElement',)),
+    hasUpperBoundValue: frozenset(('http://qudt.org/3.1.2/schema/qudt/quantityValue',)),
+}
+
+
+def is_subclass_of(cls, parent):
+    """ True if cls is parent or one of its (transitive) subclasses """
+    return cls == parent or parent in ANCESTORS.get(cls, ())
+
+
+def is_instance_of(individual, cls):
+    """ True if one of the types of individual is cls or a subclass of it """
+    return any(is_subclass_of(t, cls) for t in TYPES.get(individual, ()))
@@ -1,7 +1,10 @@
 from core.config import os
-from utils.converters import convert_ttl_to_owl, convert_owl_to_ttl
+from utils.converters import convert_owl_to_ttl
+from utils.quadstore_loader import load_ontology
 from owlready2 import *
 from utils.comparisons import compare_graphs
+from fast_reason import sync_reasoner_fast, InconsistentOntologyError
+from utils.consistency import find_violations, print_violations
 
 # ✅ 1️⃣ Ensure Temp Directory is Set for Owlready2
 TEMP_DIR = "temp"
@@ -9,43 +12,42 @@ os.makedirs(TEMP_DIR, exist_ok=True)  # Create if it doesn't exist
 os.environ["OWLREADY2_TMPDIR"] = TEMP_DIR  # Set for Owlready2
 
 
-# ✅ 2️⃣ Convert Ontology and Test Data
-convert_ttl_to_owl("resources/Ontologies/ConProp_v01.ttl", 
-                   "output/ConProp_v01.owl")
+# ✅ 2️⃣ Load Ontology, Test Data and Rules straight from Turtle (no RDF/XML copies under output/)
+ontology_path = "resources/Ontologies/ConProp_v01.ttl"
+test_data_path = "resources/Graph_data/test-data.ttl"
+rules_path = "resources/Rules/ConProp_SWRLrules.ttl"
 
-convert_ttl_to_owl("resources/Graph_data/test-data.ttl", 
-                   "output/test-data.owl")
+onto = load_ontology(ontology_path)
+test_data = load_ontology(test_data_path)
+rules = load_ontology(rules_path)
 
-convert_ttl_to_owl("resources/Rules/ConProp_SWRLrules.ttl", 
-                   "output/test-rules.owl")
+# For large projects, keep the parsed ontologies in an on-disk world reused across runs:
+# from utils.persistent_world import open_world, save_world
+# world = open_world()  # re-imports only the TTL modules whose hash changed
 
-
-# # ✅ 3️⃣ Load Ontologies with Full Path
-ontology_path = "output/ConProp_v01.owl"
-test_data_path = "output/test-data.owl"
-rules_path = "output/test-rules.owl"
-
-onto = get_ontology(ontology_path).load()
-test_data = get_ontology(test_data_path).load()
-rules = get_ontology(rules_path).load()
-
-# ✅ 4️⃣ Remove any broken imports to avoid missing ontology errors
+# ✅ 3️⃣ Remove any broken imports to avoid missing ontology errors
 onto.imported_ontologies = [o for o in onto.imported_ontologies if o.base_iri.startswith("file://")]
 
-# ✅ 5️⃣ Merge test data and rules into the main ontology
+# ✅ 4️⃣ Merge test data and rules into the main ontology
 #onto.imported_ontologies.append(test_data)
 #onto.imported_ontologies.append(rules)
 
-# ✅ 6️⃣ Run Pellet Reasoner (without ignore_imports)
+# ✅ 5️⃣ Run the in-process OWL RL reasoner (no JVM round-trip); it checks disjointness on the closure
 try:
-    sync_reasoner_pellet(infer_property_values=True)  # Removed "ignore_imports"
-    print("✅ Pellet Reasoning Completed Successfully!")
-except OwlReadyInconsistentOntologyError:
-    print("❌ Ontology is inconsistent! Running Pellet explain...\n")
+    sync_reasoner_fast(default_world)
+    print("✅ Reasoning Completed Successfully!")
+except InconsistentOntologyError as error:
+    print("❌ Ontology is inconsistent!\n")
 
-    # Debug inconsistent classes
-    for cls in list(default_world.inconsistent_classes()):
-        print(f"Inconsistent Class: {cls}")
+    # Debug disjointness violations
+    for individual, cls, other in error.violations:
+        print(f"Inconsistent Individual: {individual} is both {cls} and {other}")
+
+# Pellet is still available for the full OWL DL profile. It does not check disjointness up
+# front, so run utils.consistency.find_violations first: it is much cheaper than
+# default_world.inconsistent_classes() after a failed Pellet run:
+# print_violations(find_violations(default_world))
+# sync_reasoner_pellet(infer_property_values=True)
 
 # # 🟢 Save the updated ontology with inferred knowledge
 # reasoned_ontology_path = "output/reasoned_ontology.owl"  # Save as OWL file
@@ -59,3 +61,8 @@ except OwlReadyInconsistentOntologyError:
 # convert_owl_to_ttl("output/reasoned_ontology.owl", "output/reasoned_ontology.ttl")
 
 
+
+# # Binary snapshot next to the RDF output: worker processes mmap it and share one copy
+# from utils.snapshot import write_snapshot, open_snapshot
+# write_snapshot("output/reasoned_ontology.ttl", "output/reasoned_ontology.snap")
+# reasoned = open_snapshot("output/reasoned_ontology.snap")  # read-only Graph, SPARQL works on it
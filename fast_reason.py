@@ -0,0 +1,515 @@
+from collections import defaultdict
+from rdflib import Graph, Literal
+from rdflib.namespace import RDF, RDFS, OWL
+from utils.rdf_terms import read_list
+
+
+class InconsistentOntologyError(Exception):
+    """ Raised when an individual is typed with two classes declared disjoint """
+
+    def __init__(self, violations):
+        self.violations = violations
+        super().__init__(f"{len(violations)} disjointness violation(s) found")
+
+
+def _closure(edges):
+    """
+    Compute the reflexive-transitive closure of a directed graph.
+
+    :param edges: dict mapping a node to the set of its direct successors
+    :return: dict mapping every node to the set of nodes reachable from it (itself included)
+    """
+    closure = {}
+    nodes = set(edges)
+    for targets in edges.values():
+        nodes.update(targets)
+
+    for start in nodes:
+        seen = {start}
+        stack = [start]
+        while stack:
+            node = stack.pop()
+            for nxt in edges.get(node, ()):
+                if nxt not in seen:
+                    seen.add(nxt)
+                    stack.append(nxt)
+        closure[start] = seen
+    return closure
+
+
+class _Schema:
+    """ Pre-computed TBox closures used by the instance-level rules """
+
+    def __init__(self, graph):
+        sub_class = defaultdict(set)
+        sub_prop = defaultdict(set)
+        self.domains = defaultdict(set)
+        self.ranges = defaultdict(set)
+        self.inverses = defaultdict(set)
+        self.symmetric = set(graph.subjects(RDF.type, OWL.SymmetricProperty))
+        self.transitive = set(graph.subjects(RDF.type, OWL.TransitiveProperty))
+        self.functional = set(graph.subjects(RDF.type, OWL.FunctionalProperty))
+        self.inverse_functional = set(graph.subjects(RDF.type, OWL.InverseFunctionalProperty))
+        self.disjoint = defaultdict(set)
+        self.chains = []
+
+        for c, d in graph.subject_objects(RDFS.subClassOf):
+            sub_class[c].add(d)
+        for c, d in graph.subject_objects(OWL.equivalentClass):
+            sub_class[c].add(d)
+            sub_class[d].add(c)
+        for p, q in graph.subject_objects(RDFS.subPropertyOf):
+            sub_prop[p].add(q)
+        for p, q in graph.subject_objects(OWL.equivalentProperty):
+            sub_prop[p].add(q)
+            sub_prop[q].add(p)
+        for p, q in graph.subject_objects(OWL.inverseOf):
+            self.inverses[p].add(q)
+            self.inverses[q].add(p)
+        for c, d in graph.subject_objects(OWL.disjointWith):
+            self.disjoint[c].add(d)
+            self.disjoint[d].add(c)
+        for node in graph.subjects(RDF.type, OWL.AllDisjointClasses):
+            for members in graph.objects(node, OWL.members):
+                classes = read_list(graph, members)
+                for c in classes:
+                    self.disjoint[c].update(d for d in classes if d != c)
+        for p, head in graph.subject_objects(OWL.propertyChainAxiom):
+            chain = read_list(graph, head)
+            if len(chain) >= 2:
+                self.chains.append((chain, p))
+
+        # Bare named classes and properties belong to their own closure as well
+        for c in graph.subjects(RDF.type, OWL.Class):
+            sub_class.setdefault(c, set())
+        for kind in (OWL.ObjectProperty, OWL.DatatypeProperty, RDF.Property):
+            for p in graph.subjects(RDF.type, kind):
+                sub_prop.setdefault(p, set())
+
+        self.super_classes = _closure(sub_class)
+        self.super_props = _closure(sub_prop)
+
+        # Domains and ranges of a super-property also hold for its sub-properties
+        domains = defaultdict(set)
+        ranges = defaultdict(set)
+        for p, c in graph.subject_objects(RDFS.domain):
+            domains[p].add(c)
+        for p, c in graph.subject_objects(RDFS.range):
+            ranges[p].add(c)
+        for p, supers in self.super_props.items():
+            for q in supers:
+                for c in domains.get(q, ()):
+                    self.domains[p].update(self.classes_of(c))
+                for c in ranges.get(q, ()):
+                    self.ranges[p].update(self.classes_of(c))
+        for p in set(domains) - set(self.super_props):
+            for c in domains[p]:
+                self.domains[p].update(self.classes_of(c))
+        for p in set(ranges) - set(self.super_props):
+            for c in ranges[p]:
+                self.ranges[p].update(self.classes_of(c))
+
+        # Map each property to the chains it takes part in, with its position
+        self.chain_links = defaultdict(list)
+        for index, (chain, _) in enumerate(self.chains):
+            for position, link in enumerate(chain):
+                self.chain_links[link].append((index, position))
+
+    def classes_of(self, c):
+        return self.super_classes.get(c, {c})
+
+    def properties_of(self, p):
+        return self.super_props.get(p, {p})
+
+
+class _Materializer:
+    """
+    Worklist-driven forward chainer; every triple is joined exactly once.
+
+    With track_support, every derivation found is recorded as the tuple of triples it used,
+    so conclusions can be retracted with DRed (see IncrementalReasoner).
+    """
+
+    def __init__(self, schema, track_support=False):
+        self.schema = schema
+        self.triples = set()
+        self.by_subject = defaultdict(set)
+        self.by_object = defaultdict(set)
+        self.agenda = []
+        self.supports = defaultdict(set) if track_support else None
+        self.consequents = defaultdict(set) if track_support else None
+        # Triples entering the closure, in order (only kept when tracking support)
+        self.journal = [] if track_support else None
+
+    def add(self, s, p, o, premises=()):
+        if isinstance(s, Literal):
+            return
+        triple = (s, p, o)
+        if self.supports is not None and premises and triple not in premises:
+            self.supports[triple].add(premises)
+            for premise in premises:
+                self.consequents[premise].add(triple)
+        if triple in self.triples:
+            return
+        self.triples.add(triple)
+        self.by_subject[s].add((p, o))
+        self.by_object[o].add((s, p))
+        self.agenda.append(triple)
+        if self.journal is not None:
+            self.journal.append(triple)
+
+    def discard(self, triple):
+        """ Remove a triple from the indexes (its recorded supports are kept) """
+        s, p, o = triple
+        self.triples.discard(triple)
+        self.by_subject[s].discard((p, o))
+        self.by_object[o].discard((s, p))
+
+    def forget(self, triple):
+        """ Drop the supports recorded for and through a triple that no longer holds """
+        for premises in self.supports.pop(triple, ()):
+            for premise in premises:
+                consequents = self.consequents.get(premise)
+                if consequents:
+                    consequents.discard(triple)
+        for conclusion in self.consequents.pop(triple, ()):
+            supports = self.supports.get(conclusion)
+            if supports:
+                supports.difference_update([premises for premises in supports if triple in premises])
+
+    def run(self):
+        while self.agenda:
+            triple = self.agenda.pop()
+            # A triple retracted while waiting on the agenda must not fire
+            if triple in self.triples:
+                self._fire(*triple)
+
+    def _fire(self, s, p, o):
+        schema = self.schema
+        trigger = (s, p, o)
+
+        if p == OWL.sameAs:
+            self._same_as(s, o)
+            return
+
+        if p == RDF.type:
+            # cax-sco, cax-eqc1/2
+            for c in schema.classes_of(o):
+                self.add(s, RDF.type, c, (trigger,))
+        else:
+            self._fire_property(s, p, o)
+
+        # eq-rep-s/o: propagate the new statement to every known alias
+        for r, alias in list(self.by_subject[s]):
+            if r == OWL.sameAs:
+                self.add(alias, p, o, (trigger, (s, OWL.sameAs, alias)))
+        if p != RDF.type and not isinstance(o, Literal):
+            for r, alias in list(self.by_subject[o]):
+                if r == OWL.sameAs:
+                    self.add(s, p, alias, (trigger, (o, OWL.sameAs, alias)))
+
+    def _fire_property(self, s, p, o):
+        schema = self.schema
+        trigger = (s, p, o)
+        for q in schema.properties_of(p):
+            # prp-spo1, prp-eqp1/2
+            self.add(s, q, o, (trigger,))
+            # prp-dom
+            for c in schema.domains.get(q, ()):
+                self.add(s, RDF.type, c, (trigger,))
+            if isinstance(o, Literal):
+                continue
+            # prp-rng
+            for c in schema.ranges.get(q, ()):
+                self.add(o, RDF.type, c, (trigger,))
+            # prp-inv1/2
+            for inv in schema.inverses.get(q, ()):
+                self.add(o, inv, s, (trigger,))
+            # prp-symp
+            if q in schema.symmetric:
+                self.add(o, q, s, (trigger,))
+            # prp-trp
+            if q in schema.transitive:
+                for x, r in list(self.by_object[s]):
+                    if r == q:
+                        self.add(x, q, o, ((x, q, s), trigger))
+                for r, y in list(self.by_subject[o]):
+                    if r == q:
+                        self.add(s, q, y, (trigger, (o, q, y)))
+            # prp-fp, prp-ifp
+            if q in schema.functional:
+                for r, y in list(self.by_subject[s]):
+                    if r == q and y != o and not isinstance(y, Literal):
+                        self.add(o, OWL.sameAs, y, (trigger, (s, q, y)))
+            if q in schema.inverse_functional:
+                for x, r in list(self.by_object[o]):
+                    if r == q and x != s:
+                        self.add(s, OWL.sameAs, x, (trigger, (x, q, o)))
+            # prp-spo2
+            for index, position in schema.chain_links.get(q, ()):
+                self._extend_chain(index, position, s, o, trigger)
+
+    def _same_as(self, a, b):
+        trigger = (a, OWL.sameAs, b)
+        # eq-sym, eq-trans
+        self.add(b, OWL.sameAs, a, (trigger,))
+        for r, c in list(self.by_subject[b]):
+            if r == OWL.sameAs and c != a:
+                self.add(a, OWL.sameAs, c, (trigger, (b, OWL.sameAs, c)))
+        # eq-rep-s, eq-rep-o
+        for r, o in list(self.by_subject[a]):
+            if r != OWL.sameAs:
+                self.add(b, r, o, (trigger, (a, r, o)))
+        for s, r in list(self.by_object[a]):
+            if r != OWL.sameAs:
+                self.add(s, r, b, (trigger, (s, r, a)))
+
+    def _walk(self, node, links, forward):
+        """
+        Follow a sequence of properties from node, forwards or backwards.
+
+        :return: list of (reached node, triples of the path leading to it)
+        """
+        frontier = [(node, ())]
+        for link in links:
+            step = []
+            for n, path in frontier:
+                if forward:
+                    step.extend((y, path + ((n, link, y),)) for r, y in self.by_subject[n] if r == link)
+                else:
+                    step.extend((x, ((x, link, n),) + path) for x, r in self.by_object[n] if r == link)
+            frontier = step
+            if not frontier:
+                break
+        return frontier
+
+    def _extend_chain(self, index, position, s, o, trigger):
+        chain, target = self.schema.chains[index]
+        starts = self._walk(s, reversed(chain[:position]), forward=False)
+        ends = self._walk(o, chain[position + 1:], forward=True)
+        for x, head in starts:
+            for y, tail in ends:
+                self.add(x, target, y, head + (trigger,) + tail)
+
+
+def as_graph(source):
+    """ Accept an rdflib Graph or an owlready2 World/Ontology and return an rdflib Graph view """
+    if isinstance(source, Graph):
+        return source
+    if hasattr(source, "as_rdflib_graph"):
+        return source.as_rdflib_graph()
+    if hasattr(source, "world"):
+        return source.world.as_rdflib_graph()
+    raise TypeError(f"Cannot reason over {type(source).__name__}; expected an rdflib Graph or owlready2 World")
+
+
+def _violations(schema, triples, candidates):
+    """
+    Disjointness violations involving the rdf:type statements of candidates, each unordered
+    pair of classes reported once as (individual, class, class) with the classes in string order.
+    Every partner of a candidate type is checked, so candidates may be any subset of triples.
+    """
+    violations = []
+    seen = set()
+    for s, p, c in candidates:
+        if p != RDF.type:
+            continue
+        for d in schema.disjoint.get(c, ()):
+            if (s, RDF.type, d) in triples and frozenset((s, c, d)) not in seen:
+                seen.add(frozenset((s, c, d)))
+                violations.append((s,) + tuple(sorted((c, d), key=str)))
+    return violations
+
+
+def _is_trivial(triple):
+    """ Statements every reasoner leaves implicit """
+    s, p, o = triple
+    return (p == OWL.sameAs and s == o) or (p == RDF.type and o == OWL.Thing)
+
+
+def infer_triples(source, check_consistency=True):
+    """
+    Compute the RDFS / OWL RL closure of a graph without a JVM round-trip.
+
+    Supports subClassOf, equivalentClass, subPropertyOf, equivalentProperty, domain/range,
+    inverseOf, symmetric/transitive/functional properties, sameAs, disjointWith
+    (and AllDisjointClasses) and property chains.
+
+    :param source: rdflib Graph or owlready2 World/Ontology to reason over
+    :param check_consistency: raise InconsistentOntologyError on disjointness violations
+    :return: set of inferred triples that are not asserted in the source
+    """
+    graph = as_graph(source)
+    schema = _Schema(graph)
+    engine = _Materializer(schema)
+
+    asserted = set()
+    for triple in graph.triples((None, None, None)):
+        asserted.add(triple)
+        engine.add(*triple)
+    engine.run()
+
+    if check_consistency:
+        violations = _violations(schema, engine.triples, engine.triples)
+        if violations:
+            raise InconsistentOntologyError(sorted(violations))
+
+    inferred = engine.triples - asserted
+    return {t for t in inferred if not _is_trivial(t)}
+
+
+# Statements that change the schema closures rather than the instance data
+_SCHEMA_PREDICATES = {
+    RDFS.subClassOf, OWL.equivalentClass, RDFS.subPropertyOf, OWL.equivalentProperty,
+    RDFS.domain, RDFS.range, OWL.inverseOf, OWL.disjointWith, OWL.members,
+    OWL.propertyChainAxiom, RDF.first, RDF.rest,
+}
+_SCHEMA_TYPES = {
+    OWL.Class, OWL.ObjectProperty, OWL.DatatypeProperty, RDF.Property, OWL.SymmetricProperty,
+    OWL.TransitiveProperty, OWL.FunctionalProperty, OWL.InverseFunctionalProperty,
+    OWL.AllDisjointClasses,
+}
+
+
+def _is_schema(triple):
+    _, p, o = triple
+    return p in _SCHEMA_PREDICATES or (p == RDF.type and o in _SCHEMA_TYPES)
+
+
+class IncrementalReasoner:
+    """
+    Keeps the closure of a graph materialized and updates it from triple deltas.
+
+    Additions are propagated from the new triples only. Removals use DRed: every conclusion
+    depending on a removed triple is over-deleted through the recorded supports, then the
+    ones that still have a derivation (or are still asserted) are re-derived. Both costs
+    depend on the part of the closure touched by the change, not on the size of the graph.
+
+    Schema changes (class or property axioms) rebuild the closure from scratch.
+    """
+
+    def __init__(self, source, check_consistency=True):
+        self.check_consistency = check_consistency
+        self.asserted = set(as_graph(source).triples((None, None, None)))
+        self._materialize()
+
+    def _materialize(self):
+        graph = Graph()
+        for triple in self.asserted:
+            graph.add(triple)
+        self.schema = _Schema(graph)
+        self.engine = _Materializer(self.schema, track_support=True)
+        for triple in self.asserted:
+            self.engine.add(*triple)
+        self.engine.run()
+        self.engine.journal.clear()
+        self._check(self.engine.triples)
+
+    def _check(self, candidates):
+        if self.check_consistency:
+            violations = _violations(self.schema, self.engine.triples, candidates)
+            if violations:
+                raise InconsistentOntologyError(sorted(violations))
+
+    @property
+    def inferred(self):
+        """ Inferred triples that are not asserted, as returned by infer_triples """
+        return {t for t in self.engine.triples - self.asserted if not _is_trivial(t)}
+
+    def update(self, added=(), removed=()):
+        """
+        Apply a delta of asserted triples and update the materialized closure.
+
+        :param added: triples newly asserted
+        :param removed: triples no longer asserted
+        :return: (added, removed) sets of triples entering and leaving the closure
+        """
+        # Removals are applied before additions, so a triple in both stays asserted
+        added = set(added)
+        removed = (set(removed) & self.asserted) - added
+        added -= self.asserted
+
+        if any(_is_schema(t) for t in added | removed):
+            before = set(self.engine.triples)
+            self.asserted = (self.asserted - removed) | added
+            self._materialize()
+            return self.engine.triples - before, before - self.engine.triples
+
+        engine = self.engine
+        engine.journal.clear()
+        self.asserted -= removed
+        self.asserted |= added
+
+        # DRed 1: over-delete everything derived through a removed triple
+        overdeleted = set()
+        stack = [t for t in removed if t in engine.triples]
+        while stack:
+            triple = stack.pop()
+            if triple in overdeleted or triple not in engine.triples:
+                continue
+            overdeleted.add(triple)
+            stack.extend(engine.consequents.get(triple, ()))
+        for triple in overdeleted:
+            engine.discard(triple)
+
+        # DRed 2: re-derive what is still asserted or still has a complete support;
+        # propagating from those recovers the rest of the over-deleted triples
+        for triple in overdeleted:
+            if triple in self.asserted or any(
+                all(premise in engine.triples for premise in premises)
+                for premises in engine.supports.get(triple, ())
+            ):
+                engine.add(*triple)
+
+        # Delta propagation of the additions
+        for triple in added:
+            engine.add(*triple)
+        engine.run()
+
+        lost = overdeleted - engine.triples
+        for triple in lost:
+            engine.forget(triple)
+        gained = set(engine.journal) - overdeleted
+        engine.journal.clear()
+        self._check(gained)
+        return gained, lost
+
+
+def _inferences_ontology(source):
+    """ Ontology receiving the inferred triples, chosen the way owlready2's sync_reasoner does """
+    from owlready2 import Ontology
+    from owlready2.namespace import CURRENT_NAMESPACES
+    from owlready2.reasoning import _INFERRENCES_ONTOLOGY
+    if isinstance(source, Ontology):
+        return source
+    if CURRENT_NAMESPACES.get():
+        return CURRENT_NAMESPACES.get()[-1].ontology
+    return source.get_ontology(_INFERRENCES_ONTOLOGY)
+
+
+def sync_reasoner_fast(source=None, check_consistency=True):
+    """
+    In-process replacement for owlready2's sync_reasoner_pellet: infer and assert new triples.
+
+    On an owlready2 World the triples are asserted in the same ontology as owlready2's
+    reasoners use: the ontology passed as source, the one of the enclosing 'with' block, or
+    http://inferrences/.
+
+    :param source: rdflib Graph or owlready2 World/Ontology (defaults to owlready2's default_world)
+    :param check_consistency: raise InconsistentOntologyError on disjointness violations
+    :return: set of triples that were added
+    """
+    if source is None:
+        from owlready2 import default_world
+        source = default_world
+    graph = as_graph(source)
+    inferred = infer_triples(graph, check_consistency=check_consistency)
+    if isinstance(source, Graph):
+        for triple in inferred:
+            graph.add(triple)
+    else:
+        with _inferences_ontology(source):
+            for triple in inferred:
+                graph.add(triple)
+    print(f"✅ Fast reasoning completed: {len(inferred)} triples inferred")
+    return inferred
@@ -0,0 +1,45 @@
+from rdflib import Graph, Literal, Namespace, RDF, XSD
+
+MAT = Namespace('http://bimerr.iot.linkeddata.es/def/material-properties#')
+MMO = Namespace('https://w3id.org/pmd/materials-mechanics-ontology/')
+SAREF = Namespace('https://w3id.org/saref#')
+BSO = Namespace('https://w3id.org/bso#')
+CPO = Namespace('https://w3id.org/cpo#')
+INST = Namespace('https://random-url-to-your-data.com/data#')
+
+QUANTITIES = (('Binder', CPO.BinderQuantity, CPO.BinderMaterial, (CPO.BinderMaterial,)),
+              ('CoarseAggregate', CPO.CoarseAggregateQuantity, CPO.CoarseAggregateMaterial,
+               (CPO.CoarseAggregateMaterial,)),
+              ('FineAggregate', CPO.FineAggregateQuantity, CPO.FineAggregateMaterial, (CPO.FineAggregateMaterial,)),
+              ('Water', CPO.WaterQuantity, CPO.Water, (CPO.Water, MAT.Water)))
+PROPERTIES = (MMO.SpecificHeat, MMO.ThermalConductivity, MMO.ThermalExpansionCoefficient)
+
+
+def add_concrete(graph, i):
+    """ Add a concrete mix with its four component quantities and materials; return the added triples """
+    before = set(graph)
+    concrete = INST[f'Concrete{i}']
+    graph.add((concrete, RDF.type, MAT.Concrete))
+    for k, (name, quantity_class, _, material_classes) in enumerate(QUANTITIES):
+        quantity = INST[f'Concrete{i}-{name}Quantity']
+        graph.add((quantity, RDF.type, quantity_class))
+        graph.add((concrete, CPO.hasComponentQuantity, quantity))
+        graph.add((quantity, SAREF.hasValue, Literal(100.0 * (k + 1) + i, datatype=XSD.double)))
+        material = INST[f'Concrete{i}-{name}']
+        for cls in material_classes:
+            graph.add((material, RDF.type, cls))
+        graph.add((concrete, CPO.isMadeOfComponentMaterial, material))
+        for j, prop_class in enumerate(PROPERTIES):
+            prop = INST[f'Concrete{i}-{name}-{prop_class.split("/")[-1]}']
+            graph.add((prop, RDF.type, prop_class))
+            graph.add((material, BSO.hasMaterialProperty, prop))
+            graph.add((prop, SAREF.hasValue, Literal(0.5 + k + j + i / 10, datatype=XSD.double)))
+    return set(graph) - before
+
+
+def concrete_graph(n):
+    """ Graph holding n concrete mixes the rules of resources/Rules apply to """
+    graph = Graph()
+    for i in range(n):
+        add_concrete(graph, i)
+    return graph
@@ -0,0 +1,8 @@
+import pytest
+from concrete_data import concrete_graph as _concrete_graph
+
+
+@pytest.fixture
+def concrete_graph():
+    """ Factory of graphs holding n concrete mixes the rules of resources/Rules apply to """
+    return _concrete_graph
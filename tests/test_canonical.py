@@ -0,0 +1,71 @@
+import itertools
+import random
+from rdflib import BNode, Graph, Literal, URIRef
+from rdflib.compare import isomorphic
+from utils.canonical import graph_digest, semantic_diff
+
+P = URIRef('urn:test:p')
+Q = URIRef('urn:test:q')
+
+
+def _relabel(graph, seed):
+    """ Copy of graph with fresh blank node ids, statements added in a shuffled order """
+    rng = random.Random(seed)
+    nodes = {}
+    triples = list(graph)
+    rng.shuffle(triples)
+    copy = Graph()
+    for triple in triples:
+        copy.add(tuple(nodes.setdefault(t, BNode()) if isinstance(t, BNode) else t for t in triple))
+    return copy
+
+
+def _cycle(n):
+    graph = Graph()
+    nodes = [BNode() for _ in range(n)]
+    for i in range(n):
+        graph.add((nodes[i], P, nodes[(i + 1) % n]))
+    return graph
+
+
+def test_digest_ignores_blank_node_ids_of_cycles():
+    for graph in (_cycle(5), _cycle(12)):
+        assert len({graph_digest(_relabel(graph, seed)) for seed in range(30)}) == 1
+
+
+def test_digest_ignores_blank_node_ids_of_identical_structures():
+    graph = Graph()
+    for _ in range(50):
+        node = BNode()
+        graph.add((URIRef('urn:test:c'), Q, node))
+        graph.add((node, P, Literal('x')))
+    assert len({graph_digest(_relabel(graph, seed)) for seed in range(5)}) == 1
+
+
+def test_digest_equal_exactly_for_isomorphic_graphs():
+    rng = random.Random(0)
+    graphs = []
+    for _ in range(60):
+        nodes = [BNode() for _ in range(5)]
+        graph = Graph()
+        for _ in range(6):
+            graph.add((rng.choice(nodes), P, rng.choice(nodes)))
+        graphs.append(graph)
+    digests = [graph_digest(graph) for graph in graphs]
+    for i, j in itertools.combinations(range(len(graphs)), 2):
+        assert (digests[i] == digests[j]) == isomorphic(graphs[i], graphs[j])
+
+    two_triangles = _cycle(3) + _cycle(3)
+    assert graph_digest(two_triangles) != graph_digest(_cycle(6))
+
+
+def test_semantic_diff_ignores_reserialized_blank_nodes():
+    graph = Graph()
+    restriction = BNode()
+    graph.add((URIRef('urn:test:A'), P, restriction))
+    graph.add((restriction, Q, URIRef('urn:test:B')))
+    reasoned = _relabel(graph, 1)
+    reasoned.add((URIRef('urn:test:A'), Q, URIRef('urn:test:C')))
+    added, removed = semantic_diff(graph, reasoned)
+    assert added == {(URIRef('urn:test:A'), Q, URIRef('urn:test:C'))}
+    assert removed == set()
@@ -0,0 +1,40 @@
+import numpy as np
+from rdflib import BNode, Graph, Literal, URIRef
+from rdflib.namespace import XSD
+from utils.columnar import decode, result_columns
+
+EX = 'urn:test:'
+
+
+def _result(values):
+    """ SELECT ?s ?v over one (s<i>, p, value) statement per value, in order """
+    graph = Graph()
+    for i, value in enumerate(values):
+        graph.add((URIRef(f'{EX}s{i}'), URIRef(f'{EX}p'), value))
+    return graph.query(f'SELECT ?s ?v WHERE {{ ?s <{EX}p> ?v }} ORDER BY ?s')
+
+
+def test_dictionary_columns_round_trip():
+    values = [URIRef('urn:test:x'), Literal('urn:test:x'), URIRef('urn:test:x'), Literal('x', lang='fr'),
+              Literal('x', datatype=XSD.token), Literal('a "quoted"\nline\\'), BNode('b1')]
+    columns, dictionaries = result_columns(_result(values))
+    codes = columns['v']
+    assert codes[0] == codes[2] != codes[1]
+    assert len(set(codes.tolist())) == len(values) - 1
+    decoded = decode(codes, dictionaries['v'])
+    for term, value in zip(decoded, values):
+        assert type(term) is type(value) and term == value
+
+
+def test_ill_typed_numeric_literal_falls_back_to_dictionary():
+    values = [Literal('1.5', datatype=XSD.double), Literal('abc', datatype=XSD.double)]
+    columns, dictionaries = result_columns(_result(values))
+    assert decode(columns['v'], dictionaries['v']) == values
+
+
+def test_numeric_columns():
+    result = _result([Literal(2), Literal(3)])
+    columns, dictionaries = result_columns(result)
+    assert columns['v'].dtype == np.int64 and list(columns['v']) == [2, 3] and 'v' not in dictionaries
+    result = _result([Literal(2.5), Literal(1)])
+    assert list(result_columns(result)[0]['v']) == [2.5, 1.0]
@@ -0,0 +1,97 @@
+import hashlib
+from rdflib import BNode, Graph, Literal, URIRef
+from rdflib.namespace import OWL, RDF, RDFS
+from utils.comparisons import compare_graphs, detect_format, diff_graphs, stream_diff, write_diff, write_inferred
+
+EX = 'urn:test:'
+
+
+def _graph(n, start=0):
+    graph = Graph()
+    for i in range(start, n):
+        graph.add((URIRef(f'{EX}s{i}'), URIRef(EX + 'value'), Literal(i)))
+        graph.add((URIRef(f'{EX}s{i}'), RDF.type, URIRef(EX + 'Thing')))
+    return graph
+
+
+def _files(tmp_path, original, reasoned):
+    """ Write the original graph as Turtle and the reasoned one as N-Triples """
+    original_path, reasoned_path = str(tmp_path / 'original.ttl'), str(tmp_path / 'reasoned.nt')
+    original.serialize(original_path, format='turtle')
+    reasoned.serialize(reasoned_path, format='nt')
+    return original_path, reasoned_path
+
+
+def test_detect_format_uses_extension_then_content(tmp_path):
+    assert detect_format('a.ttl') == 'turtle'
+    assert detect_format('a.nt') == 'nt'
+    assert detect_format('a.owl') == 'xml'
+    for head, expected in ((b'  <?xml version="1.0"?>\n<rdf:RDF/>', 'xml'), (b'<rdf:RDF/>', 'xml'),
+                           (b'\n{"@id": "urn:a"}', 'json-ld'), (b'[]', 'json-ld'),
+                           (b'@prefix ex: <urn:> .', 'turtle')):
+        path = tmp_path / 'data.rdfdata'
+        path.write_bytes(head)
+        assert detect_format(str(path)) == expected
+
+
+def test_stream_diff_merges_runs_across_formats(tmp_path):
+    original, reasoned = _graph(30), _graph(40, start=10)
+    paths = _files(tmp_path, original, reasoned)
+
+    # Runs of 3 triples: each file spills many runs that must be merged in hash order
+    changes = list(stream_diff(*paths, run_size=3, tmp_dir=str(tmp_path)))
+    keys = [hashlib.sha1(line.encode('utf-8')).hexdigest() for _, line in changes]
+    assert keys == sorted(keys)
+    added = Graph().parse(data=''.join(line for sign, line in changes if sign == '+'), format='nt')
+    removed = Graph().parse(data=''.join(line for sign, line in changes if sign == '-'), format='nt')
+    assert set(added) == set(reasoned - original)
+    assert set(removed) == set(original - reasoned)
+    # The runs are removed with their temporary directory
+    assert sorted(p.name for p in tmp_path.iterdir()) == ['original.ttl', 'reasoned.nt']
+
+
+def test_diff_graphs_and_write_diff_agree(tmp_path):
+    original, reasoned = _graph(30), _graph(40, start=10)
+    paths = _files(tmp_path, original, reasoned)
+
+    diff = diff_graphs(*paths, run_size=7)
+    assert diff.added == set(reasoned - original) and diff.removed == set(original - reasoned)
+
+    added_path, removed_path = tmp_path / 'added.nt', tmp_path / 'removed.nt'
+    counts = write_diff(*paths, str(added_path), str(removed_path), run_size=7)
+    assert counts == (len(diff.added), len(diff.removed)) == (20, 20)
+    assert set(Graph().parse(str(added_path), format='nt')) == diff.added
+    assert set(Graph().parse(str(removed_path), format='nt')) == diff.removed
+
+
+def test_compare_graphs_and_write_inferred_agree(tmp_path, capsys):
+    original, reasoned = _graph(5), _graph(30)
+    paths = _files(tmp_path, original, reasoned)
+
+    inferred = compare_graphs(*paths, limit=3)
+    assert isinstance(inferred, Graph) and set(inferred) == set(reasoned - original)
+    assert "... 47 more (50 in total)" in capsys.readouterr().out
+
+    output = tmp_path / 'inferred.nt'
+    assert write_inferred(*paths, str(output)) == 50
+    assert set(Graph().parse(str(output), format='nt')) == set(inferred)
+
+    assert len(compare_graphs(paths[0], paths[0])) == 0
+    assert "No new inferred triples" in capsys.readouterr().out
+
+
+def test_semantic_comparison_ignores_relabelled_blank_nodes(tmp_path):
+    original = _graph(2)
+    restriction = BNode()
+    original.add((URIRef(EX + 'Thing'), RDFS.subClassOf, restriction))
+    original.add((restriction, RDF.type, OWL.Restriction))
+    original.add((restriction, OWL.onProperty, URIRef(EX + 'value')))
+    reasoned = Graph()
+    reasoned += original
+    reasoned.add((URIRef(EX + 's0'), RDF.type, OWL.Thing))
+    paths = _files(tmp_path, original, reasoned)
+
+    # Each file gets its own blank node, so a plain diff reports the restriction again
+    assert len(compare_graphs(*paths)) == 4
+    assert set(compare_graphs(*paths, semantic=True)) == {(URIRef(EX + 's0'), RDF.type, OWL.Thing)}
+    assert write_inferred(*paths, str(tmp_path / 'inferred.nt'), semantic=True) == 1
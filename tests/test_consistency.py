@@ -0,0 +1,37 @@
+import pytest
+from rdflib import Graph, Namespace, RDF, RDFS
+from rdflib.namespace import OWL
+from fast_reason import InconsistentOntologyError, infer_triples
+from utils.consistency import Violation, find_violations
+
+EX = Namespace('urn:test:')
+
+
+def _graph():
+    g = Graph()
+    g.add((EX.Wind, RDFS.subClassOf, EX.Variable))
+    g.add((EX.Snow, RDFS.subClassOf, EX.Variable))
+    g.add((EX.Gust, RDFS.subClassOf, EX.Wind))
+    g.add((EX.Wind, OWL.disjointWith, EX.Snow))
+    g.add((EX.ok, RDF.type, EX.Gust))
+    g.add((EX.ok, RDF.type, EX.Variable))
+    g.add((EX.bad, RDF.type, EX.Gust))
+    g.add((EX.bad, RDF.type, EX.Snow))
+    g.add((EX.self, RDF.type, EX.Nothing))
+    g.add((EX.Nothing, RDFS.subClassOf, EX.Wind))
+    g.add((EX.Nothing, RDFS.subClassOf, EX.Snow))
+    return g
+
+
+def test_offending_triples_are_reported():
+    assert find_violations(_graph()) == [
+        Violation(EX.bad, EX.Snow, EX.Wind, ((EX.bad, RDF.type, EX.Gust), (EX.bad, RDF.type, EX.Snow))),
+        Violation(EX.self, EX.Snow, EX.Wind, ((EX.self, RDF.type, EX.Nothing),)),
+    ]
+
+
+def test_agrees_with_the_reasoner_check():
+    with pytest.raises(InconsistentOntologyError) as raised:
+        infer_triples(_graph())
+    reported = {(v.individual, frozenset((v.cls, v.other))) for v in find_violations(_graph())}
+    assert reported == {(s, frozenset((c, d))) for s, c, d in raised.value.violations}
@@ -0,0 +1,47 @@
+import os
+import pytest
+from rdflib import BNode, Dataset, Graph
+from utils.converters import convert, convert_directory
+
+script_dir = os.path.dirname(os.path.realpath(__file__))
+parent_dir = os.path.dirname(script_dir)
+ONTOLOGIES_DIR = os.path.join(parent_dir, 'resources', 'Ontologies')
+
+
+def test_convert_directory_skips_non_rdf_files(tmp_path):
+    results = convert_directory(ONTOLOGIES_DIR, str(tmp_path), 'nt', max_workers=1)
+    inputs = [input_path for input_path, _, _ in results]
+    assert inputs and all(path.endswith('.ttl') for path in inputs)
+    for input_path, output_path, converted in results:
+        assert converted
+        assert len(Graph().parse(output_path, format='nt')) == len(Graph().parse(input_path, format='turtle'))
+    # Second run: everything is up to date
+    assert not any(converted for _, _, converted in convert_directory(ONTOLOGIES_DIR, str(tmp_path), 'nt', max_workers=1))
+
+
+def test_nquads_default_and_named_graphs(tmp_path):
+    source = tmp_path / 'q.nq'
+    source.write_text('<urn:s> <urn:p> "default" .\n'
+                      '<urn:s> <urn:p> <urn:o> <urn:g> .\n'
+                      '_:b <urn:p> "blank graph" _:g .\n', encoding='utf-8')
+    output = str(tmp_path / 'o.nq')
+    assert convert(str(source), output)
+    expected, converted = Dataset(), Dataset()
+    expected.parse(str(source), format='nquads')
+    converted.parse(output, format='nquads')
+    assert len(list(converted.quads())) == len(list(expected.quads())) == 3
+    assert {(s, p, o, str(c)) for s, p, o, c in converted.quads() if not isinstance(s, BNode)} == \
+        {(s, p, o, str(c)) for s, p, o, c in expected.quads() if not isinstance(s, BNode)}
+
+    triples = str(tmp_path / 'o.nt')
+    assert convert(str(source), triples)
+    assert len(Graph().parse(triples, format='nt')) == 3
+
+
+def test_failed_conversion_leaves_no_temporary_file(tmp_path):
+    source = tmp_path / 'bad.nq'
+    source.write_text('<urn:s> <urn:p> <urn:o> <urn:g> trailing .\n', encoding='utf-8')
+    output = tmp_path / 'o.nq'
+    with pytest.raises(Exception):
+        convert(str(source), str(output))
+    assert sorted(os.listdir(tmp_path)) == ['bad.nq']
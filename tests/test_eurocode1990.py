@@ -0,0 +1,10 @@
+from rdflib import Graph
+from rdflib.compare import isomorphic
+from core.Eurocode1990 import build_ec1990, save_path
+
+
+def test_built_ontology_matches_committed_turtle():
+    built = build_ec1990()
+    committed = Graph().parse(save_path, format='turtle')
+    assert len(built) == len(committed) == 960
+    assert isomorphic(built, committed)
@@ -0,0 +1,132 @@
+import random
+import shutil
+import pytest
+from owlready2 import World, Thing, ObjectProperty, sync_reasoner
+from rdflib import Graph, Namespace, RDF, RDFS
+from rdflib.collection import Collection
+from rdflib.namespace import OWL
+from fast_reason import InconsistentOntologyError, IncrementalReasoner, infer_triples, sync_reasoner_fast
+
+EX = Namespace('urn:test:')
+
+
+def _world():
+    world = World()
+    onto = world.get_ontology('http://test.org/onto#')
+    with onto:
+        class Material(Thing): pass
+        class Concrete(Material): pass
+        class Property(Thing): pass
+        class Density(Property): pass
+        class hasProperty(ObjectProperty):
+            domain = [Material]
+            range = [Property]
+        class hasDensity(hasProperty): pass
+        Concrete('c1')
+        sample = Thing('sample')
+        sample.hasDensity = [Thing('d1')]
+    return world, onto
+
+
+def _memberships(world, onto):
+    """ Named classes of every individual of the test ontology, inferred ones included """
+    return {ind.name: {cls.name for cls in ind.INDIRECT_is_a if getattr(cls, 'namespace', None) is onto}
+            for ind in onto.individuals()}
+
+
+def test_sync_reasoner_fast_asserts_in_world():
+    world, onto = _world()
+    inferred = sync_reasoner_fast(world)
+    assert inferred
+    assert onto.Material in world['http://test.org/onto#sample'].INDIRECT_is_a
+    assert onto.Property in world['http://test.org/onto#d1'].INDIRECT_is_a
+    assert list(world.get_ontology('http://inferrences/').get_triples())
+
+
+@pytest.mark.skipif(shutil.which('java') is None, reason="HermiT needs a Java runtime")
+def test_sync_reasoner_fast_matches_sync_reasoner():
+    fast_world, fast_onto = _world()
+    sync_reasoner_fast(fast_world)
+    java_world, java_onto = _world()
+    sync_reasoner(java_world, debug=0)
+    assert _memberships(fast_world, fast_onto) == _memberships(java_world, java_onto)
+
+
+def _schema():
+    """ Axioms exercising every rule family of the materializer """
+    g = Graph()
+    g.add((EX.C1, RDFS.subClassOf, EX.C2))
+    g.add((EX.C2, RDFS.subClassOf, EX.C3))
+    g.add((EX.C3, OWL.equivalentClass, EX.C4))
+    g.add((EX.p1, RDFS.subPropertyOf, EX.p2))
+    g.add((EX.p2, RDFS.domain, EX.C1))
+    g.add((EX.p3, RDFS.range, EX.C2))
+    g.add((EX.p4, RDF.type, OWL.TransitiveProperty))
+    g.add((EX.p5, RDF.type, OWL.SymmetricProperty))
+    g.add((EX.p1, OWL.inverseOf, EX.p3))
+    g.add((EX.p6, RDF.type, OWL.FunctionalProperty))
+    g.add((EX.C5, OWL.disjointWith, EX.C2))
+    g.add((EX.A, OWL.disjointWith, EX.Z))
+    chain = EX.chain
+    Collection(g, chain, [EX.p4, EX.p5])
+    g.add((EX.p7, OWL.propertyChainAxiom, chain))
+    return g
+
+
+@pytest.mark.parametrize('seed', [1, 7, 13])
+def test_incremental_reasoner_matches_full_recompute(seed):
+    rng = random.Random(seed)
+    individuals = [EX[f'i{k}'] for k in range(8)]
+    predicates = [EX[f'p{k}'] for k in range(1, 8)] + [OWL.sameAs]
+    classes = [EX[f'C{k}'] for k in range(1, 6)]
+
+    def random_triple():
+        if rng.random() < 0.2:
+            return rng.choice(individuals), RDF.type, rng.choice(classes)
+        return rng.choice(individuals), rng.choice(predicates), rng.choice(individuals)
+
+    def violations():
+        try:
+            infer_triples(graph)
+        except InconsistentOntologyError as e:
+            return set(e.violations)
+        return set()
+
+    graph = _schema()
+    schema = set(graph)
+    for _ in range(10):
+        graph.add(random_triple())
+    reasoner = IncrementalReasoner(graph, check_consistency=False)
+    reasoner.check_consistency = True
+    before = violations()
+    for _ in range(40):
+        added = {random_triple() for _ in range(rng.randint(0, 3))}
+        data = sorted(t for t in graph if t not in schema)
+        removed = set(rng.sample(data, min(len(data), rng.randint(0, 3))))
+        try:
+            reasoner.update(added, removed)
+            raised = False
+        except InconsistentOntologyError:
+            raised = True
+        for triple in removed - added:
+            graph.remove(triple)
+        for triple in added:
+            graph.add(triple)
+        assert reasoner.inferred == infer_triples(graph, check_consistency=False)
+        # The incremental check reports exactly the steps that introduce a new violation
+        after = violations()
+        assert raised == bool(after - before)
+        before = after
+
+
+def test_incremental_reasoner_checks_partners_sorting_either_way():
+    for first, second in ((EX.A, EX.Z), (EX.Z, EX.A)):
+        graph = _schema()
+        graph.add((EX.i, RDF.type, first))
+        reasoner = IncrementalReasoner(graph)
+        graph.add((EX.i, RDF.type, second))
+        with pytest.raises(InconsistentOntologyError):
+            infer_triples(graph)
+        with pytest.raises(InconsistentOntologyError) as raised:
+            reasoner.update(added={(EX.i, RDF.type, second)})
+        assert raised.value.violations == [(EX.i, EX.A, EX.Z)]
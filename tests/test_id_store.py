@@ -0,0 +1,55 @@
+import itertools
+import random
+import pytest
+from rdflib import BNode, Graph, Literal, URIRef
+from utils import id_store
+from utils.id_store import integer_graph
+from utils.rule_compiler import compile_rules
+from utils.rule_engine import load_rules, run_rules
+
+EX = 'urn:test:'
+
+
+def _assert_same(graph, expected, rng):
+    assert len(graph) == len(expected)
+    assert set(graph) == set(expected)
+    sample = rng.sample(sorted(expected), min(len(expected), 20))
+    for triple in sample:
+        # Every bound/unbound combination of a known triple
+        for mask in itertools.product((True, False), repeat=3):
+            pattern = tuple(term if bound else None for term, bound in zip(triple, mask))
+            assert set(graph.triples(pattern)) == set(expected.triples(pattern))
+    assert not set(graph.triples((URIRef(EX + 'unknown'), None, None)))
+
+
+@pytest.mark.parametrize('flush_size', [4, 1000])
+def test_integer_store_matches_memory_store(monkeypatch, flush_size):
+    monkeypatch.setattr(id_store, 'FLUSH_SIZE', flush_size)
+    rng = random.Random(flush_size)
+    terms = [URIRef(f'{EX}n{k}') for k in range(12)] + [BNode('b'), Literal('x'), Literal(1), Literal('x', lang='en')]
+    predicates = [URIRef(f'{EX}p{k}') for k in range(3)]
+    graph, expected = integer_graph(), Graph()
+    for _ in range(400):
+        triple = rng.choice(terms[:13]), rng.choice(predicates), rng.choice(terms)
+        if rng.random() < 0.3 and len(expected):
+            triple = rng.choice(sorted(expected))
+            pattern = tuple(None if rng.random() < 0.2 else t for t in triple)
+            graph.remove(pattern)
+            expected.remove(pattern)
+        else:
+            graph.add(triple)
+            expected.add(triple)
+        if rng.random() < 0.05:
+            _assert_same(graph, expected, rng)
+    _assert_same(graph, expected, rng)
+    graph.store.flush()
+    _assert_same(graph, expected, rng)
+
+
+def test_rules_on_integer_store_match_memory_store(concrete_graph):
+    expected = concrete_graph(2)
+    graph = integer_graph()
+    graph.addN((s, p, o, graph) for s, p, o in expected)
+    run_rules(expected, compile_rules(load_rules(), expected))
+    run_rules(graph, compile_rules(load_rules(), graph))
+    assert set(graph) == set(expected)
@@ -0,0 +1,72 @@
+import os
+import shutil
+from openpyxl import load_workbook
+from rdflib import Graph
+from utils import import_excel
+from utils.import_excel import (OM, default_state_path, excel_triples, mix_quantity_header, mix_quantity_row,
+                                reimport_excel)
+
+
+def test_mix_quantity_row_without_units_cell():
+    context, _ = mix_quantity_header([('Quantity', 'C1', 'C2', 'Unit')], [])
+    full = mix_quantity_row(context, ('CementQuantity', 300, 350, 'kilogram'))
+    short = mix_quantity_row(context, ('CementQuantity', 300, 350))
+    assert sum(1 for t in full if t[1] == OM.hasUnit) == 2
+    assert short == [t for t in full if t[1] != OM.hasUnit]
+
+
+def test_each_workbook_keeps_its_own_state(tmp_path, monkeypatch):
+    monkeypatch.setattr(import_excel, 'state_dir', str(tmp_path / 'state'))
+    first = str(tmp_path / 'a' / 'concrete_data.xlsx')
+    second = str(tmp_path / 'b' / 'concrete_data.xlsx')
+    for path in (first, second):
+        os.makedirs(os.path.dirname(path))
+        shutil.copy(import_excel.file_path, path)
+    assert default_state_path(first) != default_state_path(second)
+
+    added, _ = reimport_excel(first)
+    assert added and os.path.exists(default_state_path(first))
+    # A second workbook does not inherit the first one's state, so it gets a full import
+    assert reimport_excel(second)[0] == added
+    assert reimport_excel(first) == (set(), set())
+
+
+def _edit(path, edit):
+    workbook = load_workbook(path)
+    edit(workbook['Concrete Mix Quantity'])
+    workbook.save(path)
+
+
+def _imported(tmp_path, edit):
+    """ Graph of a first import of a workbook copy, updated by the re-import after an edit, and the delta """
+    path = str(tmp_path / 'concrete_data.xlsx')
+    shutil.copy(import_excel.file_path, path)
+    state_path = str(tmp_path / 'state.json')
+    graph = Graph()
+    reimport_excel(path, state_path, graph=graph)
+    _edit(path, edit)
+    patch_path = str(tmp_path / 'delta.patch')
+    added, removed = reimport_excel(path, state_path, patch_path=patch_path, graph=graph)
+    assert set(graph) == set(excel_triples(path))
+    with open(patch_path, encoding='utf-8') as f:
+        assert len(f.readlines()) == len(added) + len(removed)
+    return added, removed
+
+
+def test_changed_cell_gives_minimal_delta(tmp_path):
+    def edit(sheet):
+        sheet['B2'] = 155
+
+    added, removed = _imported(tmp_path, edit)
+    assert len(added) == len(removed) == 1
+    (s, p, old), = removed
+    assert (s, p) == next((t[0], t[1]) for t in added) and old.toPython() == 150
+
+
+def test_removed_row_only_removes_its_triples(tmp_path):
+    def edit(sheet):
+        sheet.delete_rows(5)  # BinderQuantity; the totals row below moves up
+
+    added, removed = _imported(tmp_path, edit)
+    assert not added
+    assert len(removed) == 8 and all(any('BinderQuantity' in str(term) for term in triple) for triple in removed)
@@ -0,0 +1,35 @@
+import pytest
+from concrete_data import INST, SAREF
+from rdflib import Literal
+from rdflib.namespace import XSD
+from utils.mix_properties import RULE_NAMES, evaluate_concrete_properties
+from utils.rule_compiler import compile_rules
+from utils.rule_engine import load_rules, run_rules
+
+
+def _rules(graph):
+    return compile_rules([rule for rule in load_rules() if rule.name in RULE_NAMES.values()], graph)
+
+
+def _with_integer_quantities(graph):
+    """ Same mixes with xsd:integer quantities, which take the exact integer/decimal path """
+    for s, p, o in list(graph.triples((None, SAREF.hasValue, None))):
+        if str(s).endswith('Quantity'):
+            graph.remove((s, p, o))
+            graph.add((s, p, Literal(int(o.toPython()), datatype=XSD.integer)))
+    return graph
+
+
+@pytest.mark.parametrize('n', [2, 4, 8])
+@pytest.mark.parametrize('integers', [False, True])
+def test_batch_evaluation_matches_rules(concrete_graph, n, integers):
+    prepare = _with_integer_quantities if integers else (lambda graph: graph)
+    graph = prepare(concrete_graph(n))
+    added, removed = evaluate_concrete_properties(graph)
+    assert added
+
+    expected = prepare(concrete_graph(n))
+    run_rules(expected, _rules(expected))
+    assert set(graph) == set(expected)
+    # Terms are compared, so datatypes and lexical forms of the values agree too
+    assert graph.value(INST['Concrete0-MassDensity'], SAREF.hasValue) is not None
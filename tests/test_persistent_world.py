@@ -0,0 +1,30 @@
+import json
+import os
+from utils.persistent_world import _manifest_path, open_world
+
+script_dir = os.path.dirname(os.path.realpath(__file__))
+parent_dir = os.path.dirname(script_dir)
+SOURCES = [os.path.join(parent_dir, 'resources', 'Ontologies', '00_General', 'BSO_v01.ttl'),
+           os.path.join(parent_dir, 'resources', 'Ontologies', '00_General', 'ELEM_v01.ttl')]
+
+
+def _manifest(world_path):
+    with open(_manifest_path(world_path), encoding='utf-8') as f:
+        return json.load(f)
+
+
+def test_removed_source_is_saved(tmp_path):
+    world_path = str(tmp_path / 'world.sqlite3')
+    world = open_world(SOURCES, world_path)
+    iris = {entry['iri'] for entry in _manifest(world_path).values()}
+    world.close()
+
+    world = open_world(SOURCES[:1], world_path)
+    world.close()
+    assert list(_manifest(world_path)) == [os.path.abspath(SOURCES[0])]
+
+    # Reopening with the same single source has nothing to do, and the dropped module stays gone
+    world = open_world(SOURCES[:1], world_path)
+    kept = _manifest(world_path)[os.path.abspath(SOURCES[0])]['iri']
+    assert {onto.base_iri for onto in world.ontologies.values()} & iris == {kept}
+    world.close()
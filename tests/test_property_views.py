@@ -0,0 +1,43 @@
+from collections import Counter
+from concrete_data import INST, SAREF, add_concrete
+from rdflib import Literal
+from rdflib.namespace import XSD
+from utils.property_views import PropertyViews
+from utils.query_registry import QueryRegistry
+from utils.rule_compiler import compile_rules
+from utils.rule_engine import load_rules, run_rules
+
+
+def _assert_views_match_queries(views, graph):
+    registry = QueryRegistry()
+    assert views.names()
+    for name in views.names():
+        variables = views.views[name].variables
+        rows = Counter(tuple(row[v] for v in variables) for row in registry.run(name, graph).bindings)
+        assert Counter(views.rows(name)) == rows, name
+        concrete = INST.Concrete0
+        rows = Counter(tuple(row[v] for v in variables)
+                       for row in registry.run(name, graph, **{str(variables[0]): concrete}).bindings)
+        assert Counter(views.rows(name, concrete)) == rows, name
+
+
+def test_views_follow_rule_changes(concrete_graph):
+    graph = concrete_graph(2)
+    views = PropertyViews(graph)
+    rules = compile_rules(load_rules(), graph)
+    run_rules(graph, rules, on_change=views.apply)
+    _assert_views_match_queries(views, graph)
+
+    # A new concrete, then a changed component value, propagated as deltas
+    run_rules(graph, rules, changed=add_concrete(graph, 2), on_change=views.apply)
+    _assert_views_match_queries(views, graph)
+    quantity = INST['Concrete0-WaterQuantity']
+    removed = set(graph.triples((quantity, SAREF.hasValue, None)))
+    added = {(quantity, SAREF.hasValue, Literal(o.toPython() * 2, datatype=XSD.double)) for _, _, o in removed}
+    for triple in removed:
+        graph.remove(triple)
+    graph.addN((s, p, o, graph) for s, p, o in added)
+    views.apply(added, removed)
+    run_rules(graph, rules, changed=added, on_change=views.apply)
+    _assert_views_match_queries(views, graph)
+    assert views.names() == sorted(PropertyViews(graph).views)
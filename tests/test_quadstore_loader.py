@@ -0,0 +1,25 @@
+from owlready2 import World
+from rdflib import Graph, URIRef
+from rdflib.namespace import OWL, RDF
+from utils.quadstore_loader import load_ontology
+
+EC1990_TTL = 'ontologies/EC1990.ttl'
+
+
+def _plain(triples):
+    """ Statements with literals compared by lexical form (owlready2 types plain strings as xsd:string) """
+    return {(s, p, str(o)) for s, p, o in triples}
+
+
+def test_turtle_and_ntriples_load_the_same_ontology(tmp_path):
+    source = Graph()
+    source.parse(EC1990_TTL, format='turtle')
+    nt_path = tmp_path / 'EC1990.nt'
+    source.serialize(str(nt_path), format='nt', encoding='utf-8')
+
+    for path in (EC1990_TTL, str(nt_path)):
+        world = World()
+        onto = load_ontology(path, world)
+        assert onto.base_iri == 'http://www.w3id.org/eurocodes/ec1990#'
+        assert {URIRef(c.iri) for c in onto.classes()} == set(source.subjects(RDF.type, OWL.Class))
+        assert _plain(source) <= _plain(world.as_rdflib_graph().triples((None, None, None)))
@@ -0,0 +1,85 @@
+from rdflib import Graph, Namespace, RDF, RDFS
+from fast_reason import infer_triples
+from utils import reasoning_cache
+from utils.reasoning_cache import ReasoningCache
+
+EX = Namespace('urn:test:')
+
+
+def _write(path, *triples, fmt='turtle'):
+    graph = Graph()
+    graph.bind('ex', EX)
+    for triple in triples:
+        graph.add(triple)
+    graph.serialize(str(path), format=fmt)
+    return str(path)
+
+
+def _sources(tmp_path):
+    schema = _write(tmp_path / 'schema.ttl', (EX.Concrete, RDFS.subClassOf, EX.Material))
+    data = _write(tmp_path / 'data.ttl', (EX.c1, RDF.type, EX.Concrete))
+    return [schema, data]
+
+
+def _expected(paths):
+    graph = Graph()
+    for path in paths:
+        graph.parse(path)
+    return infer_triples(graph)
+
+
+def test_miss_then_hit(tmp_path):
+    paths = _sources(tmp_path)
+    cache = ReasoningCache(str(tmp_path / 'cache'))
+    expected = _expected(paths)
+    assert (EX.c1, RDF.type, EX.Material) in expected
+    assert cache.reason(paths) == expected
+    assert (cache.hits, cache.misses) == (0, 1)
+    # Another process (another instance) hits, in any file order
+    other = ReasoningCache(str(tmp_path / 'cache'))
+    assert other.reason(paths[::-1]) == expected
+    assert (other.hits, other.misses) == (1, 1)
+
+
+def test_miss_parses_each_file_once(tmp_path, monkeypatch):
+    paths = _sources(tmp_path)
+    parsed = []
+    parse_file = reasoning_cache.parse_file
+    monkeypatch.setattr(reasoning_cache, 'parse_file', lambda path: parsed.append(path) or parse_file(path))
+    ReasoningCache(str(tmp_path / 'cache')).reason(paths)
+    assert sorted(parsed) == sorted(paths)
+
+
+def test_invalidation(tmp_path):
+    paths = _sources(tmp_path)
+    cache = ReasoningCache(str(tmp_path / 'cache'))
+    cache.reason(paths)
+
+    # Same content in another serialization: still a hit
+    nt = _write(tmp_path / 'data.nt', (EX.c1, RDF.type, EX.Concrete), fmt='nt')
+    cache.reason([paths[0], nt])
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    # Changed content, or changed settings: misses
+    _write(paths[1], (EX.c2, RDF.type, EX.Concrete))
+    assert (EX.c2, RDF.type, EX.Material) in cache.reason(paths)
+    cache.reason(paths, check_consistency=False)
+    assert (cache.hits, cache.misses) == (1, 3)
+
+
+def test_fingerprints_are_bounded(tmp_path, monkeypatch):
+    monkeypatch.setattr(reasoning_cache, 'MAX_FINGERPRINTS', 2)
+    cache = ReasoningCache(str(tmp_path / 'cache'))
+    for k in range(5):
+        cache.reason([_write(tmp_path / f'data{k}.ttl', (EX[f'c{k}'], RDF.type, EX.Concrete))])
+    assert len(ReasoningCache(str(tmp_path / 'cache')).index['fingerprints']) == 2
+
+
+def test_entries_are_evicted_above_the_size_bound(tmp_path):
+    cache = ReasoningCache(str(tmp_path / 'cache'), max_bytes=1)
+    paths = _sources(tmp_path)
+    cache.reason(paths)
+    cache.reason(paths, check_consistency=False)
+    entries = [name for name in (tmp_path / 'cache').iterdir() if name.suffix == '.nt']
+    assert len(entries) == 1
+    assert not [name for name in (tmp_path / 'cache').iterdir() if name.suffix == '.tmp']
@@ -0,0 +1,78 @@
+from rdflib import Graph, Literal, URIRef, Variable
+from rdflib.namespace import RDF
+from rdflib.plugins.sparql import CUSTOM_EVALS
+from rdflib.plugins.sparql.parserutils import CompValue
+from utils.rule_compiler import GraphStatistics, compile_rules, order_patterns
+from utils.rule_engine import evaluate_rule, load_rules
+
+EX = 'urn:test:'
+
+
+def _nodes(node, name):
+    """ Algebra nodes of the given name below (and including) a node """
+    if not isinstance(node, CompValue):
+        return []
+    found = [node] if node.name == name else []
+    for key in ("p", "p1", "p2"):
+        found += _nodes(node.get(key), name)
+    return found
+
+
+def test_order_patterns_starts_selective_and_stays_connected():
+    graph = Graph()
+    thing, name, knows = URIRef(EX + 'Thing'), URIRef(EX + 'name'), URIRef(EX + 'knows')
+    for i in range(50):
+        graph.add((URIRef(f'{EX}{i}'), RDF.type, thing))
+        graph.add((URIRef(f'{EX}{i}'), name, Literal(f'n{i}')))
+        graph.add((URIRef(f'{EX}{i}'), knows, URIRef(f'{EX}{(i + 1) % 50}')))
+    x, y = Variable('x'), Variable('y')
+    patterns = [(x, RDF.type, thing), (y, RDF.type, thing), (x, knows, y), (y, name, Literal('n7'))]
+
+    ordered = order_patterns(patterns, GraphStatistics(graph))
+    assert ordered == [(y, name, Literal('n7')), (y, RDF.type, thing), (x, knows, y), (x, RDF.type, thing)]
+
+    # Pre-bound variables make their patterns cheap
+    assert order_patterns(patterns, GraphStatistics(graph), {x})[0] == (x, RDF.type, thing)
+
+
+def test_plans_reorder_rules_and_drop_redundant_optionals(concrete_graph):
+    graph = concrete_graph(2)
+    rule, = [r for r in compile_rules(load_rules(), graph) if r.name == 'SPARQL_ThermalConductivity']
+
+    plan = rule.plan()
+    bgp, optional_bgp = _nodes(plan, 'OrderedBGP')
+    assert sorted(bgp.triples) == sorted(rule.required)
+    # The cheapest pattern goes first; rdflib alone would run every `?x a <Class>` pattern
+    # first, none of which joins the previous ones
+    assert rule.stats.estimate(bgp.triples[0], set()) == min(rule.stats.estimate(t, set()) for t in bgp.triples)
+    types = [t for t in bgp.triples if t[1] == RDF.type]
+    assert bgp.triples[:len(types)] != types
+    bound = set()
+    for triple in bgp.triples:
+        variables = {t for t in triple if isinstance(t, Variable)}
+        assert not bound or variables & bound
+        bound |= variables
+
+    # The first OPTIONAL binds nothing new; the second one binds ?oldCoTCv
+    assert len(_nodes(rule.modify.where, 'LeftJoin')) == 2
+    optional, = _nodes(plan, 'LeftJoin')
+    assert optional.p2 is optional_bgp
+    assert Variable('oldCoTCv') in {t for triple in optional_bgp.triples for t in triple}
+
+    assert rule.plan() is plan
+    assert rule.plan(frozenset({Variable('C')})) is not plan
+
+
+def test_compiled_rules_match_uncompiled_rules(concrete_graph):
+    graph = concrete_graph(1)
+    rules = load_rules()
+    for rule, compiled in zip(rules, compile_rules(rules, graph)):
+        assert evaluate_rule(graph, compiled) == evaluate_rule(graph, rule)
+    assert 'ordered_bgp' not in CUSTOM_EVALS
+
+
+def test_compiled_rule_sets_do_not_share_plans(concrete_graph):
+    rules = load_rules()
+    first, second = compile_rules(rules, concrete_graph(1)), compile_rules(rules, Graph())
+    assert first[0].plan() is not second[0].plan()
+    assert not second[1].plans
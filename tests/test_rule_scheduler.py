@@ -0,0 +1,16 @@
+import pytest
+from utils.rule_compiler import compile_rules
+from utils.rule_engine import load_rules, run_rules
+from utils.rule_scheduler import run_rules_parallel
+
+
+@pytest.mark.parametrize('max_workers', [1, 2])
+def test_parallel_run_matches_sequential_run(concrete_graph, max_workers):
+    graph = concrete_graph(2)
+    before = set(graph)
+    added, removed = run_rules_parallel(graph, max_workers=max_workers)
+
+    expected = concrete_graph(2)
+    run_rules(expected, compile_rules(load_rules(), expected))
+    assert set(graph) == set(expected)
+    assert added == set(graph) - before and removed == before - set(graph)
@@ -0,0 +1,61 @@
+import itertools
+import pytest
+from rdflib import BNode, Graph, Literal, URIRef
+from rdflib.namespace import XSD
+from utils.snapshot import Snapshot, open_snapshot, write_snapshot
+
+EX = 'urn:test:'
+QUERY = '''
+PREFIX saref: <https://w3id.org/saref#>
+SELECT ?s ?v WHERE { ?s saref:hasValue ?v } ORDER BY ?s ?v
+'''
+
+
+def _graph(concrete_graph):
+    graph = concrete_graph(3)
+    s, p = URIRef(EX + 's'), URIRef(EX + 'p')
+    for o in (Literal('a "quoted"\nline'), Literal('x', lang='fr'), Literal('x'), URIRef(EX + 'x'),
+              Literal('1.50', datatype=XSD.decimal), BNode('b1')):
+        graph.add((s, p, o))
+    graph.bind('ex', EX)
+    return graph
+
+
+def test_snapshot_matches_memory_store(concrete_graph, tmp_path):
+    expected = _graph(concrete_graph)
+    path = str(tmp_path / 'graph.snap')
+    assert write_snapshot(expected, path) == len(expected)
+
+    with Snapshot(path) as snapshot:
+        graph = snapshot.graph()
+        assert len(graph) == len(expected)
+        assert set(graph) == set(expected)
+        for triple in sorted(expected)[::7]:
+            for mask in itertools.product((True, False), repeat=3):
+                pattern = tuple(term if bound else None for term, bound in zip(triple, mask))
+                assert set(graph.triples(pattern)) == set(expected.triples(pattern))
+        assert not set(graph.triples((URIRef(EX + 'unknown'), None, None)))
+        assert list(graph.query(QUERY)) == list(expected.query(QUERY))
+        assert dict(graph.namespaces())['ex'] == URIRef(EX)
+
+
+def test_snapshot_is_read_only(concrete_graph, tmp_path):
+    path = str(tmp_path / 'graph.snap')
+    write_snapshot(concrete_graph(1), path)
+    graph = open_snapshot(path)
+    with pytest.raises(TypeError):
+        graph.add((URIRef(EX + 's'), URIRef(EX + 'p'), URIRef(EX + 'o')))
+    graph.store.snapshot.close()
+
+
+def test_header_with_many_namespaces(tmp_path):
+    expected = Graph()
+    expected.add((URIRef(EX + 's'), URIRef(EX + 'p'), Literal('o')))
+    for k in range(3000):
+        expected.bind(f'ns{k}', f'urn:namespace:{k}#')
+    path = str(tmp_path / 'small.snap')
+    write_snapshot(expected, path)
+    with Snapshot(path) as snapshot:
+        graph = snapshot.graph()
+        assert set(graph) == set(expected)
+        assert dict(graph.namespaces())['ns2999'] == URIRef('urn:namespace:2999#')
@@ -0,0 +1,89 @@
+import asyncio
+import os
+import time
+import pytest
+from aiohttp.test_utils import TestClient, TestServer
+from concrete_data import INST
+from utils import query_registry
+from utils.query_registry import prepare_query
+from utils.rule_compiler import compile_rules
+from utils.rule_engine import load_rules, run_rules
+from utils.sparql_endpoint import SparqlEndpoint
+
+# Named lookups per second the endpoint must sustain on the test graph
+TARGET_RATE = 200
+
+
+def _endpoint(concrete_graph, tmp_path, n):
+    graph = concrete_graph(n)
+    run_rules(graph, compile_rules(load_rules(), graph))
+    path = str(tmp_path / 'concretes.ttl')
+    graph.serialize(path, format='turtle')
+    return SparqlEndpoint([path])
+
+
+async def _with_client(endpoint, scenario):
+    async with TestClient(TestServer(endpoint.app())) as client:
+        return await scenario(client)
+
+
+def test_invalid_bindings_are_rejected(concrete_graph, tmp_path):
+    endpoint = _endpoint(concrete_graph, tmp_path, 1)
+
+    async def scenario(client):
+        statuses = []
+        for value in ('not an iri', '<urn:a> <urn:b>', '{<urn:a> <urn:b> <urn:c>}'):
+            response = await client.get('/queries/Get_Concretes_MassDensity', params={'C': value})
+            statuses.append(response.status)
+        response = await client.get('/queries/Get_Concretes_MassDensity', params={'C': str(INST.Concrete0)})
+        return statuses, response.status
+
+    statuses, ok = asyncio.run(_with_client(endpoint, scenario))
+    assert statuses == [400, 400, 400] and ok == 200
+
+
+def test_adhoc_query_cache_is_bounded(monkeypatch):
+    monkeypatch.setattr(query_registry, 'COMPILED_SIZE', 8)
+    for i in range(50):
+        prepare_query(f'SELECT ?s WHERE {{ ?s ?p {i} }}')
+    assert len(query_registry._COMPILED) <= 8
+
+
+def _lookups(endpoint, n, cached):
+    """ Look every concrete up twice, then run `cached` more lookups served from the result cache """
+    async def scenario(client):
+        async def lookup(i):
+            response = await client.get('/queries/Get_Concretes_MassDensity', params={'C': str(INST[f'Concrete{i % n}'])})
+            assert response.status == 200
+            return (await response.json())['results']['bindings']
+
+        start = time.perf_counter()
+        cold = await asyncio.gather(*(lookup(i) for i in range(2 * n)))
+        misses = time.perf_counter() - start
+        start = time.perf_counter()
+        warm = await asyncio.gather(*(lookup(i) for i in range(cached)))
+        hits = time.perf_counter() - start
+        return cold, warm, 2 * n / misses, cached / hits
+
+    return asyncio.run(_with_client(endpoint, scenario))
+
+
+def test_named_lookups_answer_one_row_per_concrete(concrete_graph, tmp_path):
+    n = 3
+    endpoint = _endpoint(concrete_graph, tmp_path, n)
+    assert 'Get_Concretes_MassDensity' in endpoint.version.views
+
+    cold, warm, _, _ = _lookups(endpoint, n, 2 * n)
+    assert all(len(rows) == 1 for rows in cold)
+    assert len({rows[0]['C']['value'] for rows in cold}) == n
+    assert warm == cold
+
+
+@pytest.mark.benchmark
+@pytest.mark.skipif(not os.environ.get('RUN_BENCHMARKS'), reason="set RUN_BENCHMARKS=1 to run timing tests")
+def test_named_lookup_throughput(concrete_graph, tmp_path):
+    n = 20
+    cold, _, miss_rate, hit_rate = _lookups(_endpoint(concrete_graph, tmp_path, n), n, 500)
+    print(f"\n⏱️ Named lookups: {miss_rate:.0f}/s cold, {hit_rate:.0f}/s cached")
+    assert all(len(rows) == 1 for rows in cold)
+    assert miss_rate >= TARGET_RATE and hit_rate >= TARGET_RATE
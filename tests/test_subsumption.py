@@ -0,0 +1,44 @@
+from rdflib import BNode, Graph, Namespace, RDF, RDFS
+from rdflib.collection import Collection
+from rdflib.namespace import OWL
+from core import ec1990_vocab as ec
+from utils.subsumption import SubsumptionIndex, ec1990_index
+
+EX = Namespace('urn:test:')
+
+
+def test_ec1990_subsumption_and_disjointness():
+    index = ec1990_index()
+    assert index.is_subclass(ec.SnowLoad, ec.VariableAction)
+    assert not index.is_subclass(ec.VariableAction, ec.SnowLoad)
+    assert ec.VariableAction in [str(c) for c in index.superclasses(ec.SnowLoad)]
+    assert ec.SnowLoad in [str(c) for c in index.subclasses(ec.VariableAction)]
+    assert index.are_disjoint(ec.SnowLoad, ec.WindAction) and index.are_disjoint(ec.WindAction, ec.SnowLoad)
+    assert not index.are_disjoint(ec.SnowLoad, ec.VariableAction)
+    assert index.unsatisfiable() == []
+
+
+def test_hierarchy_queries():
+    g = Graph()
+    g.add((EX.B, RDFS.subClassOf, EX.A))
+    g.add((EX.C, RDFS.subClassOf, EX.A))
+    g.add((EX.D, RDFS.subClassOf, EX.B))
+    g.add((EX.D2, OWL.equivalentClass, EX.D))
+    g.add((EX.E, RDFS.subClassOf, EX.C))
+    members = BNode()
+    Collection(g, members, [EX.B, EX.C])
+    g.add((BNode('all'), RDF.type, OWL.AllDisjointClasses))
+    g.add((BNode('all'), OWL.members, members))
+    g.add((EX.Bad, RDFS.subClassOf, EX.D))
+    g.add((EX.Bad, RDFS.subClassOf, EX.E))
+    index = SubsumptionIndex(g)
+
+    assert index.is_subclass(EX.D2, EX.A) and index.is_subclass(EX.D, EX.D2)
+    assert set(index.superclasses(EX.D)) == {EX.D, EX.D2, EX.B, EX.A}
+    assert set(index.common_ancestors(EX.D, EX.E)) == {EX.A}
+    assert set(index.least_common_ancestors(EX.D, EX.B)) == {EX.B}
+    # Disjointness declared on B and C is inherited by their subclasses
+    assert index.are_disjoint(EX.D, EX.E) and not index.are_disjoint(EX.D, EX.A)
+    assert index.unsatisfiable() == [EX.Bad]
+    # Unknown classes only subsume themselves
+    assert index.is_subclass(EX.Unknown, EX.Unknown) and not index.is_subclass(EX.Unknown, EX.A)
@@ -0,0 +1,23 @@
+from utils.hashing import file_hash
+from utils.vocabulary import EC1990_TTL, VOCAB_PATH, generate_vocabulary, generated_hash
+
+
+def test_committed_vocabulary_is_up_to_date(tmp_path):
+    assert generated_hash(VOCAB_PATH) == file_hash(EC1990_TTL)
+
+    module_path = str(tmp_path / 'ec1990_vocab.py')
+    assert generate_vocabulary(EC1990_TTL, module_path)
+    with open(module_path, encoding='utf-8') as generated, open(VOCAB_PATH, encoding='utf-8') as committed:
+        assert generated.read() == committed.read()
+
+    assert not generate_vocabulary(EC1990_TTL, module_path)
+
+
+def test_generated_vocabulary_is_consistent():
+    from core import ec1990_vocab as vocab
+
+    assert len(set(vocab.CLASSES)) == len(vocab.CLASSES)
+    for cls, parents in vocab.PARENTS.items():
+        for parent in parents:
+            assert vocab.is_subclass_of(cls, parent)
+            assert cls in vocab.CHILDREN[parent]
@@ -0,0 +1,279 @@
+import hashlib
+from collections import defaultdict
+from rdflib import BNode, Graph
+from utils.rdf_terms import nt_row
+
+
+def _hash(text):
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+def _key(term, colours):
+    return '_:' + colours[term] if isinstance(term, BNode) else term.n3()
+
+
+def _adjacency(graph):
+    """ Outgoing (p, o) and incoming (s, p) edges of every blank node """
+    out = defaultdict(list)
+    inc = defaultdict(list)
+    bnodes = set()
+    for s, p, o in graph:
+        if isinstance(s, BNode):
+            out[s].append((p, o))
+            bnodes.add(s)
+        if isinstance(o, BNode):
+            inc[o].append((s, p))
+            bnodes.add(o)
+    return bnodes, out, inc
+
+
+def _components(bnodes, out):
+    """ Strongly connected components of the blank-node graph, dependencies first (iterative Tarjan) """
+    index, low, on_stack = {}, {}, set()
+    stack, components = [], []
+    counter = 0
+    for root in sorted(bnodes, key=str):
+        if root in index:
+            continue
+        work = [(root, iter([o for _, o in out[root] if isinstance(o, BNode)]))]
+        index[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack.add(root)
+        while work:
+            node, children = work[-1]
+            child = next(children, None)
+            if child is not None:
+                if child not in index:
+                    index[child] = low[child] = counter
+                    counter += 1
+                    stack.append(child)
+                    on_stack.add(child)
+                    work.append((child, iter([o for _, o in out[child] if isinstance(o, BNode)])))
+                elif child in on_stack:
+                    low[node] = min(low[node], index[child])
+                continue
+            work.pop()
+            if work:
+                parent = work[-1][0]
+                low[parent] = min(low[parent], low[node])
+            if low[node] == index[node]:
+                component = []
+                while True:
+                    member = stack.pop()
+                    on_stack.discard(member)
+                    component.append(member)
+                    if member == node:
+                        break
+                components.append(component)
+    return components
+
+
+def _signature(node, out, inc, colours, incoming):
+    parts = sorted('>' + p.n3() + ' ' + _key(o, colours) for p, o in out[node])
+    if incoming:
+        parts += sorted('<' + p.n3() + ' ' + _key(s, colours) for s, p in inc[node])
+    return _hash(colours[node] + '|' + '|'.join(parts))
+
+
+def _refine(nodes, out, inc, colours, incoming):
+    """ Colour refinement over `nodes` until the number of colour classes stops growing """
+    classes = len({colours[n] for n in nodes})
+    while True:
+        refined = {n: _signature(n, out, inc, colours, incoming) for n in nodes}
+        colours.update(refined)
+        count = len(set(refined.values()))
+        if count == classes:
+            return
+        classes = count
+
+
+def canonical_labels(graph, incoming=True):
+    """
+    Assign every blank node a label that depends only on the structure around it.
+
+    Acyclic blank-node structures (OWL restrictions, RDF lists, ...) are hashed bottom-up
+    from their outgoing statements in one linear pass; cycles are resolved by colour
+    refinement within their strongly connected component. With `incoming`, a final
+    refinement also takes the statements pointing at each blank node into account, and
+    blank nodes that remain indistinguishable are individualized one at a time (see
+    _individualize), so every label is unique and isomorphic graphs get the same labels.
+    Without it, blank nodes with the same content share a label.
+
+    :param graph: rdflib Graph (or any iterable of triples)
+    :param incoming: also use the statements whose object is the blank node
+    :return: dict mapping each BNode to a hex label
+    """
+    bnodes, out, inc = _adjacency(graph)
+    colours = {}
+    for component in _components(bnodes, out):
+        for node in component:
+            colours[node] = ''
+        if len(component) == 1 and not any(o == component[0] for _, o in out[component[0]]):
+            colours[component[0]] = _signature(component[0], out, inc, colours, False)
+        else:
+            _refine(component, out, inc, colours, False)
+
+    if not incoming:
+        return colours
+    if bnodes:
+        _refine(bnodes, out, inc, colours, True)
+    return _individualize(graph, bnodes, out, inc, colours)
+
+
+def _cells(bnodes, colours):
+    """ Blank nodes grouped by colour """
+    cells = defaultdict(list)
+    for node in bnodes:
+        cells[colours[node]].append(node)
+    return cells
+
+
+def _leaf(triples, colours):
+    """ Sorted statements of a discrete colouring, comparable between labellings """
+    return sorted(' '.join(_key(term, colours) for term in triple) for triple in triples)
+
+
+def _orbit_roots(cell, prefix, automorphisms):
+    """ Representative of every node of a cell under the automorphisms found that fix prefix """
+    parent = {node: node for node in cell}
+
+    def find(node):
+        while parent[node] != node:
+            parent[node] = parent[parent[node]]
+            node = parent[node]
+        return node
+
+    for mapping in automorphisms:
+        if all(mapping[node] == node for node in prefix):
+            for node in cell:
+                a, b = find(node), find(mapping[node])
+                if a != b:
+                    parent[max(a, b, key=str)] = min(a, b, key=str)
+    return find
+
+
+def _search(nodes, triples, out, inc, colours):
+    """
+    Break the remaining ties among the blank nodes of one component: individualize one node
+    of the first tied colour class, refine, and repeat until every node has its own colour,
+    over every choice of node, keeping the colouring whose relabelled statements sort first.
+    Choices that an automorphism found earlier maps onto an explored one give the same
+    results and are skipped.
+    """
+    best, best_colours, automorphisms = None, None, []
+    stack = [(colours, ())]
+    explored = {}
+    while stack:
+        current, prefix = stack.pop()
+        cells = _cells(nodes, current)
+        tied = sorted(colour for colour, members in cells.items() if len(members) > 1)
+        if not tied:
+            leaf = _leaf(triples, current)
+            if best is None or leaf < best:
+                best, best_colours = leaf, current
+            elif leaf == best:
+                owner = {best_colours[node]: node for node in nodes}
+                automorphisms.append({node: owner[current[node]] for node in nodes})
+            continue
+
+        cell = sorted(cells[tied[0]], key=str)
+        find = _orbit_roots(cell, prefix, automorphisms)
+        done = explored.setdefault(prefix, set())
+        for node in cell:
+            if find(node) in {find(other) for other in done}:
+                continue
+            done.add(node)
+            branch = dict(current)
+            branch[node] = _hash(branch[node] + '#')
+            _refine(nodes, out, inc, branch, True)
+            # Come back to this level after the branch, to try the next node with the automorphisms it found
+            stack.append((current, prefix))
+            stack.append((branch, prefix + (node,)))
+            break
+    return best, best_colours
+
+
+def _individualize(graph, bnodes, out, inc, colours):
+    """
+    Give every blank node a unique label once colour refinement is stable.
+
+    Ties are broken separately in every connected blank-node component (see _search), so
+    identical but unrelated structures are never searched against each other; isomorphic
+    components are then told apart by a rank, which does not depend on their ids either,
+    since swapping them leaves the graph unchanged.
+    """
+    parent = {node: node for node in bnodes}
+
+    def find(node):
+        while parent[node] != node:
+            parent[node] = parent[parent[node]]
+            node = parent[node]
+        return node
+
+    for s, _, o in graph:
+        if isinstance(s, BNode) and isinstance(o, BNode):
+            parent[find(s)] = find(o)
+    members, triples = defaultdict(list), defaultdict(list)
+    for node in bnodes:
+        members[find(node)].append(node)
+    for triple in graph:
+        node = triple[0] if isinstance(triple[0], BNode) else triple[2]
+        if isinstance(node, BNode):
+            triples[find(node)].append(triple)
+
+    groups = defaultdict(list)
+    for root, nodes in members.items():
+        local = {node: colours[node] for node in nodes}
+        if len(set(local.values())) < len(nodes):
+            leaf, local = _search(nodes, triples[root], out, inc, local)
+        else:
+            leaf = _leaf(triples[root], local)
+        groups[_hash('\n'.join(leaf))].append(local)
+
+    labels = {}
+    for key, components in groups.items():
+        for rank, local in enumerate(components):
+            for node, colour in local.items():
+                labels[node] = _hash(key + '#' + str(rank) + '|' + colour)
+    return labels
+
+
+def canonical_triples(graph, incoming=True):
+    """ Triples of a graph with every blank node renamed to its canonical label """
+    labels = canonical_labels(graph, incoming)
+    nodes = {b: BNode('c' + label[:32]) for b, label in labels.items()}
+    for s, p, o in graph:
+        yield nodes.get(s, s), p, nodes.get(o, o)
+
+
+def canonical_graph(graph, incoming=True):
+    """ Copy of a graph with canonical blank node labels """
+    g = Graph()
+    for triple in canonical_triples(graph, incoming):
+        g.add(triple)
+    return g
+
+
+def graph_digest(graph):
+    """ SHA-256 of a graph that is the same for isomorphic graphs, whatever their blank node ids """
+    digest = hashlib.sha256()
+    for line in sorted(nt_row(triple) for triple in canonical_triples(graph)):
+        digest.update(line.encode('utf-8'))
+    return digest.hexdigest()
+
+
+def semantic_diff(original_graph, reasoned_graph):
+    """
+    Triples added and removed between two graphs, matching blank nodes by structure.
+
+    Blank nodes are labelled from their outgoing statements only, so a restriction or list
+    that was merely re-serialized (new blank node ids) is not reported, and statements
+    pointing at an unchanged blank node are reported alone. A blank node whose own statements
+    changed is reported as a whole, since its content is its identity.
+
+    :return: (added, removed) sets of triples, blank nodes carrying canonical labels
+    """
+    original = set(canonical_triples(original_graph, incoming=False))
+    reasoned = set(canonical_triples(reasoned_graph, incoming=False))
+    return reasoned - original, original - reasoned
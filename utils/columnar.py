@@ -0,0 +1,126 @@
+import os
+import numpy as np
+from rdflib import Literal
+from rdflib.namespace import XSD
+from rdflib.util import from_n3
+from utils.rdf_terms import nt_term
+
+# Literal datatypes converted to numeric columns
+INTEGER_TYPES = {XSD.integer, XSD.int, XSD.long, XSD.short, XSD.byte, XSD.nonNegativeInteger,
+                 XSD.positiveInteger, XSD.nonPositiveInteger, XSD.negativeInteger,
+                 XSD.unsignedLong, XSD.unsignedInt, XSD.unsignedShort, XSD.unsignedByte}
+FLOAT_TYPES = {XSD.double, XSD.float, XSD.decimal}
+
+# Code of an unbound value in a dictionary-encoded column
+MISSING = -1
+
+
+def _column(values):
+    """
+    Convert one result column to (array, dictionary).
+
+    Numeric literals are parsed in bulk from their lexical forms: int64 when every value is
+    an integer, float64 otherwise (unbound values become NaN). Any other column, or a numeric
+    one holding an ill-typed lexical form, is dictionary-encoded as int32 codes into a sorted
+    array of the terms' N-Triples spellings (so IRIs, blank nodes and literals with their
+    datatype or language decode back to the same terms, see decode), MISSING for unbound.
+    """
+    datatypes = set(v.datatype if isinstance(v, Literal) else False for v in values if v is not None)
+    if datatypes and datatypes <= INTEGER_TYPES | FLOAT_TYPES:
+        try:
+            if datatypes <= INTEGER_TYPES and None not in values:
+                return np.array([str(v) for v in values]).astype(np.int64), None
+            lexical = np.array(['nan' if v is None else str(v) for v in values])
+            return lexical.astype(np.float64), None
+        except (ValueError, OverflowError):
+            pass
+
+    dictionary = sorted(set(nt_term(v) for v in values if v is not None))
+    codes = {text: i for i, text in enumerate(dictionary)}
+    column = np.fromiter((MISSING if v is None else codes[nt_term(v)] for v in values),
+                         dtype=np.int32, count=len(values))
+    return column, np.array(dictionary, dtype=str)
+
+
+def decode(column, dictionary):
+    """ rdflib terms of a dictionary-encoded column (None for unbound values) """
+    terms = [from_n3(str(text)) for text in dictionary]
+    return [None if code == MISSING else terms[code] for code in column.tolist()]
+
+
+def result_columns(result):
+    """
+    Turn a SELECT result into typed columns, one per projected variable.
+
+    :param result: rdflib SELECT Result (e.g. from QueryRegistry.run)
+    :return: (columns, dictionaries): {variable: ndarray} and, for the dictionary-encoded
+             columns (IRIs, strings), {variable: ndarray of N-Triples spellings} indexed by
+             the codes
+    """
+    rows = result.bindings
+    columns, dictionaries = {}, {}
+    for var in result.vars:
+        column, dictionary = _column([row.get(var) for row in rows])
+        columns[str(var)] = column
+        if dictionary is not None:
+            dictionaries[str(var)] = dictionary
+    return columns, dictionaries
+
+
+def to_structured(result):
+    """
+    SELECT result as a NumPy structured array (one field per variable) plus the dictionaries
+    of its encoded columns; see result_columns.
+    """
+    columns, dictionaries = result_columns(result)
+    dtype = [(name, column.dtype) for name, column in columns.items()]
+    array = np.empty(len(result.bindings), dtype=dtype)
+    for name, column in columns.items():
+        array[name] = column
+    return array, dictionaries
+
+
+def save_npz(result, output_path):
+    """
+    Save a SELECT result as .npz: one array per variable, and '<variable>_dictionary' for the
+    dictionary-encoded ones.
+    """
+    columns, dictionaries = result_columns(result)
+    arrays = dict(columns)
+    arrays.update((f'{name}_dictionary', dictionary) for name, dictionary in dictionaries.items())
+    np.savez(output_path, **arrays)
+    print(f"✅ {len(result.bindings)} rows saved to {output_path}")
+
+
+def save_parquet(result, output_path):
+    """
+    Save a SELECT result as Parquet (requires pyarrow). Encoded columns are written as
+    Arrow dictionary columns, unbound values as nulls.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ImportError("Parquet export requires pyarrow (pip install pyarrow); use save_npz instead")
+
+    columns, dictionaries = result_columns(result)
+    arrays = {}
+    for name, column in columns.items():
+        if name in dictionaries:
+            indices = pa.array(column, mask=column == MISSING)
+            arrays[name] = pa.DictionaryArray.from_arrays(indices, pa.array(dictionaries[name]))
+        else:
+            arrays[name] = pa.array(column, from_pandas=True)
+    pq.write_table(pa.table(arrays), output_path)
+    print(f"✅ {len(result.bindings)} rows saved to {output_path}")
+
+
+def export_results(result, output_path):
+    """ Save a SELECT result as .npz or .parquet, depending on the extension of output_path """
+    extension = os.path.splitext(output_path)[1].lower()
+    if extension == '.npz':
+        save_npz(result, output_path)
+    elif extension == '.parquet':
+        save_parquet(result, output_path)
+    else:
+        raise ValueError(f"Unsupported export format '{extension}' (use .npz or .parquet)")
@@ -1,37 +1,218 @@
+import hashlib
+import heapq
+import os
+import tempfile
+from collections import namedtuple
 from rdflib import Graph
+from rdflib.util import guess_format
+from utils.canonical import semantic_diff
+from utils.rdf_terms import nt_row
 
-def compare_graphs(original_file, reasoned_file):
+# Triples held in memory per sorted run while spilling a file to disk
+RUN_SIZE = 200000
+
+# Result of diff_graphs (sets of triples) and write_diff (counts of the written triples)
+GraphDiff = namedtuple('GraphDiff', 'added removed')
+
+
+def detect_format(path):
+    """ rdflib parser name for a file, from its extension or else from its first bytes """
+    file_format = guess_format(path)
+    if file_format:
+        return file_format
+    with open(path, 'rb') as f:
+        head = f.read(1024).lstrip()
+    if head.startswith(b'<?xml') or head.startswith(b'<rdf:RDF'):
+        return 'xml'
+    if head.startswith(b'{') or head.startswith(b'['):
+        return 'json-ld'
+    return 'turtle'
+
+
+class _RunWriter:
+    """ Collects N-Triples lines keyed by their hash and spills them as sorted runs """
+
+    def __init__(self, tmp_dir, prefix, run_size):
+        self.tmp_dir = tmp_dir
+        self.prefix = prefix
+        self.run_size = run_size
+        self.buffer = []
+        self.runs = []
+
+    def add(self, triple):
+        line = nt_row(triple)
+        key = hashlib.sha1(line.encode('utf-8')).hexdigest()
+        self.buffer.append(key + '\t' + line)
+        if len(self.buffer) >= self.run_size:
+            self.flush()
+
+    def flush(self):
+        if not self.buffer:
+            return
+        path = os.path.join(self.tmp_dir, f"{self.prefix}-{len(self.runs):05d}")
+        self.buffer.sort()
+        with open(path, 'w', encoding='utf-8') as f:
+            f.writelines(self.buffer)
+        self.runs.append(path)
+        self.buffer = []
+
+
+class _SpillGraph(Graph):
+    """ Parser sink that hands every parsed triple to a run writer instead of storing it """
+
+    def __init__(self, writer):
+        super().__init__()
+        self.writer = writer
+
+    def add(self, triple):
+        self.writer.add(triple)
+        return self
+
+
+def _sorted_runs(path, tmp_dir, prefix, run_size):
+    writer = _RunWriter(tmp_dir, prefix, run_size)
+    _SpillGraph(writer).parse(path, format=detect_format(path))
+    writer.flush()
+    return writer.runs
+
+
+def _merged(runs):
+    """ Merge sorted runs into one sorted stream of unique keyed lines """
+    files = [open(path, encoding='utf-8') for path in runs]
+    try:
+        previous = None
+        for entry in heapq.merge(*files):
+            if entry != previous:
+                yield entry
+                previous = entry
+    finally:
+        for f in files:
+            f.close()
+
+
+def stream_diff(original_file, reasoned_file, run_size=RUN_SIZE, tmp_dir=None):
     """
-    Compare two RDF graphs and print the triples that exist in the reasoned graph 
-    but not in the original graph.
+    Compare two RDF files with bounded memory.
 
-    :param original_file: Filename of the original ontology file (.ttl or .owl)
-    :param reasoned_file: Filename of the reasoned ontology file (.ttl or .owl)
+    Each file is parsed in its own format and spilled to disk as sorted runs of hashed
+    N-Triples lines; the two merged streams are then joined in a single pass.
+
+    :param original_file: original graph file (.ttl, .owl, .nt, ...)
+    :param reasoned_file: reasoned graph file
+    :param run_size: number of triples sorted in memory at a time
+    :param tmp_dir: directory for the runs (a temporary directory by default)
+    :return: generator of ('+' or '-', N-Triples line) in hash order
     """
-    # Load both graphs
-    original_graph = Graph()
-    reasoned_graph = Graph()
+    with tempfile.TemporaryDirectory(dir=tmp_dir) as work_dir:
+        left = _merged(_sorted_runs(original_file, work_dir, 'original', run_size))
+        right = _merged(_sorted_runs(reasoned_file, work_dir, 'reasoned', run_size))
+        a, b = next(left, None), next(right, None)
+        while a is not None or b is not None:
+            if b is None or (a is not None and a < b):
+                yield '-', a.split('\t', 1)[1]
+                a = next(left, None)
+            elif a is None or b < a:
+                yield '+', b.split('\t', 1)[1]
+                b = next(right, None)
+            else:
+                a, b = next(left, None), next(right, None)
 
-    # Determine file format based on extension
-    file_format = "turtle" if original_file.endswith(".ttl") else "xml"
 
-    # Parse both graphs
-    original_graph.parse(original_file, format=file_format)
-    reasoned_graph.parse(reasoned_file, format=file_format)
+def _parse_lines(lines):
+    """ Parse N-Triples lines in one go, so shared blank node labels stay the same node """
+    graph = Graph()
+    if lines:
+        graph.parse(data=''.join(lines), format='nt')
+    return graph
 
-    # Compute the difference (inferred triples)
-    inferred_triples = reasoned_graph - original_graph
+
+def diff_graphs(original_file, reasoned_file, run_size=RUN_SIZE, tmp_dir=None):
+    """
+    Triples added and removed between two RDF files, computed by stream_diff.
+
+    :return: GraphDiff(added, removed) of sets of triples
+    """
+    collected = {'+': [], '-': []}
+    for sign, line in stream_diff(original_file, reasoned_file, run_size, tmp_dir):
+        collected[sign].append(line)
+    return GraphDiff(set(_parse_lines(collected['+'])), set(_parse_lines(collected['-'])))
+
+
+def write_diff(original_file, reasoned_file, added_path, removed_path, run_size=RUN_SIZE, tmp_dir=None):
+    """
+    Write the triples added and removed between two RDF files to N-Triples files without
+    holding them in memory.
+
+    :param added_path: N-Triples file for the added triples
+    :param removed_path: N-Triples file for the removed triples
+    :return: GraphDiff(added, removed) of triple counts
+    """
+    counts = {'+': 0, '-': 0}
+    with open(added_path, 'w', encoding='utf-8') as added, open(removed_path, 'w', encoding='utf-8') as removed:
+        outputs = {'+': added, '-': removed}
+        for sign, line in stream_diff(original_file, reasoned_file, run_size, tmp_dir):
+            counts[sign] += 1
+            outputs[sign].write(line)
+    return GraphDiff(counts['+'], counts['-'])
+
+
+def _inferred_lines(original_file, reasoned_file, semantic):
+    """ N-Triples lines in the reasoned file but not in the original one """
+    if semantic:
+        original_graph = Graph()
+        reasoned_graph = Graph()
+        original_graph.parse(original_file, format=detect_format(original_file))
+        reasoned_graph.parse(reasoned_file, format=detect_format(reasoned_file))
+        added, _ = semantic_diff(original_graph, reasoned_graph)
+        return sorted(nt_row(triple) for triple in added)
+    return (line for sign, line in stream_diff(original_file, reasoned_file) if sign == '+')
+
+
+def _print_inferred(lines, limit, write):
+    """ Print the first `limit` inferred lines, hand every line to write and return their count """
+    count = 0
 
     # Print new inferred triples
     print("\n🔍 New Inferred Triples:")
-    if inferred_triples:
-        for subj, pred, obj in inferred_triples:
-            print(f"➕ {subj} {pred} {obj}")
-    else:
+    for line in lines:
+        count += 1
+        write(line)
+        if count <= limit:
+            print(f"➕ {line[:-3]}")
+
+    if count == 0:
         print("✅ No new inferred triples found.")
+    elif count > limit:
+        print(f"... {count - limit} more ({count} in total)")
+    return count
 
-    return inferred_triples
 
+def compare_graphs(original_file, reasoned_file, limit=20, semantic=False):
+    """
+    Compare two RDF graphs and print the triples that exist in the reasoned graph
+    but not in the original graph.
 
+    Both files are streamed (see stream_diff), each parsed in its own format.
+
+    :param original_file: Filename of the original ontology file (.ttl or .owl)
+    :param reasoned_file: Filename of the reasoned ontology file (.ttl or .owl)
+    :param limit: maximum number of inferred triples printed
+    :param semantic: match blank nodes by structure (utils.canonical.semantic_diff) so
+                     re-serialized restrictions and lists are not reported; loads both graphs
+    :return: Graph of the inferred triples
+    """
+    lines = []
+    _print_inferred(_inferred_lines(original_file, reasoned_file, semantic), limit, lines.append)
+    return _parse_lines(lines)
 
 
+def write_inferred(original_file, reasoned_file, output_path, limit=20, semantic=False):
+    """
+    Same comparison as compare_graphs, writing the inferred triples to an N-Triples file
+    instead of returning them, so large results never sit in memory.
+
+    :param output_path: N-Triples file receiving the inferred triples
+    :return: number of inferred triples
+    """
+    with open(output_path, 'w', encoding='utf-8') as output:
+        return _print_inferred(_inferred_lines(original_file, reasoned_file, semantic), limit, output.write)
@@ -0,0 +1,69 @@
+from collections import defaultdict, namedtuple
+from rdflib.namespace import RDF
+from fast_reason import as_graph
+from utils.subsumption import SubsumptionIndex
+
+# An individual typed (directly or through subclasses) with two classes declared disjoint,
+# with the rdf:type statements responsible for it
+Violation = namedtuple('Violation', 'individual cls other triples')
+
+
+def _explain(index, individual, types):
+    """ Disjoint class pairs reached by the asserted types of one individual """
+    found = {}
+    for a, (i, first) in enumerate(types):
+        for j, second in types[a:]:
+            if not index.excluded[i] & index.ancestors[j]:
+                continue
+            for pair in index.disjoint_pairs(first[2], second[2]):
+                if pair not in found:
+                    triples = tuple(sorted({first, second}))
+                    found[pair] = Violation(individual, index.classes[pair[0]], index.classes[pair[1]], triples)
+    return list(found.values())
+
+
+def find_violations(source, index=None):
+    """
+    Find every individual whose types fall under two disjoint classes, without a reasoner.
+
+    The rdf:type statements are read in one pass and grouped by individual; the superclasses
+    and the excluded classes of each individual are then OR-ed from the precomputed bitsets
+    of the index, so only individuals that actually clash are looked at further.
+
+    :param source: rdflib Graph or owlready2 World/Ontology holding the individuals
+    :param index: SubsumptionIndex of the ontology (e.g. utils.subsumption.ec1990_index());
+                  built from source when omitted
+    :return: list of Violation(individual, cls, other, triples), triples being the offending
+             rdf:type statements
+    """
+    graph = as_graph(source)
+    if index is None:
+        index = SubsumptionIndex(graph)
+
+    types = defaultdict(list)
+    for triple in graph.triples((None, RDF.type, None)):
+        i = index.ids.get(triple[2])
+        if i is not None:
+            types[triple[0]].append((i, triple))
+
+    violations = []
+    for individual, asserted in types.items():
+        ancestors = excluded = 0
+        for i, _ in asserted:
+            ancestors |= index.ancestors[i]
+            excluded |= index.excluded[i]
+        if ancestors & excluded:
+            violations.extend(_explain(index, individual, asserted))
+    return sorted(violations, key=lambda v: (str(v.individual), str(v.cls), str(v.other)))
+
+
+def print_violations(violations):
+    """ Print the disjointness violations found by find_violations """
+    if not violations:
+        print("✅ No disjointness violations found.")
+        return
+    print(f"❌ {len(violations)} disjointness violation(s) found:\n")
+    for violation in violations:
+        print(f"Inconsistent Individual: {violation.individual} is both {violation.cls} and {violation.other}")
+        for s, p, o in violation.triples:
+            print(f"    ⚠️ {s.n3()} {p.n3()} {o.n3()} .")
@@ -1,15 +1,169 @@
-from core.config import rdflibgraph
+from concurrent.futures import ProcessPoolExecutor
+from rdflib import Dataset, Graph
+from rdflib.util import guess_format
+import glob
+import os
+from utils.comparisons import detect_format
+from utils.hashing import file_hash
+from utils.rdf_terms import nt_row, read_nquads
 
-def convert_ttl_to_owl(input_ttl, output_owl):
+# Formats that can be written one statement per line, without holding the graph
+LINE_FORMATS = ('nt', 'nquads')
+
+# Formats carrying named graphs
+QUAD_FORMATS = ('nquads', 'trig')
+
+# File extension written for each output format
+EXTENSIONS = {'xml': '.owl', 'turtle': '.ttl', 'nt': '.nt', 'nquads': '.nq', 'json-ld': '.jsonld', 'n3': '.n3', 'trig': '.trig'}
+
+
+def _stamp_path(output_path):
+    return output_path + '.sha256'
+
+
+def _stamp(input_path, output_format):
+    return f"{file_hash(input_path)} {output_format}"
+
+
+def is_up_to_date(input_path, output_path, output_format):
+    """ True if output_path was produced from the current content of input_path in output_format """
+    stamp_path = _stamp_path(output_path)
+    if not (os.path.exists(output_path) and os.path.exists(stamp_path)):
+        return False
+    with open(stamp_path, encoding='utf-8') as f:
+        return f.read().strip() == _stamp(input_path, output_format)
+
+
+class _LineWriter(Graph):
+    """ Parser sink writing every parsed triple straight to an N-Triples/N-Quads file """
+
+    def __init__(self, output):
+        super().__init__()
+        self.output = output
+
+    def add(self, triple):
+        self.output.write(nt_row(triple))
+        return self
+
+
+def _stream(input_path, input_format, output, output_format):
+    """ Convert to a line-based format one statement at a time """
+    if input_format != 'nquads':
+        _LineWriter(output).parse(input_path, format=input_format)
+        return
+
+    def emit(triple, context):
+        line = nt_row(triple)
+        if output_format == 'nquads' and context is not None:
+            line = line[:-2] + context.n3() + ' .\n'
+        output.write(line)
+
+    read_nquads(input_path, emit)
+
+
+def convert(input_path, output_path, output_format=None, input_format=None, force=False):
+    """
+    Convert an RDF file to another serialization.
+
+    N-Triples and N-Quads outputs are streamed statement by statement; other outputs are
+    built in memory (named graphs are merged when writing a triple format). The output is
+    skipped when a .sha256 stamp next to it shows it was produced from the current input
+    content in the same format.
+
+    :param input_path: source file
+    :param output_path: destination file
+    :param output_format: rdflib format name (guessed from output_path when omitted)
+    :param input_format: rdflib format name (detected from input_path when omitted)
+    :param force: convert even when the output is up to date
+    :return: True if the file was converted, False if it was already up to date
+    """
+    input_format = input_format or detect_format(input_path)
+    output_format = output_format or detect_format(output_path)
+    if not force and is_up_to_date(input_path, output_path, output_format):
+        print(f"⏭️ Up to date: {output_path}")
+        return False
+
+    os.makedirs(os.path.dirname(output_path) or '.', exist_ok=True)
+    tmp_path = output_path + '.tmp'
+    try:
+        if output_format in LINE_FORMATS and input_format != 'trig':
+            with open(tmp_path, 'w', encoding='utf-8') as output:
+                _stream(input_path, input_format, output, output_format)
+        elif input_format in QUAD_FORMATS:
+            ds = Dataset()
+            ds.parse(input_path, format=input_format)
+            if output_format in QUAD_FORMATS:
+                ds.serialize(tmp_path, format=output_format, encoding='utf-8')
+            else:
+                # Triple formats get the union of the named graphs
+                g = Graph()
+                for s, p, o, _ in ds.quads():
+                    g.add((s, p, o))
+                g.serialize(tmp_path, format=output_format, encoding='utf-8')
+        else:
+            g = Graph()
+            g.parse(input_path, format=input_format)
+            g.serialize(tmp_path, format=output_format, encoding='utf-8')
+        os.replace(tmp_path, output_path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+    with open(_stamp_path(output_path), 'w', encoding='utf-8') as f:
+        f.write(_stamp(input_path, output_format))
+    print(f"✅ Converted: {input_path} → {output_path}")
+    return True
+
+
+def convert_ttl_to_owl(input_ttl, output_owl, force=False):
     """ Converts a TTL ontology to OWL (RDF/XML) format """
-    g = rdflibgraph()
-    g.parse(input_ttl, format="turtle")
-    g.serialize(output_owl, format="xml")
-    print(f"✅ Converted: {input_ttl} → {output_owl}")
+    return convert(input_ttl, output_owl, output_format="xml", input_format="turtle", force=force)
+
 
-def convert_owl_to_ttl(input_owl, output_ttl):
+def convert_owl_to_ttl(input_owl, output_ttl, force=False):
     """ Converts a OWL (RDF/XML) ontology to TTL format """
-    g = rdflibgraph()
-    g.parse(input_owl, format="xml")
-    g.serialize(output_ttl, format="turtle")
-    print(f"✅ Converted: {input_owl} → {output_ttl}")
\ No newline at end of file
+    return convert(input_owl, output_ttl, output_format="turtle", input_format="xml", force=force)
+
+
+def _convert_task(args):
+    return convert(*args)
+
+
+def convert_directory(source, output_dir, output_format="xml", max_workers=None, force=False):
+    """
+    Convert every file matched by a directory or glob pattern in a process pool.
+
+    Only files with an RDF extension known to rdflib are converted (diagrams, images and
+    .sha256 stamps next to the sources are left out). Outputs keep the sub-directory layout of
+    the inputs (relative to their common directory) and get the extension of output_format;
+    up-to-date outputs are skipped.
+
+    :param source: directory (all RDF files, recursively) or glob, e.g. "resources/Ontologies/**/*.ttl"
+    :param output_dir: directory receiving the converted files
+    :param output_format: rdflib format name of the outputs
+    :param max_workers: size of the process pool (defaults to the number of CPUs)
+    :param force: convert even the outputs that are up to date
+    :return: list of (input path, output path, converted) tuples
+    """
+    if os.path.isdir(source):
+        paths = glob.glob(os.path.join(source, '**', '*'), recursive=True)
+    else:
+        paths = glob.glob(source, recursive=True)
+    paths = sorted(p for p in paths if os.path.isfile(p) and guess_format(p) is not None)
+    if not paths:
+        return []
+
+    root = os.path.commonpath([os.path.dirname(os.path.abspath(p)) for p in paths])
+    tasks = []
+    for path in paths:
+        relative = os.path.relpath(os.path.abspath(path), root)
+        output_path = os.path.join(output_dir, os.path.splitext(relative)[0] + EXTENSIONS.get(output_format, '.' + output_format))
+        tasks.append((path, output_path, output_format, None, force))
+
+    max_workers = max_workers or os.cpu_count() or 1
+    if max_workers == 1 or len(tasks) == 1:
+        results = [_convert_task(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=min(max_workers, len(tasks))) as pool:
+            results = list(pool.map(_convert_task, tasks))
+    return [(task[0], task[1], converted) for task, converted in zip(tasks, results)]
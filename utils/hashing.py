@@ -0,0 +1,10 @@
+import hashlib
+
+
+def file_hash(path):
+    """ SHA-256 of a file's content, read in 1 MiB chunks """
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
@@ -0,0 +1,246 @@
+import numpy as np
+from bisect import bisect_left, bisect_right
+from rdflib import Graph
+from rdflib.store import Store
+
+# Pending additions merged into the sorted arrays at once
+FLUSH_SIZE = 65536
+
+# Column order of each index, as positions in (s, p, o)
+ORDERS = {'spo': (0, 1, 2), 'pos': (1, 2, 0), 'osp': (2, 0, 1)}
+
+_EMPTY = np.zeros(0, dtype=np.uint32)
+
+
+def _range(columns, keys, starts=None):
+    """ [lo, hi) rows of sorted columns whose leading values equal keys """
+    lo, hi = 0, len(columns[0])
+    for depth, (column, key) in enumerate(zip(columns, keys)):
+        if depth == 0 and starts is not None:
+            # Offsets of every id in the leading column, computed when the arrays were merged
+            if key + 1 >= len(starts):
+                return 0, 0
+            lo, hi = int(starts[key]), int(starts[key + 1])
+        elif hi - lo <= 64:
+            part = column[lo:hi].tolist()
+            lo, hi = lo + bisect_left(part, key), lo + bisect_right(part, key)
+        else:
+            part = column[lo:hi]
+            lo, hi = lo + int(np.searchsorted(part, key, 'left')), lo + int(np.searchsorted(part, key, 'right'))
+        if lo == hi:
+            break
+    return lo, hi
+
+
+class IntegerStore(Store):
+    """
+    Compact rdflib store for large instance graphs.
+
+    Terms are interned in a dictionary and replaced by integer ids; triples are kept as
+    three copies of uint32 columns sorted in SPO, POS and OSP order, so a triple costs
+    36 bytes plus its share of the (deduplicated) terms. Any triple pattern is answered
+    by binary searches on the index whose leading columns are bound.
+
+    Additions go to a small indexed pending set that is merged into the arrays every
+    FLUSH_SIZE triples, and removals are kept as tombstones until the next merge, so bulk
+    loads and the add/query cycles of the rule engine both stay cheap.
+
+    Use it through a Graph: Graph(store=IntegerStore()) (see integer_graph); queries,
+    rules and comparisons run on it unchanged. The store holds a single graph and
+    ignores contexts.
+    """
+
+    context_aware = False
+    formula_aware = False
+    transaction_aware = False
+    graph_aware = False
+
+    def __init__(self, configuration=None, identifier=None):
+        super().__init__(configuration)
+        self.identifier = identifier
+        self.terms = []
+        self.ids = {}
+        self.columns = {order: (_EMPTY, _EMPTY, _EMPTY) for order in ORDERS}
+        self.starts = {order: None for order in ORDERS}
+        self.pending = set()
+        self.pending_by = ({}, {}, {})
+        self.removed = set()
+        self._namespace = {}
+        self._prefix = {}
+
+    # Dictionary
+
+    def _intern(self, term):
+        i = self.ids.get(term)
+        if i is None:
+            i = self.ids[term] = len(self.terms)
+            self.terms.append(term)
+        return i
+
+    def _encode(self, pattern):
+        """ Ids of the bound terms of a pattern (None when unbound); False if a term is unknown """
+        ids = []
+        for term in pattern:
+            if term is None:
+                ids.append(None)
+            else:
+                i = self.ids.get(term)
+                if i is None:
+                    return False
+                ids.append(i)
+        return ids
+
+    # Sorted arrays
+
+    def _in_arrays(self, triple):
+        lo, hi = _range(self.columns['spo'], triple, self.starts['spo'])
+        return hi > lo
+
+    def flush(self):
+        """ Merge the pending additions and the tombstones into the sorted arrays """
+        if not self.pending and not self.removed:
+            return
+        s, p, o = self.columns['spo']
+        if self.removed:
+            dead = np.array(sorted(self.removed), dtype=np.uint32).reshape(-1, 3)
+            keep = np.ones(len(s), dtype=bool)
+            for row in dead.tolist():
+                lo, hi = _range((s, p, o), row, self.starts['spo'])
+                keep[lo:hi] = False
+            s, p, o = s[keep], p[keep], o[keep]
+            self.removed = set()
+        if self.pending:
+            added = np.array(list(self.pending), dtype=np.uint32).reshape(-1, 3)
+            s = np.concatenate((s, added[:, 0]))
+            p = np.concatenate((p, added[:, 1]))
+            o = np.concatenate((o, added[:, 2]))
+            self.pending = set()
+            self.pending_by = ({}, {}, {})
+        triple = (s, p, o)
+        ids = np.arange(len(self.terms) + 1, dtype=np.uint32)
+        for order, (a, b, c) in ORDERS.items():
+            rank = np.lexsort((triple[c], triple[b], triple[a]))
+            self.columns[order] = (triple[a][rank], triple[b][rank], triple[c][rank])
+            self.starts[order] = np.searchsorted(self.columns[order][0], ids).astype(np.uint32)
+
+    def _pending_matches(self, ids):
+        """ Pending additions matching a pattern of ids, looked up by the most selective bound term """
+        candidates = self.pending
+        for position, i in enumerate(ids):
+            if i is not None:
+                found = self.pending_by[position].get(i, ())
+                if len(found) < len(candidates):
+                    candidates = found
+        s, p, o = ids
+        return [t for t in candidates
+                if (s is None or t[0] == s) and (p is None or t[1] == p) and (o is None or t[2] == o)]
+
+    def _matches(self, ids):
+        """ Id triples matching a pattern of ids """
+        s, p, o = ids
+        if s is not None:
+            order, keys = ('spo', [s, p, o]) if p is not None or o is None else ('osp', [o, s])
+        elif p is not None:
+            order, keys = 'pos', [p, o]
+        elif o is not None:
+            order, keys = 'osp', [o]
+        else:
+            order, keys = 'spo', []
+        while keys and keys[-1] is None:
+            keys.pop()
+
+        columns = self.columns[order]
+        lo, hi = _range(columns, keys, self.starts[order]) if keys else (0, len(columns[0]))
+        if hi > lo:
+            # Columns back in (s, p, o) order
+            a, b, c = ORDERS[order]
+            by_position = {a: columns[0], b: columns[1], c: columns[2]}
+            rows = zip(*(by_position[k][lo:hi].tolist() for k in range(3)))
+            removed = self.removed
+            if removed:
+                rows = (row for row in rows if row not in removed)
+            yield from rows
+
+        if self.pending:
+            yield from self._pending_matches(ids)
+
+    # Store interface
+
+    def add(self, triple, context, quoted=False):
+        ids = (self._intern(triple[0]), self._intern(triple[1]), self._intern(triple[2]))
+        if ids in self.removed:
+            self.removed.discard(ids)
+        elif ids not in self.pending and not self._in_arrays(ids):
+            self.pending.add(ids)
+            for position, i in enumerate(ids):
+                self.pending_by[position].setdefault(i, set()).add(ids)
+            if len(self.pending) >= FLUSH_SIZE:
+                self.flush()
+
+    def addN(self, quads):
+        for s, p, o, c in quads:
+            self.add((s, p, o), c)
+
+    def remove(self, triple_pattern, context=None):
+        ids = self._encode(triple_pattern)
+        if ids is False:
+            return
+        for triple in list(self._matches(ids)):
+            if triple in self.pending:
+                self.pending.discard(triple)
+                for position, i in enumerate(triple):
+                    self.pending_by[position][i].discard(triple)
+            else:
+                self.removed.add(triple)
+        if len(self.removed) >= FLUSH_SIZE:
+            self.flush()
+
+    def triples(self, triple_pattern, context=None):
+        ids = self._encode(triple_pattern)
+        if ids is False:
+            return
+        terms = self.terms
+        for s, p, o in self._matches(ids):
+            yield (terms[s], terms[p], terms[o]), iter(())
+
+    def __len__(self, context=None):
+        return len(self.columns['spo'][0]) - len(self.removed) + len(self.pending)
+
+    def contexts(self, triple=None):
+        return iter(())
+
+    def bind(self, prefix, namespace, override=True):
+        bound_namespace = self._namespace.get(prefix)
+        bound_prefix = self._prefix.get(namespace)
+        if bound_prefix is None and bound_namespace is not None:
+            bound_prefix = self._prefix.get(bound_namespace)
+        if override:
+            if bound_prefix is not None:
+                self._namespace.pop(bound_prefix, None)
+            if bound_namespace is not None:
+                self._prefix.pop(bound_namespace, None)
+            self._prefix[namespace] = prefix
+            self._namespace[prefix] = namespace
+        else:
+            namespace = namespace if bound_namespace is None else bound_namespace
+            prefix = prefix if bound_prefix is None else bound_prefix
+            self._prefix[namespace] = prefix
+            self._namespace[prefix] = namespace
+
+    def namespace(self, prefix):
+        return self._namespace.get(prefix)
+
+    def prefix(self, namespace):
+        return self._prefix.get(namespace)
+
+    def namespaces(self):
+        return iter(list(self._namespace.items()))
+
+    def memory_usage(self):
+        """ Bytes held by the id arrays (the term dictionary is not included) """
+        return sum(column.nbytes for columns in self.columns.values() for column in columns)
+
+
+def integer_graph(identifier=None):
+    """ Empty rdflib Graph backed by an IntegerStore """
+    return Graph(store=IntegerStore(), identifier=identifier)
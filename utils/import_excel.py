@@ -1,6 +1,13 @@
-from rdflib import Graph, Namespace, Literal, URIRef, BNode
-import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
+from rdflib import Graph, Namespace, Literal, URIRef
+from openpyxl import load_workbook
+import glob
+import hashlib
+import json
 import os
+import shutil
+from utils.hashing import file_hash
+from utils.rdf_terms import nt_row
 
 # Get the directory of the current script
 script_dir = os.path.dirname(os.path.realpath(__file__))
@@ -9,17 +16,15 @@ script_dir = os.path.dirname(os.path.realpath(__file__))
 parent_dir = os.path.dirname(script_dir)
 
 # Define relative paths
-input_relative_path = 'resources\\External'
-output_relative_path = 'resources\\Graph_data'
+input_relative_path = os.path.join('resources', 'External')
+output_relative_path = os.path.join('resources', 'Graph_data')
 
 # Construct the full path to the file and the output path
 file_path = os.path.join(parent_dir, input_relative_path, 'concrete_data.xlsx')
 output_path = os.path.join(parent_dir, output_relative_path, 'test_data.ttl')
 
-
-
-# Create a new graph
-g = Graph()
+# Row fingerprints of the last incremental import, one state file per workbook
+state_dir = os.path.join(parent_dir, 'output')
 
 #ontology ref specification
 base_url = "https://random-url-to-your-data.com/data#"
@@ -43,74 +48,388 @@ SAREF = Namespace("https://w3id.org/saref#")
 MMO = Namespace("https://w3id.org/pmd/materials-mechanics-ontology/")
 OM = Namespace("http://www.ontology-of-units-of-measure.org/resource/om-2/")
 
-# Bind custom prefixes
-g.bind("conProp", C)
-g.bind("mat", MAT)
-g.bind("data", INST)
-g.bind('dot', DOT)
-g.bind('rdf', RDF)
-g.bind('rdfs', RDFS)
-g.bind('owl', OWL)
-g.bind('vann', VANN)
-g.bind('xsd', XSD)
-g.bind('cc', CC)
-g.bind('dce', DCE)
-g.bind("seas", SEAS)
-g.bind("saref", SAREF)
-g.bind("mmo", MMO)
-g.bind("om", OM)
-
-# Read Excel file
-
-poc = pd.read_excel(file_path, header=None, sheet_name="Properties of Components")
-cc = pd.read_excel(file_path, header=None, sheet_name="Concrete Composition")
-cmq = pd.read_excel(file_path, header=None, sheet_name="Concrete Mix Quantity")
-cp = pd.read_excel(file_path, header=None, sheet_name="Concrete Properties")
-
-#Add material properties to general components
-material_properties = poc[0]
-units = poc[1]
-for i in range(2,poc.shape[1]): 
-    component = INST[poc[i][1]]
-    g.add((component, RDF.type, C[poc[i][0]]))
-
-    for j in range(2,poc.shape[0]):
-        if not pd.isna(poc[i][j]):
-            material_property = INST[poc[i][1]+'-'+str(material_properties[j])]
-            g.add((material_property, RDF.type, MMO[material_properties[j]]))
-            g.add((component, C.hasMaterialProperty, material_property))
-            g.add((material_property, SAREF.hasValue, Literal(poc[i][j])))
-            g.add((material_property, OM.hasUnit , OM[units[j]]))
-
-#Create concrete types instances and link their components
-for i in range(cc.shape[1]):
-    concrete_name = cc[i][0]
-    print('🏢' + ' ' + concrete_name)
-    g.add((INST[concrete_name], RDF.type, MAT.Concrete))
-    for j in range(1,cc.shape[0]):
-        print(' 🧩' + ' ' + cc[i][j])     
-        g.add((INST[concrete_name], C.isMadeOfComponentMaterial, INST[cc[i][j]]))
-
-
-# Assign quantities to each  of the components of the concrete instances
-quantity_classes =  cmq[0]
-units = cmq[3]
-
-for i in range(1,cmq.shape[1]-1):
-    concrete_name = cmq[i][0]
-    for j in range(1, cmq.shape[0]):
-        if not pd.isna(cmq[i][j]):
-            component_quantity = INST[concrete_name+'-'+quantity_classes[j]]
-            g.add((component_quantity, RDF.type, C[quantity_classes[j]]))
-            g.add((INST[concrete_name], C.hasComponentQuantity, component_quantity))
-            g.add((component_quantity, SAREF.hasValue, Literal(cmq[i][j])))
-            g.add((component_quantity, OM.hasUnit, OM[units[j]]))      
-    for k in range(1,cp.shape[0]):
-        property_instance = INST[concrete_name+'-'+cp[0][k]]
-        g.add((property_instance, RDF.type, MMO[cp[0][k]]))
-        g.add((INST[concrete_name], C.hasMaterialProperty, property_instance))
-        g.add((property_instance, OM.hasUnit, OM[cp[1][k]]))
-
-
-g.serialize(destination= output_path , format ='turtle')
 
+def bind_prefixes(g):
+    """ Bind the custom prefixes used by the imported data """
+    g.bind("conProp", C)
+    g.bind("mat", MAT)
+    g.bind("data", INST)
+    g.bind('dot', DOT)
+    g.bind('rdf', RDF)
+    g.bind('rdfs', RDFS)
+    g.bind('owl', OWL)
+    g.bind('vann', VANN)
+    g.bind('xsd', XSD)
+    g.bind('cc', CC)
+    g.bind('dce', DCE)
+    g.bind("seas", SEAS)
+    g.bind("saref", SAREF)
+    g.bind("mmo", MMO)
+    g.bind("om", OM)
+    return g
+
+
+def components_header(headers, concretes):
+    """ "Properties of Components": component classes in row 0, component names in row 1 """
+    classes, names = headers
+    triples = [
+        (INST[names[i]], RDF.type, C[classes[i]])
+        for i in range(2, len(names)) if names[i] is not None
+    ]
+    return names, triples
+
+
+def components_row(names, row):
+    """ One material property per row: name, unit, then one value per component column """
+    material_property, unit = row[0], row[1]
+    if material_property is None:
+        return []
+    triples = []
+    for i in range(2, min(len(row), len(names))):
+        value = row[i]
+        if value is None or names[i] is None:
+            continue
+        component = INST[names[i]]
+        property_instance = INST[names[i] + '-' + str(material_property)]
+        triples.append((property_instance, RDF.type, MMO[material_property]))
+        triples.append((component, C.hasMaterialProperty, property_instance))
+        triples.append((property_instance, SAREF.hasValue, Literal(value)))
+        triples.append((property_instance, OM.hasUnit, OM[unit]))
+    return triples
+
+
+def composition_header(headers, concretes):
+    """ "Concrete Composition": one concrete per column, its name in row 0 """
+    names = headers[0]
+    triples = []
+    for concrete_name in names:
+        if concrete_name is not None:
+            print('🏢' + ' ' + concrete_name)
+            triples.append((INST[concrete_name], RDF.type, MAT.Concrete))
+    return names, triples
+
+
+def composition_row(names, row):
+    """ One component name per row and concrete column """
+    return [
+        (INST[concrete_name], C.isMadeOfComponentMaterial, INST[component_name])
+        for concrete_name, component_name in zip(names, row)
+        if concrete_name is not None and component_name is not None
+    ]
+
+
+def mix_quantity_header(headers, concretes):
+    """
+    "Concrete Mix Quantity": quantity class column, one column per concrete, then the units
+    column (the last filled header cell). The concrete names are appended to `concretes`.
+    """
+    header = headers[0]
+    filled = [i for i, cell in enumerate(header) if cell is not None]
+    units_column = filled[-1] if filled else 0
+    columns = [i for i in range(1, units_column) if header[i] is not None]
+    concretes.extend(header[i] for i in columns)
+    return (header, units_column, columns), []
+
+
+def mix_quantity_row(context, row):
+    """ One quantity per row: class, one value per concrete column, unit """
+    header, units_column, columns = context
+    quantity_class = row[0]
+    if quantity_class is None:
+        return []
+    unit = row[units_column] if units_column < len(row) else None
+    triples = []
+    for i in columns:
+        value = row[i] if i < len(row) else None
+        if value is None:
+            continue
+        component_quantity = INST[header[i] + '-' + quantity_class]
+        triples.append((component_quantity, RDF.type, C[quantity_class]))
+        triples.append((INST[header[i]], C.hasComponentQuantity, component_quantity))
+        triples.append((component_quantity, SAREF.hasValue, Literal(value)))
+        if unit is not None:
+            triples.append((component_quantity, OM.hasUnit, OM[unit]))
+    return triples
+
+
+def concrete_properties_header(headers, concretes):
+    """ "Concrete Properties": the properties are instantiated for every concrete of the mix sheet """
+    return list(concretes), []
+
+
+def concrete_properties_row(concretes, row):
+    """ One property per row (name, unit), as an empty property node of every concrete """
+    property_name, unit = row[0], row[1]
+    if property_name is None:
+        return []
+    triples = []
+    for concrete_name in concretes:
+        property_instance = INST[concrete_name + '-' + property_name]
+        triples.append((property_instance, RDF.type, MMO[property_name]))
+        triples.append((INST[concrete_name], C.hasMaterialProperty, property_instance))
+        triples.append((property_instance, OM.hasUnit, OM[unit]))
+    return triples
+
+
+# (sheet name, number of header rows, header reader, row reader), in the order they are read.
+# A header reader returns the context handed to the row reader plus the header triples.
+SHEET_READERS = (
+    ("Properties of Components", 2, components_header, components_row),
+    ("Concrete Composition", 1, composition_header, composition_row),
+    ("Concrete Mix Quantity", 1, mix_quantity_header, mix_quantity_row),
+    ("Concrete Properties", 1, concrete_properties_header, concrete_properties_row),
+)
+
+
+def sheet_rows(workbook, sheet_name):
+    """ Stream the cell values of a sheet row by row """
+    return workbook[sheet_name].iter_rows(values_only=True)
+
+
+def _header_rows(rows, count):
+    return [next(rows, ()) for _ in range(count)]
+
+
+def excel_triples(file_path=file_path):
+    """
+    Stream every triple of a concrete workbook without materializing the sheets.
+
+    Only the header rows (component, concrete and property names) are kept in memory.
+
+    :param file_path: Path of the .xlsx workbook
+    """
+    workbook = load_workbook(file_path, read_only=True, data_only=True)
+    try:
+        concretes = []
+        for sheet_name, header_count, read_header, read_row in SHEET_READERS:
+            rows = sheet_rows(workbook, sheet_name)
+            context, triples = read_header(_header_rows(rows, header_count), concretes)
+            yield from triples
+            for row in rows:
+                yield from read_row(context, row)
+    finally:
+        workbook.close()
+
+
+def import_excel(file_path=file_path, output_path=output_path, graph=None, batch_size=10000):
+    """
+    Import a concrete workbook into a graph, adding triples in bounded batches.
+
+    :param file_path: Path of the .xlsx workbook
+    :param output_path: Turtle file to write, or None to skip serialization
+    :param graph: Graph to add to (a new one is created if omitted)
+    :param batch_size: Number of triples handed to Graph.addN at once
+    :return: the populated Graph
+    """
+    g = bind_prefixes(Graph() if graph is None else graph)
+
+    batch = []
+    for s, p, o in excel_triples(file_path):
+        batch.append((s, p, o, g))
+        if len(batch) >= batch_size:
+            g.addN(batch)
+            batch = []
+    g.addN(batch)
+
+    if output_path is not None:
+        g.serialize(destination=output_path, format='turtle')
+    return g
+
+
+def find_workbooks(source):
+    """
+    Resolve a directory, a glob pattern or a list of paths to the workbooks to import.
+
+    Excel lock files (~$name.xlsx) are ignored.
+    """
+    if isinstance(source, (list, tuple)):
+        paths = list(source)
+    elif os.path.isdir(source):
+        paths = glob.glob(os.path.join(source, '*.xlsx'))
+    else:
+        paths = glob.glob(source)
+    return sorted(p for p in paths if not os.path.basename(p).startswith('~$'))
+
+
+def write_shard(file_path, shard_path):
+    """
+    Stream one workbook straight to an N-Triples file, without building a Graph.
+
+    :return: (shard_path, number of lines written)
+    """
+    count = 0
+    with open(shard_path, 'w', encoding='utf-8') as f:
+        for triple in excel_triples(file_path):
+            f.write(nt_row(triple))
+            count += 1
+    return shard_path, count
+
+
+def import_workbooks(source, output_dir, merged_path=None, turtle_path=None, max_workers=None):
+    """
+    Convert many workbooks in a process pool, one workbook per worker, each to its own
+    N-Triples shard. Shards are merged by plain concatenation.
+
+    :param source: directory, glob pattern or list of .xlsx paths
+    :param output_dir: directory receiving one <index>_<workbook>.nt shard per workbook
+    :param merged_path: concatenated N-Triples file, or None to keep only the shards
+    :param turtle_path: merged Turtle file (parses the merged data once), or None to skip
+    :param max_workers: size of the process pool (defaults to the number of CPUs)
+    :return: list of shard paths, in workbook order
+    """
+    workbooks = find_workbooks(source)
+    os.makedirs(output_dir, exist_ok=True)
+    shards = [
+        os.path.join(output_dir, f"{k:04d}_{os.path.splitext(os.path.basename(path))[0]}.nt")
+        for k, path in enumerate(workbooks)
+    ]
+    max_workers = max_workers or os.cpu_count() or 1
+
+    if max_workers == 1 or len(workbooks) <= 1:
+        results = [write_shard(path, shard) for path, shard in zip(workbooks, shards)]
+    else:
+        with ProcessPoolExecutor(max_workers=min(max_workers, len(workbooks))) as pool:
+            results = list(pool.map(write_shard, workbooks, shards))
+    print(f"✅ {len(workbooks)} workbook(s) converted to {sum(count for _, count in results)} triples")
+
+    if merged_path is not None or turtle_path is not None:
+        merged = merged_path or os.path.join(output_dir, 'merged.nt')
+        with open(merged, 'wb') as out:
+            for shard in shards:
+                with open(shard, 'rb') as f:
+                    shutil.copyfileobj(f, out)
+
+        if turtle_path is not None:
+            g = bind_prefixes(Graph())
+            g.parse(merged, format='nt')
+            g.serialize(destination=turtle_path, format='turtle')
+            print(f"✅ Merged graph saved to {turtle_path}")
+    return shards
+
+
+def _fingerprint(values):
+    return hashlib.sha1(repr(values).encode('utf-8')).hexdigest()
+
+
+def default_state_path(file_path):
+    """ State file of a workbook under output/, named after it and keyed on its absolute path """
+    name = os.path.splitext(os.path.basename(file_path))[0]
+    key = hashlib.sha1(os.path.abspath(file_path).encode('utf-8')).hexdigest()[:8]
+    return os.path.join(state_dir, f'{name}-{key}.import_state.json')
+
+
+def _parse_lines(lines):
+    g = Graph()
+    if lines:
+        g.parse(data=''.join(lines), format='nt')
+    return set(g)
+
+
+def write_patch(patch_path, added_lines, removed_lines):
+    """ Write a delta as an RDF Patch style file: 'D <triple> .' lines, then 'A <triple> .' lines """
+    with open(patch_path, 'w', encoding='utf-8') as f:
+        for line in sorted(removed_lines):
+            f.write('D ' + line)
+        for line in sorted(added_lines):
+            f.write('A ' + line)
+
+
+def apply_patch(graph, patch_path):
+    """
+    Apply a patch written by reimport_excel to a graph.
+
+    :return: (added, removed) sets of triples of the patch
+    """
+    added_lines, removed_lines = [], []
+    with open(patch_path, encoding='utf-8') as f:
+        for line in f:
+            if line.startswith('A '):
+                added_lines.append(line[2:])
+            elif line.startswith('D '):
+                removed_lines.append(line[2:])
+    added, removed = _parse_lines(added_lines), _parse_lines(removed_lines)
+    for triple in removed:
+        graph.remove(triple)
+    graph.addN((s, p, o, graph) for s, p, o in added)
+    return added, removed
+
+
+def reimport_excel(file_path=file_path, state_path=None, patch_path=None, graph=None):
+    """
+    Re-import a workbook and return only the triples that changed since the previous run.
+
+    The state file keeps, per sheet, a fingerprint of the header rows and one fingerprint per
+    data row together with the N-Triples lines that row produced. Rows whose fingerprint and
+    header are unchanged reuse their stored lines; only changed rows are converted again. A
+    triple is added or removed only when no row produces it any more (or produced it before),
+    so moving rows around yields an empty delta. Without a state file everything is added.
+
+    :param file_path: Path of the .xlsx workbook
+    :param state_path: JSON fingerprint file, rewritten after the import (defaults to
+                       default_state_path(file_path), so every workbook keeps its own)
+    :param patch_path: RDF Patch style file receiving the delta, or None
+    :param graph: Graph holding the previous import, updated in place if given
+    :return: (added, removed) sets of triples
+    """
+    state_path = state_path or default_state_path(file_path)
+    state = {}
+    if os.path.exists(state_path):
+        with open(state_path, encoding='utf-8') as f:
+            state = json.load(f)
+
+    workbook_hash = file_hash(file_path)
+    if state.get('workbook') == workbook_hash:
+        added_lines, removed_lines = set(), set()
+        new_sheets = state['sheets']
+    else:
+        old_sheets = state.get('sheets', {})
+        new_sheets = {}
+        workbook = load_workbook(file_path, read_only=True, data_only=True)
+        try:
+            concretes = []
+            for sheet_name, header_count, read_header, read_row in SHEET_READERS:
+                rows = sheet_rows(workbook, sheet_name)
+                headers = _header_rows(rows, header_count)
+                header_fingerprint = _fingerprint((headers, concretes))
+                context, triples = read_header(headers, concretes)
+
+                old = old_sheets.get(sheet_name, {})
+                reusable = old.get('rows', {}) if old.get('header') == header_fingerprint else {}
+                new_rows = {'header': [header_fingerprint, [nt_row(t) for t in triples]]}
+                for k, row in enumerate(rows, start=header_count):
+                    row_fingerprint = _fingerprint(row)
+                    previous = reusable.get(str(k))
+                    if previous is not None and previous[0] == row_fingerprint:
+                        new_rows[str(k)] = previous
+                    else:
+                        new_rows[str(k)] = [row_fingerprint, [nt_row(t) for t in read_row(context, row)]]
+                new_sheets[sheet_name] = {'header': header_fingerprint, 'rows': new_rows}
+        finally:
+            workbook.close()
+
+        def all_lines(sheets):
+            return {line for sheet in sheets.values() for _, lines in sheet['rows'].values() for line in lines}
+
+        old_lines, new_lines = all_lines(old_sheets), all_lines(new_sheets)
+        added_lines, removed_lines = new_lines - old_lines, old_lines - new_lines
+
+    tmp_path = state_path + '.tmp'
+    os.makedirs(os.path.dirname(state_path) or '.', exist_ok=True)
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump({'workbook': workbook_hash, 'sheets': new_sheets}, f)
+    os.replace(tmp_path, state_path)
+
+    if patch_path is not None:
+        write_patch(patch_path, added_lines, removed_lines)
+
+    added, removed = _parse_lines(added_lines), _parse_lines(removed_lines)
+    if graph is not None:
+        for triple in removed:
+            graph.remove(triple)
+        graph.addN((s, p, o, graph) for s, p, o in added)
+    print(f"✅ Incremental import: +{len(added)} / -{len(removed)} triples")
+    return added, removed
+
+
+if __name__ == '__main__':
+    import_excel()
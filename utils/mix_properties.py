@@ -0,0 +1,282 @@
+from collections import defaultdict, namedtuple
+from decimal import Decimal, InvalidOperation
+import numpy as np
+from rdflib import Namespace, Literal, URIRef, Variable
+from rdflib.namespace import RDF, XSD
+from utils.rule_engine import load_rules, evaluate_rule, apply_changes, merge_changes
+
+MAT = Namespace("http://bimerr.iot.linkeddata.es/def/material-properties#")
+MMO = Namespace("https://w3id.org/pmd/materials-mechanics-ontology/")
+SAREF = Namespace("https://w3id.org/saref#")
+BSO = Namespace("https://w3id.org/bso#")
+CPO = Namespace("https://w3id.org/cpo#")
+
+# Mass density is the plain sum of the quantities, in the order of SPARQL_MassDensity.sparql
+MASS_DENSITY_TERMS = (CPO.BinderQuantity, CPO.CoarseAggregateQuantity, CPO.FineAggregateQuantity, CPO.WaterQuantity)
+
+# (material class, quantity class) pairs of the weighted sums, in the order of each rule's BIND chain.
+# Note that the two rule files type the water component differently.
+WEIGHTED_TERMS = {
+    'SpecificHeat': ((CPO.CoarseAggregateMaterial, CPO.CoarseAggregateQuantity),
+                     (CPO.FineAggregateMaterial, CPO.FineAggregateQuantity),
+                     (CPO.Water, CPO.WaterQuantity),
+                     (CPO.BinderMaterial, CPO.BinderQuantity)),
+    'ThermalConductivity': ((CPO.CoarseAggregateMaterial, CPO.CoarseAggregateQuantity),
+                            (CPO.FineAggregateMaterial, CPO.FineAggregateQuantity),
+                            (MAT.Water, CPO.WaterQuantity),
+                            (CPO.BinderMaterial, CPO.BinderQuantity)),
+}
+
+RULE_NAMES = {
+    'MassDensity': 'SPARQL_MassDensity',
+    'SpecificHeat': 'SPARQL_SpecificHeat',
+    'ThermalConductivity': 'SPARQL_ThermalConductivity',
+    'ThermalExpansionCoefficient': 'SPARQL_ThermalExpansion',
+}
+
+# Largest magnitude for which integer products and sums stay exact in int64
+_INT_LIMIT = 2 ** 31
+
+# Column of numbers following rdflib's numeric promotion: `i` holds exact integer
+# (or integral decimal) values, `f` the double values, `is_float` says which one is live
+_Numbers = namedtuple('_Numbers', 'i f is_float')
+
+
+class _Fallback(Exception):
+    """ Raised while gathering a row the vectorized path cannot reproduce exactly """
+
+
+def _number(literal):
+    """ Return (value, is_float) for an xsd:integer or xsd:double literal """
+    if isinstance(literal, Literal):
+        if literal.datatype == XSD.integer:
+            value = int(literal.toPython())
+            if abs(value) < _INT_LIMIT:
+                return value, False
+        elif literal.datatype == XSD.double:
+            return float(literal.toPython()), True
+    raise _Fallback()
+
+
+def _numbers(column):
+    ints = np.array([0 if is_float else v for v, is_float in column], dtype=np.int64)
+    floats = np.array([v if is_float else 0.0 for v, is_float in column], dtype=np.float64)
+    is_float = np.array([is_float for _, is_float in column], dtype=bool)
+    return _Numbers(ints, floats, is_float)
+
+
+def _as_float(n):
+    return np.where(n.is_float, n.f, n.i.astype(np.float64))
+
+
+def _add(a, b):
+    """ a + b with rdflib semantics: exact while both sides are integral, double otherwise """
+    is_float = a.is_float | b.is_float
+    return _Numbers(np.where(is_float, 0, a.i + b.i), _as_float(a) + _as_float(b), is_float)
+
+
+def _multiply(q, factor):
+    """
+    q * factor with rdflib semantics. Rows pairing a double q with an integer factor are left
+    to SPARQL, so the product is a double exactly when the factor is one.
+    """
+    return _Numbers(np.where(factor.is_float, 0, q.i * factor.i), _as_float(q) * factor.f, factor.is_float)
+
+
+class _Index:
+    """ One-pass lookup tables over the predicates the rules traverse """
+
+    def __init__(self, graph):
+        self.graph = graph
+        self.types = defaultdict(set)
+        self.values = defaultdict(list)
+        self.quantities = defaultdict(list)
+        self.materials = defaultdict(list)
+        self.properties = defaultdict(list)
+        for s, o in graph.subject_objects(RDF.type):
+            self.types[s].add(o)
+        for s, o in graph.subject_objects(SAREF.hasValue):
+            self.values[s].append(o)
+        for s, o in graph.subject_objects(CPO.hasComponentQuantity):
+            self.quantities[s].append(o)
+        for s, o in graph.subject_objects(CPO.isMadeOfComponentMaterial):
+            self.materials[s].append(o)
+        for s, o in graph.subject_objects(BSO.hasMaterialProperty):
+            self.properties[s].append(o)
+
+    def one(self, nodes, cls):
+        """ The single node of a class, None if there is none; several means several solutions """
+        found = [n for n in nodes if cls in self.types[n]]
+        if len(found) > 1:
+            raise _Fallback()
+        return found[0] if found else None
+
+    def value(self, node):
+        values = self.values[node]
+        if not values:
+            return None
+        if len(values) > 1:
+            raise _Fallback()
+        return _number(values[0])
+
+    def property_value(self, owner, cls):
+        node = self.one(self.properties[owner], cls)
+        return None if node is None else self.value(node)
+
+
+def _property_changes(graph, concrete, name, value):
+    """ Instantiate the DELETE/INSERT templates for one derived property of one concrete """
+    node = URIRef(str(concrete) + '-' + name)
+    cls = MMO[name]
+    inserts = {(node, RDF.type, cls), (concrete, BSO.hasMaterialProperty, node)}
+    if value is not None:
+        inserts.add((node, SAREF.hasValue, value))
+    deletes = set()
+    if (concrete, BSO.hasMaterialProperty, node) in graph and (node, RDF.type, cls) in graph:
+        deletes = {(node, SAREF.hasValue, old) for old in graph.objects(node, SAREF.hasValue)}
+    return inserts, deletes
+
+
+def _mass_density(index):
+    rows, columns, fallback = [], [[] for _ in MASS_DENSITY_TERMS], []
+    for concrete in list(index.quantities):
+        try:
+            terms = []
+            for cls in MASS_DENSITY_TERMS:
+                node = index.one(index.quantities[concrete], cls)
+                value = None if node is None else index.value(node)
+                if value is None:
+                    break
+                terms.append(value)
+            else:
+                rows.append(concrete)
+                for column, term in zip(columns, terms):
+                    column.append(term)
+        except _Fallback:
+            fallback.append(concrete)
+
+    results = {}
+    if rows:
+        total = _numbers(columns[0])
+        for column in columns[1:]:
+            total = _add(total, _numbers(column))
+        for k, concrete in enumerate(rows):
+            if total.is_float[k]:
+                results[concrete] = Literal(float(total.f[k]), datatype=XSD.double)
+            else:
+                results[concrete] = Literal(int(total.i[k]), datatype=XSD.integer)
+    return results, fallback
+
+
+def _weighted_average(index, name):
+    terms = WEIGHTED_TERMS[name]
+    cls = MMO[name]
+    rows, quantities, factors, densities, fallback = [], [[] for _ in terms], [[] for _ in terms], [], []
+
+    for concrete in [s for s, types in index.types.items() if MAT.Concrete in types]:
+        try:
+            row_q, row_f = [], []
+            for material_cls, quantity_cls in terms:
+                material = index.one(index.materials[concrete], material_cls)
+                quantity = index.one(index.quantities[concrete], quantity_cls)
+                if material is None or quantity is None:
+                    break
+                q = index.value(quantity)
+                factor = index.property_value(material, cls)
+                if q is None or factor is None:
+                    break
+                # Decimal(double) * integer keeps 28 significant digits; leave it to SPARQL
+                if q[1] and not factor[1]:
+                    raise _Fallback()
+                row_q.append(q)
+                row_f.append(factor)
+            else:
+                density = index.property_value(concrete, MMO.MassDensity)
+                if density is None:
+                    continue
+                rows.append(concrete)
+                densities.append(density)
+                for k in range(len(terms)):
+                    quantities[k].append(row_q[k])
+                    factors[k].append(row_f[k])
+        except _Fallback:
+            fallback.append(concrete)
+
+    results = {}
+    if rows:
+        total = None
+        for q, factor in zip(quantities, factors):
+            product = _multiply(_numbers(q), _numbers(factor))
+            total = product if total is None else _add(total, product)
+        density = _numbers(densities)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            quotient = _as_float(total) / density.f
+
+        for k, concrete in enumerate(rows):
+            if density.is_float[k]:
+                # Division by 0.0 is a SPARQL error, which leaves the value unbound
+                results[concrete] = None if density.f[k] == 0 else Literal(float(quotient[k]))
+                continue
+            numerator = Decimal(float(total.f[k])) if total.is_float[k] else Decimal(int(total.i[k]))
+            try:
+                results[concrete] = Literal(numerator / int(density.i[k]))
+            except (InvalidOperation, ZeroDivisionError):
+                results[concrete] = None
+    return results, fallback
+
+
+def _thermal_expansion(index):
+    results = defaultdict(set)
+    for concrete, materials in index.materials.items():
+        for material in materials:
+            for node in index.properties[material]:
+                if MMO.ThermalExpansionCoefficient in index.types[node]:
+                    results[concrete].update(index.values[node])
+    return results
+
+
+def evaluate_concrete_properties(graph, rules=None):
+    """
+    Batch counterpart of the resources/Rules updates: computes mass density, specific heat,
+    thermal conductivity and thermal expansion for every concrete in vectorized passes and
+    writes the results back as saref:hasValue triples.
+
+    Values follow rdflib's SPARQL arithmetic exactly (integer, decimal and double promotion).
+    Concretes whose data would give several solutions, or that need decimal rounding the
+    arrays cannot reproduce, are handed to the SPARQL rule with ?C bound.
+
+    :param graph: rdflib Graph updated in place
+    :param rules: list of Rule objects used for the fallback (defaults to resources/Rules)
+    :return: (added, removed) net sets of triples changed
+    """
+    if rules is None:
+        rules = load_rules()
+    rules = {rule.name: rule for rule in rules}
+    total_added, total_removed = set(), set()
+    fallback_count = 0
+
+    def write(name, results, fallback):
+        inserts, deletes = set(), set()
+        for concrete, values in results.items():
+            values = values if isinstance(values, set) else [values]
+            for value in values:
+                rule_inserts, rule_deletes = _property_changes(graph, concrete, name, value)
+                inserts |= rule_inserts
+                deletes |= rule_deletes
+        for concrete in fallback:
+            rule_inserts, rule_deletes = evaluate_rule(graph, rules[RULE_NAMES[name]], {Variable('C'): concrete})
+            inserts |= rule_inserts
+            deletes |= rule_deletes
+        merge_changes(total_added, total_removed, *apply_changes(graph, inserts, deletes))
+        return len(fallback)
+
+    # Mass density feeds the two weighted averages, so it is written back first
+    fallback_count += write('MassDensity', *_mass_density(_Index(graph)))
+    index = _Index(graph)
+    fallback_count += write('SpecificHeat', *_weighted_average(index, 'SpecificHeat'))
+    fallback_count += write('ThermalConductivity', *_weighted_average(index, 'ThermalConductivity'))
+    fallback_count += write('ThermalExpansionCoefficient', _thermal_expansion(index), [])
+
+    print(f"✅ Concrete properties evaluated: +{len(total_added)} / -{len(total_removed)} triples "
+          f"({fallback_count} concrete(s) through SPARQL)")
+    return total_added, total_removed
@@ -0,0 +1,83 @@
+import glob
+import json
+import os
+from owlready2 import World
+from utils.hashing import file_hash
+from utils.quadstore_loader import load_ontology
+
+# Default locations of the sources and of the on-disk world
+script_dir = os.path.dirname(os.path.realpath(__file__))
+parent_dir = os.path.dirname(script_dir)
+WORLD_PATH = os.path.join(parent_dir, 'output', 'world.sqlite3')
+DEFAULT_SOURCES = sorted(glob.glob(os.path.join(parent_dir, 'resources', 'Ontologies', '**', '*.ttl'), recursive=True)) + \
+    [os.path.join(parent_dir, 'resources', 'Graph_data', 'test_data.ttl')]
+
+
+def _manifest_path(world_path):
+    return os.path.splitext(world_path)[0] + '.json'
+
+
+def _load_module(world, path):
+    """ Bulk-load one Turtle module into the world and return the base IRI it was stored under """
+    return load_ontology(path, world).base_iri
+
+
+def open_world(sources=None, world_path=WORLD_PATH):
+    """
+    Open the SQLite-backed owlready2 world kept under output/, bringing it up to date with
+    the source Turtle files.
+
+    A JSON manifest next to the world file records the SHA-256 of every source and the
+    ontology it was stored as. Unchanged sources are not parsed at all; a changed source has
+    its ontology destroyed and re-imported, and sources no longer listed are dropped. When
+    nothing changed, opening the world is just opening the SQLite file.
+
+    Facts added later (e.g. by a reasoner) are kept as long as their module is unchanged;
+    call save_world() to persist them.
+
+    :param sources: list of .ttl paths (defaults to resources/Ontologies and the test data)
+    :param world_path: SQLite file of the world
+    :return: owlready2 World
+    """
+    if sources is None:
+        sources = DEFAULT_SOURCES
+    manifest_path = _manifest_path(world_path)
+    manifest = {}
+    if os.path.exists(world_path) and os.path.exists(manifest_path):
+        with open(manifest_path, encoding='utf-8') as f:
+            manifest = json.load(f)
+    elif os.path.exists(world_path):
+        # A world without its manifest cannot be trusted; start again
+        os.remove(world_path)
+
+    os.makedirs(os.path.dirname(world_path) or '.', exist_ok=True)
+    world = World(filename=world_path)
+
+    wanted = {os.path.abspath(path): file_hash(path) for path in sources}
+    reloaded, dropped = [], []
+    for path in list(manifest):
+        if path not in wanted or manifest[path]['sha256'] != wanted[path]:
+            world.get_ontology(manifest[path]['iri']).destroy()
+            del manifest[path]
+            if path not in wanted:
+                dropped.append(os.path.basename(path))
+    for path, digest in wanted.items():
+        if path not in manifest:
+            manifest[path] = {'sha256': digest, 'iri': _load_module(world, path)}
+            reloaded.append(os.path.basename(path))
+
+    if reloaded or dropped:
+        world.save()
+        with open(manifest_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2)
+        changes = [f"{verb} {', '.join(names)}" for verb, names in (('re-imported', reloaded), ('dropped', dropped)) if names]
+        print(f"✅ World updated: {'; '.join(changes)}")
+    else:
+        print(f"✅ World reused from {world_path}")
+    return world
+
+
+def save_world(world):
+    """ Commit the world (including inferred facts) to its SQLite file """
+    world.save()
+    print(f"✅ World saved to {world.filename}")
@@ -0,0 +1,169 @@
+import glob
+import os
+from collections import defaultdict
+from rdflib import Variable
+from rdflib.namespace import RDF
+from rdflib.plugins.sparql import prepareQuery
+from rdflib.plugins.sparql.parserutils import CompValue
+from utils.query_registry import QUERIES_DIR
+
+
+def _bgp(node):
+    """ Triples of the only BGP under a query algebra node, or None if there is anything else to evaluate """
+    if not isinstance(node, CompValue):
+        return None
+    if node.name == 'BGP':
+        return list(node.triples)
+    if node.name in ('SelectQuery', 'Project'):
+        return _bgp(node.p)
+    return None
+
+
+class PropertyView:
+    """
+    Materialized result of a concrete property query of the shape
+
+        SELECT ?C ?V WHERE { ?C a <Material> . ?C <link> ?P . ?P a <Property> . ?P <value> ?V . }
+
+    (or SELECT ?C ?P, as Get_Concretes_ThermalConductivity does), kept as a table
+    {concrete: {property node: set of values}} so the rows are read back in O(result size)
+    instead of re-joining the graph.
+    """
+
+    def __init__(self, name, text):
+        self.name = name
+        query = prepareQuery(text)
+        triples = _bgp(query.algebra)
+        variables = list(query.algebra.get('PV', ()))
+        types = {s: o for s, p, o in triples or () if p == RDF.type and isinstance(s, Variable)}
+        edges = [t for t in triples or () if t[1] != RDF.type]
+        if len(variables) != 2 or len(edges) != 2 or len(types) != 2 or len(triples) != 4:
+            raise ValueError(f"Query {name} is not a concrete property lookup")
+
+        link_edge = next((t for t in edges if t[0] == variables[0]), None)
+        value_edge = next((t for t in edges if t is not link_edge), None)
+        if link_edge is None or link_edge[2] != value_edge[0] or variables[1] not in value_edge[::2] \
+                or link_edge[0] not in types or value_edge[0] not in types:
+            raise ValueError(f"Query {name} is not a concrete property lookup")
+
+        self.variables = variables
+        self.material = types[link_edge[0]]
+        self.link = link_edge[1]
+        self.property = types[value_edge[0]]
+        self.value = value_edge[1]
+        # Some queries project the property node instead of its value (one row per value all the same)
+        self.projects_node = variables[1] == value_edge[0]
+        self.table = defaultdict(dict)
+        self.owners = defaultdict(set)
+
+    def __repr__(self):
+        return f"PropertyView({self.name!r})"
+
+    def build(self, graph):
+        """ Fill the table from scratch with one scan of the value statements """
+        self.table.clear()
+        self.owners.clear()
+        for node in set(graph.subjects(self.value, None)):
+            for concrete in set(graph.subjects(self.link, node)):
+                self.refresh(graph, concrete, node)
+
+    def refresh(self, graph, concrete, node):
+        """ Recompute the values of one (concrete, property node) pair from the graph """
+        values = None
+        if (concrete, RDF.type, self.material) in graph and (concrete, self.link, node) in graph \
+                and (node, RDF.type, self.property) in graph:
+            values = set(graph.objects(node, self.value)) or None
+        if values:
+            self.table[concrete][node] = values
+            self.owners[node].add(concrete)
+        elif node in self.table.get(concrete, ()):
+            del self.table[concrete][node]
+            if not self.table[concrete]:
+                del self.table[concrete]
+            self.owners[node].discard(concrete)
+            if not self.owners[node]:
+                del self.owners[node]
+
+    def affected(self, graph, triple):
+        """ (concrete, property node) pairs whose rows may change with a triple """
+        s, p, o = triple
+        if p == self.value:
+            nodes = [s]
+        elif p == self.link:
+            return [(s, o)]
+        elif p == RDF.type and o == self.property:
+            nodes = [s]
+        elif p == RDF.type and o == self.material:
+            return [(s, node) for node in set(graph.objects(s, self.link)) | set(self.table.get(s, ()))]
+        else:
+            return []
+        return [(concrete, node) for node in nodes
+                for concrete in set(graph.subjects(self.link, node)) | self.owners.get(node, set())]
+
+    def rows(self, concrete=None):
+        """ Query rows as (concrete, value) tuples (or (concrete, property node)), optionally for one concrete only """
+        table = self.table if concrete is None else {concrete: self.table.get(concrete, {})}
+        if self.projects_node:
+            return [(c, node) for c, nodes in table.items() for node, values in nodes.items() for _ in values]
+        return [(c, value) for c, nodes in table.items() for values in nodes.values() for value in values]
+
+    def __len__(self):
+        return sum(len(values) for nodes in self.table.values() for values in nodes.values())
+
+
+class PropertyViews:
+    """
+    Materialized views of the concrete property queries of resources/Queries
+    (Get_Concretes_MassDensity, ..._SpecificHeat, ...), kept in step with the graph.
+
+    Pass apply as the on_change callback of the rule engine (run_rules or
+    run_rules_parallel): every insertion or deletion of a saref:hasValue statement (or of
+    the type and link statements it depends on) refreshes only the rows it touches.
+    Queries that do not have the concrete property shape are left out.
+    """
+
+    def __init__(self, graph, queries_dir=QUERIES_DIR):
+        self.graph = graph
+        self.views = {}
+        for path in sorted(glob.glob(os.path.join(queries_dir, '*.sparql'))):
+            name = os.path.splitext(os.path.basename(path))[0]
+            with open(path, encoding='utf-8') as f:
+                text = f.read()
+            try:
+                self.views[name] = PropertyView(name, text)
+            except ValueError:
+                continue
+        for view in self.views.values():
+            view.build(graph)
+
+    def names(self):
+        return sorted(self.views)
+
+    def __contains__(self, name):
+        return name in self.views
+
+    def apply(self, added, removed):
+        """
+        Bring the views up to date after triples were added to and removed from the graph.
+
+        :param added: triples added to the graph
+        :param removed: triples removed from the graph
+        """
+        for view in self.views.values():
+            pairs = set()
+            for triple in list(added) + list(removed):
+                pairs.update(view.affected(self.graph, triple))
+            for concrete, node in pairs:
+                view.refresh(self.graph, concrete, node)
+
+    def rows(self, name, concrete=None):
+        """
+        Rows of a view, as the query would return them.
+
+        :param name: query name (file name without extension)
+        :param concrete: optional concrete IRI to restrict the rows to
+        :return: list of (concrete, value) tuples
+        """
+        if name not in self.views:
+            raise KeyError(f"Unknown view '{name}'; available: {', '.join(self.names())}")
+        return self.views[name].rows(concrete)
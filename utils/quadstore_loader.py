@@ -0,0 +1,54 @@
+import os
+import tempfile
+from owlready2 import default_world
+from rdflib import Graph
+from utils.comparisons import detect_format
+from utils.rdf_terms import nt_row
+
+
+class _NTriplesSink(Graph):
+    """ Parser sink writing every parsed triple as an N-Triples line instead of storing it """
+
+    def __init__(self, output):
+        super().__init__()
+        self.output = output
+        self.count = 0
+
+    def add(self, triple):
+        self.output.write(nt_row(triple).encode('utf-8'))
+        self.count += 1
+        return self
+
+
+def load_ontology(path, world=None, iri=None, input_format=None):
+    """
+    Load an RDF file into an owlready2 world without going through RDF/XML.
+
+    N-Triples files are handed to owlready2's own N-Triples parser. Other formats (Turtle,
+    RDF/XML, ...) are parsed by rdflib and streamed as N-Triples into a temporary file,
+    without building an rdflib graph, which is then loaded with the public
+    Ontology.load(fileobj=..., format='ntriples'), so the ontology goes through the usual
+    owlready2 loading steps (ontology IRI from owl:Ontology, imports, properties).
+
+    :param path: source file (.ttl, .nt, .owl, ...)
+    :param world: owlready2 World (defaults to default_world)
+    :param iri: IRI of the ontology to load into (defaults to the file:// IRI of path)
+    :param input_format: rdflib format name (detected from path when omitted)
+    :return: the loaded owlready2 Ontology
+    """
+    world = world or default_world
+    input_format = input_format or detect_format(path)
+    onto = world.get_ontology(iri or 'file://' + os.path.abspath(path))
+    reload = onto.loaded
+
+    if input_format == 'nt':
+        with open(path, 'rb') as f:
+            return onto.load(fileobj=f, format='ntriples', reload=reload)
+
+    with tempfile.TemporaryFile() as f:
+        sink = _NTriplesSink(f)
+        sink.parse(path, format=input_format)
+        f.seek(0)
+        onto.load(fileobj=f, format='ntriples', reload=reload)
+    print(f"✅ Loaded {sink.count} triples from {path}")
+    return onto
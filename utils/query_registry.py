@@ -0,0 +1,116 @@
+import glob
+import hashlib
+import os
+import time
+from rdflib import Variable
+from rdflib.plugins.sparql import prepareQuery
+from utils.columnar import export_results
+
+# Default location of the SELECT queries
+script_dir = os.path.dirname(os.path.realpath(__file__))
+parent_dir = os.path.dirname(script_dir)
+QUERIES_DIR = os.path.join(parent_dir, 'resources', 'Queries')
+
+# Prepared queries keyed by the SHA-256 of their text, shared by every registry in the process.
+# Ad-hoc texts (e.g. from the SPARQL endpoint) go through the same cache, so it is bounded;
+# registries keep their own reference to the queries they registered.
+_COMPILED = {}
+COMPILED_SIZE = 256
+
+
+def prepare_query(text):
+    """
+    Parse and algebraize a SELECT/ASK/CONSTRUCT/DESCRIBE query through the process-wide cache.
+
+    :param text: SPARQL query text
+    :return: (SHA-256 of the text, prepared query, compile seconds); cached queries report
+             zero compile time
+    """
+    digest = hashlib.sha256(text.encode('utf-8')).hexdigest()
+    query = _COMPILED.get(digest)
+    if query is not None:
+        return digest, query, 0.0
+    start = time.perf_counter()
+    query = prepareQuery(text)
+    elapsed = time.perf_counter() - start
+    while len(_COMPILED) >= COMPILED_SIZE:
+        _COMPILED.pop(next(iter(_COMPILED)), None)
+    _COMPILED[digest] = query
+    return digest, query, elapsed
+
+
+class QueryRegistry:
+    """
+    Named, pre-compiled SPARQL queries loaded once from a directory.
+
+    Every query is parsed and algebraized a single time; runs only bind parameters and
+    evaluate. Compile and execution timings are kept per query.
+    """
+
+    def __init__(self, queries_dir=QUERIES_DIR):
+        self.queries_dir = queries_dir
+        self.queries = {}
+        self.timings = {}
+        for path in sorted(glob.glob(os.path.join(queries_dir, '*.sparql'))):
+            name = os.path.splitext(os.path.basename(path))[0]
+            with open(path, encoding='utf-8') as f:
+                self.register(name, f.read())
+
+    def register(self, name, text):
+        """ Add or replace a query; unchanged text reuses the cached compilation """
+        digest, query, elapsed = prepare_query(text)
+        self.queries[name] = (digest, query)
+        stats = self.timings.setdefault(name, {'compile': 0.0, 'executions': 0, 'execute': 0.0})
+        stats['compile'] += elapsed
+        return query
+
+    def names(self):
+        return sorted(self.queries)
+
+    def __contains__(self, name):
+        return name in self.queries
+
+    def run(self, name, graph, **bindings):
+        """
+        Evaluate a registered query.
+
+        :param name: query name (file name without extension)
+        :param graph: rdflib Graph to query
+        :param bindings: values for query variables, e.g. C=URIRef(...) to look up one concrete
+        :return: rdflib Result with its rows already materialized
+        """
+        if name not in self.queries:
+            raise KeyError(f"Unknown query '{name}'; available: {', '.join(self.names())}")
+        _, query = self.queries[name]
+        init = {Variable(k): v for k, v in bindings.items()}
+
+        start = time.perf_counter()
+        result = graph.query(query, initBindings=init)
+        result.bindings  # evaluate now so the timing covers the actual work
+        elapsed = time.perf_counter() - start
+
+        stats = self.timings[name]
+        stats['executions'] += 1
+        stats['execute'] += elapsed
+        return result
+
+    def export(self, name, graph, output_path, **bindings):
+        """
+        Evaluate a registered query and save its rows as typed columns (.npz or .parquet),
+        numeric values as float/int arrays and IRIs dictionary-encoded; see utils.columnar.
+
+        :return: the rdflib Result
+        """
+        result = self.run(name, graph, **bindings)
+        export_results(result, output_path)
+        return result
+
+    def report(self):
+        """ Print per-query compile time, execution count and mean execution time """
+        print("\n⏱️ Query timings:")
+        for name in self.names():
+            stats = self.timings[name]
+            mean = stats['execute'] / stats['executions'] if stats['executions'] else 0.0
+            print(f"  {name}: compile {stats['compile'] * 1000:.2f} ms, "
+                  f"{stats['executions']} run(s), mean {mean * 1000:.2f} ms")
+        return self.timings
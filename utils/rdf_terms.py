@@ -0,0 +1,101 @@
+from codecs import getreader
+from collections import defaultdict
+from rdflib import BNode, Literal
+from rdflib.collection import Collection
+from rdflib.plugins.parsers.nquads import NQuadsParser
+from rdflib.plugins.parsers.ntriples import ParseError, r_tail, r_wspace
+
+# Copies of the rdflib internals the pipeline relies on, taken from rdflib 7.1.1
+# (plugins/serializers/nt.py: _nt_row, _quoteLiteral, _quote_encode;
+# plugins/sparql/evalutils.py: _fillTemplate; plugins/parsers/nquads.py:
+# NQuadsParser.parseline). They are private and unpinned upstream, so they are kept here
+# rather than imported; the output is identical to 7.1.1's. _QuadReader is the only code
+# still relying on the parser's undocumented line-reading methods and patterns.
+
+
+def nt_literal(literal):
+    """ N-Triples spelling of a literal """
+    encoded = '"%s"' % literal.replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"').replace('\r', '\\r')
+    if literal.language:
+        if literal.datatype:
+            raise ValueError("Literal has datatype AND language!")
+        return '%s@%s' % (encoded, literal.language)
+    if literal.datatype:
+        return '%s^^<%s>' % (encoded, literal.datatype)
+    return encoded
+
+
+def nt_term(term):
+    """ N-Triples spelling of an IRI, blank node or literal """
+    return nt_literal(term) if isinstance(term, Literal) else term.n3()
+
+
+def nt_row(triple):
+    """ One N-Triples line, newline included """
+    return '%s %s %s .\n' % (triple[0].n3(), triple[1].n3(), nt_term(triple[2]))
+
+
+def read_list(graph, head):
+    """ Members of an RDF list (owl:members, owl:propertyChainAxiom, ...), empty if it is malformed """
+    try:
+        return list(Collection(graph, head))
+    except Exception:
+        return []
+
+
+def fill_template(template, solution):
+    """
+    Instantiate a DELETE/INSERT (or CONSTRUCT) template with one solution, with fresh blank
+    nodes per solution; statements with an unbound position are left out.
+    """
+    bnodes = defaultdict(BNode)
+    for triple in template:
+        terms = [bnodes[t] if isinstance(t, BNode) else solution.get(t) for t in triple]
+        if None not in terms:
+            yield tuple(terms)
+
+
+class _QuadReader(NQuadsParser):
+    """ N-Quads parser handing each statement to a callback instead of a store """
+
+    def __init__(self, emit):
+        super().__init__()
+        self.emit = emit
+
+    def read(self, path):
+        with open(path, 'rb') as f:
+            self.file = getreader('utf-8')(f)
+            self.buffer = ''
+            while True:
+                self.line = self.readline()
+                if self.line is None:
+                    break
+                self.parseline()
+
+    def parseline(self, bnode_context=None):
+        self.eat(r_wspace)
+        if (not self.line) or self.line.startswith('#'):
+            return
+        subject = self.subject(bnode_context)
+        self.eat(r_wspace)
+        predicate = self.predicate()
+        self.eat(r_wspace)
+        obj = self.object(bnode_context)
+        self.eat(r_wspace)
+        # uriref() and nodeid() return False when there is no graph term
+        context = self.uriref() or self.nodeid(bnode_context) or None
+        self.eat(r_tail)
+        if self.line:
+            raise ParseError("Trailing garbage")
+        self.emit((subject, predicate, obj), context)
+
+
+def read_nquads(path, emit):
+    """
+    Stream an N-Quads file statement by statement, without building a dataset.
+
+    :param path: .nq file
+    :param emit: callback called with (triple, context) for every statement, context being
+                 None for statements of the default graph
+    """
+    _QuadReader(emit).read(path)
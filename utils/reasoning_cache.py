@@ -0,0 +1,181 @@
+import hashlib
+import json
+import os
+import tempfile
+from rdflib import Graph
+from rdflib.util import guess_format
+from fast_reason import infer_triples
+from utils.canonical import graph_digest
+from utils.hashing import file_hash
+from utils.rdf_terms import nt_row
+
+# Default cache location and size bounds
+script_dir = os.path.dirname(os.path.realpath(__file__))
+parent_dir = os.path.dirname(script_dir)
+CACHE_DIR = os.path.join(parent_dir, 'output', 'reasoning_cache')
+MAX_BYTES = 64 * 1024 * 1024
+
+# File fingerprints remembered in the index, least recently used dropped first
+MAX_FINGERPRINTS = 4096
+
+
+def parse_file(path):
+    """ Parse an RDF file, picking the parser from its extension (Turtle for unknown ones) """
+    g = Graph()
+    g.parse(path, format=guess_format(path) or 'turtle')
+    return g
+
+
+class ReasoningCache:
+    """
+    On-disk cache of reasoning results keyed by the content of the inputs and the reasoner settings.
+
+    Every entry is an N-Triples file holding the inferred triples of one run. Entries are
+    evicted least recently used first once the cache exceeds max_bytes. The index maps the
+    SHA-256 of input files to their content fingerprint (utils.canonical.graph_digest, so
+    re-serialized files still hit), at most MAX_FINGERPRINTS of them, and keeps hit and miss
+    counters across processes. Each save merges into the index on disk and replaces it
+    atomically, so concurrent processes do not corrupt it.
+    """
+
+    def __init__(self, cache_dir=CACHE_DIR, max_bytes=MAX_BYTES):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        os.makedirs(cache_dir, exist_ok=True)
+        self.index_path = os.path.join(cache_dir, 'index.json')
+        self.index = self._read_index()
+        self._used = {}
+
+    @property
+    def hits(self):
+        return self.index['hits']
+
+    @property
+    def misses(self):
+        return self.index['misses']
+
+    def _read_index(self):
+        index = {'fingerprints': {}, 'hits': 0, 'misses': 0}
+        if os.path.exists(self.index_path):
+            with open(self.index_path, encoding='utf-8') as f:
+                index.update(json.load(f))
+        return index
+
+    def _write(self, path, write):
+        """ Write a file through a private temporary file renamed over it """
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                write(f)
+            os.replace(tmp_path, path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def _save_index(self, hits=0, misses=0):
+        """ Merge this process's counters and fingerprints into the index on disk """
+        index = self._read_index()
+        index['hits'] += hits
+        index['misses'] += misses
+        fingerprints = index['fingerprints']
+        for raw, fingerprint in self._used.items():
+            fingerprints.pop(raw, None)
+            fingerprints[raw] = fingerprint
+        for raw in list(fingerprints)[:max(0, len(fingerprints) - MAX_FINGERPRINTS)]:
+            del fingerprints[raw]
+        self._write(self.index_path, lambda f: json.dump(index, f))
+        self.index = index
+        self._used = {}
+
+    def fingerprint(self, path, graphs=None):
+        """
+        Content fingerprint of a file; byte-identical files are not parsed again.
+
+        :param path: RDF file
+        :param graphs: optional dict receiving the graph of path when it had to be parsed
+        """
+        raw = file_hash(path)
+        fingerprint = self._used.get(raw) or self.index['fingerprints'].get(raw)
+        if fingerprint is None:
+            graph = parse_file(path)
+            fingerprint = graph_digest(graph)
+            if graphs is not None:
+                graphs[path] = graph
+        self._used[raw] = fingerprint
+        return fingerprint
+
+    def key(self, paths, settings, graphs=None):
+        """
+        Cache key of a set of input files (order does not matter) and reasoner settings.
+
+        :param graphs: optional dict receiving the graphs parsed to fingerprint the files
+        """
+        digest = hashlib.sha256()
+        for fingerprint in sorted(self.fingerprint(path, graphs) for path in paths):
+            digest.update(fingerprint.encode('ascii'))
+        digest.update(json.dumps(settings, sort_keys=True, default=str).encode('utf-8'))
+        return digest.hexdigest()
+
+    def _entry_path(self, key):
+        return os.path.join(self.cache_dir, key + '.nt')
+
+    def get(self, key):
+        """ Inferred triples stored under a key, or None """
+        path = self._entry_path(key)
+        if not os.path.exists(path):
+            return None
+        os.utime(path)  # the modification time orders the entries for LRU eviction
+        g = Graph()
+        g.parse(path, format='nt')
+        return set(g)
+
+    def put(self, key, triples):
+        """ Store the inferred triples of a run, then evict old entries above the size bound """
+        self._write(self._entry_path(key), lambda f: f.writelines(nt_row(triple) for triple in sorted(triples)))
+        self.evict()
+
+    def evict(self):
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            if name.endswith('.nt'):
+                path = os.path.join(self.cache_dir, name)
+                stat = os.stat(path)
+                entries.append((stat.st_mtime, stat.st_size, path))
+        entries.sort()
+        total = sum(size for _, size, _ in entries)
+        # Never evict the most recent entry, even when it alone exceeds the bound
+        for _, size, path in entries[:-1]:
+            if total <= self.max_bytes:
+                break
+            os.remove(path)
+            total -= size
+
+    def reason(self, paths, reasoner=infer_triples, **settings):
+        """
+        Inferred triples of the union of the input files, from the cache when possible.
+
+        :param paths: ontology, data and rule files (.ttl, .owl, .nt, ...)
+        :param reasoner: callable taking an rdflib Graph and the settings, returning the
+                         set of inferred triples (defaults to fast_reason.infer_triples)
+        :param settings: keyword arguments passed to the reasoner, part of the cache key
+        :return: set of inferred triples
+        """
+        name = f"{getattr(reasoner, '__module__', '')}.{getattr(reasoner, '__qualname__', repr(reasoner))}"
+        graphs = {}
+        key = self.key(paths, {'reasoner': name, 'settings': settings}, graphs)
+
+        inferred = self.get(key)
+        if inferred is not None:
+            self._save_index(hits=1)
+            print(f"✅ Reasoning cache hit: {len(inferred)} inferred triples loaded")
+            return inferred
+
+        # Files parsed for their fingerprint are not parsed again
+        graph = Graph()
+        for path in paths:
+            graph += graphs[path] if path in graphs else parse_file(path)
+        inferred = reasoner(graph, **settings)
+        self.put(key, inferred)
+        self._save_index(misses=1)
+        print(f"✅ Reasoning cache miss: {len(inferred)} inferred triples stored")
+        return inferred
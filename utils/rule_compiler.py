@@ -0,0 +1,230 @@
+import threading
+from collections import defaultdict
+from contextlib import contextmanager
+from rdflib import Variable
+from rdflib.namespace import RDF
+from rdflib.plugins.sparql import CUSTOM_EVALS
+from rdflib.plugins.sparql.evaluate import evalBGP, evalPart
+from rdflib.plugins.sparql.parserutils import CompValue
+from utils.rule_engine import Rule
+
+# Compiled plans running OrderedBGP nodes, across threads (see ordered_bgp_evaluation)
+_ORDERED_USERS = 0
+_ORDERED_LOCK = threading.Lock()
+
+
+def _eval_ordered_bgp(ctx, part):
+    """
+    rdflib re-sorts every BGP by its number of unbound terms right before evaluating it, which
+    puts all ``?x a <Class>`` patterns first. Compiled plans use their own node so the
+    planned order is evaluated as is.
+    """
+    if part.name != "OrderedBGP":
+        raise NotImplementedError()
+    return evalBGP(ctx, part.triples)
+
+
+@contextmanager
+def ordered_bgp_evaluation():
+    """
+    Register the evaluation of OrderedBGP nodes with rdflib for the duration of the block.
+
+    rdflib tries every CUSTOM_EVALS entry on every algebra node of every query in the
+    process, so the entry is only present while compiled plans are being evaluated; nested
+    and concurrent blocks share one registration.
+    """
+    global _ORDERED_USERS
+    with _ORDERED_LOCK:
+        if _ORDERED_USERS == 0:
+            CUSTOM_EVALS['ordered_bgp'] = _eval_ordered_bgp
+        _ORDERED_USERS += 1
+    try:
+        yield
+    finally:
+        with _ORDERED_LOCK:
+            _ORDERED_USERS -= 1
+            if _ORDERED_USERS == 0:
+                CUSTOM_EVALS.pop('ordered_bgp', None)
+
+
+class GraphStatistics:
+    """ Predicate and class cardinalities used to estimate the selectivity of triple patterns """
+
+    def __init__(self, graph):
+        self.total = 0
+        self.predicates = defaultdict(int)
+        self.classes = defaultdict(int)
+        subjects = defaultdict(set)
+        objects = defaultdict(set)
+        for s, p, o in graph.triples((None, None, None)):
+            self.total += 1
+            self.predicates[p] += 1
+            subjects[p].add(s)
+            objects[p].add(o)
+            if p == RDF.type:
+                self.classes[o] += 1
+        self.distinct_subjects = {p: len(v) for p, v in subjects.items()}
+        self.distinct_objects = {p: len(v) for p, v in objects.items()}
+
+    def estimate(self, pattern, bound):
+        """ Estimated number of solutions of a triple pattern given the already bound variables """
+        s, p, o = pattern
+        s_bound = not isinstance(s, Variable) or s in bound
+        o_bound = not isinstance(o, Variable) or o in bound
+
+        if isinstance(p, Variable):
+            count = self.total
+            return 1 if s_bound and o_bound else count
+        if p == RDF.type and not isinstance(o, Variable):
+            return 1 if s_bound else self.classes.get(o, 0)
+
+        count = self.predicates.get(p, 0)
+        if s_bound and o_bound:
+            return min(count, 1)
+        if s_bound:
+            return count / max(self.distinct_subjects.get(p, 1), 1)
+        if o_bound:
+            return count / max(self.distinct_objects.get(p, 1), 1)
+        return count
+
+
+def _variables(triples):
+    return {t for triple in triples for t in triple if isinstance(t, Variable)}
+
+
+def order_patterns(triples, stats, bound=frozenset()):
+    """
+    Greedily order triple patterns so each step joins on an already bound variable and is
+    the cheapest such step according to the statistics. Cartesian steps are only taken when
+    no connected pattern is left.
+
+    :param triples: list of triple patterns
+    :param stats: GraphStatistics of the target graph
+    :param bound: variables bound before the patterns are evaluated
+    :return: reordered list of triple patterns
+    """
+    remaining = list(enumerate(triples))
+    bound = set(bound)
+    ordered = []
+    while remaining:
+        def cost(item):
+            index, pattern = item
+            connected = not bound or any(
+                t in bound for t in pattern if isinstance(t, Variable)
+            ) or not _variables([pattern])
+            return (not connected, stats.estimate(pattern, bound), index)
+
+        best = min(remaining, key=cost)
+        remaining.remove(best)
+        ordered.append(best[1])
+        bound |= _variables([best[1]])
+    return ordered
+
+
+def _certain(node):
+    """ Variables bound in every solution of an algebra node (assuming BIND expressions succeed) """
+    if not isinstance(node, CompValue):
+        return set()
+    if node.name == "BGP":
+        return _variables(node.triples)
+    if node.name == "Extend":
+        return _certain(node.p) | {node.var}
+    if node.name in ("LeftJoin", "Minus"):
+        return _certain(node.p1)
+    if node.name == "Join":
+        return _certain(node.p1) | _certain(node.p2)
+    if node.name in ("Filter", "ToMultiSet", "Project", "Distinct", "Reduced"):
+        return _certain(node.p)
+    if node.name == "Union":
+        return _certain(node.p1) & _certain(node.p2)
+    return set()
+
+
+def _bgp_triples(node):
+    """ Triples of a node made only of BGPs and joins of BGPs, or None for anything else """
+    if not isinstance(node, CompValue):
+        return None
+    if node.name == "BGP":
+        return list(node.triples)
+    if node.name == "Join":
+        left, right = _bgp_triples(node.p1), _bgp_triples(node.p2)
+        if left is not None and right is not None:
+            return left + right
+    return None
+
+
+def _is_redundant_optional(node):
+    """ An OPTIONAL without a filter that can bind no new variable does not change the solutions """
+    if node.name != "LeftJoin" or getattr(node.expr, "name", None) != "TrueFilter":
+        return False
+    triples = _bgp_triples(node.p2)
+    return triples is not None and _variables(triples) <= _certain(node.p1)
+
+
+def optimize_plan(node, stats, bound=frozenset()):
+    """
+    Return a copy of a WHERE algebra with every BGP reordered by selectivity and redundant
+    OPTIONAL blocks removed.
+
+    :param node: rdflib algebra node
+    :param stats: GraphStatistics of the target graph
+    :param bound: variables bound before the node is evaluated
+    """
+    if not isinstance(node, CompValue):
+        return node
+
+    if node.name == "LeftJoin" and _is_redundant_optional(node):
+        return optimize_plan(node.p1, stats, bound)
+
+    # A join of plain BGPs is one BGP; merging them lets the whole group be reordered
+    triples = _bgp_triples(node)
+    if triples is not None:
+        return CompValue("OrderedBGP", triples=order_patterns(triples, stats, bound))
+
+    node = node.clone()
+    if node.name == "LeftJoin":
+        # The optional side is evaluated once per solution of the mandatory side
+        node["p1"] = optimize_plan(node.p1, stats, bound)
+        node["p2"] = optimize_plan(node.p2, stats, set(bound) | _certain(node.p1))
+    else:
+        for key, value in list(node.items()):
+            if isinstance(value, CompValue) and key in ("p", "p1", "p2"):
+                node[key] = optimize_plan(value, stats, bound)
+    return node
+
+
+class CompiledRule(Rule):
+    """
+    Rule whose WHERE clause is re-planned against the statistics of a graph.
+
+    Plans are cached per set of pre-bound variables in the rule itself, so the cache lives
+    as long as the compiled rule set and holds at most one plan per subset of the rule's
+    bindable variables.
+    """
+
+    def __init__(self, rule, stats):
+        super().__init__(rule.name, rule.text, rule.path)
+        self.stats = stats
+        self.plans = {}
+
+    def plan(self, bound=frozenset()):
+        plan = self.plans.get(bound)
+        if plan is None:
+            plan = self.plans[bound] = optimize_plan(self.modify.where, self.stats, bound)
+        return plan
+
+    def solutions(self, ctx, bound=frozenset()):
+        with ordered_bgp_evaluation():
+            yield from evalPart(ctx, self.plan(bound))
+
+
+def compile_rules(rules, graph):
+    """
+    Compile rules against the current shape of a graph.
+
+    :param rules: list of Rule objects (e.g. from utils.rule_engine.load_rules)
+    :param graph: rdflib Graph the rules will run on
+    :return: list of CompiledRule objects, usable wherever a Rule is expected
+    """
+    stats = GraphStatistics(graph)
+    return [CompiledRule(rule, stats) for rule in rules]
@@ -0,0 +1,330 @@
+import glob
+import os
+from collections import defaultdict
+from rdflib import Variable, URIRef
+from rdflib.namespace import RDF
+from rdflib.plugins.sparql import prepareUpdate
+from rdflib.plugins.sparql.evaluate import evalPart
+from rdflib.plugins.sparql.parserutils import CompValue
+from rdflib.plugins.sparql.sparql import QueryContext
+from utils.rdf_terms import fill_template
+
+# Default location of the SPARQL UPDATE rules
+script_dir = os.path.dirname(os.path.realpath(__file__))
+parent_dir = os.path.dirname(script_dir)
+RULES_DIR = os.path.join(parent_dir, 'resources', 'Rules')
+
+
+class Rule:
+    """
+    A SPARQL DELETE/INSERT rule together with the triple signatures it reads and writes.
+
+    A signature is a (subject class, predicate, object class) tuple where None matches anything;
+    classes come from the ``?x a <Class>`` patterns of the rule.
+    """
+
+    def __init__(self, name, text, path=None):
+        self.name = name
+        self.text = text
+        self.path = path
+        self.update = prepareUpdate(text)
+
+        operations = [u for u in self.update.algebra if u.name == "Modify"]
+        if len(operations) != 1 or len(self.update.algebra) != 1:
+            raise ValueError(f"Rule {name} must contain exactly one DELETE/INSERT operation")
+        self.modify = operations[0]
+
+        self.required, self.optional = _split_patterns(self.modify.where)
+        self.delete_template = list(self.modify.delete.triples) if self.modify.delete else []
+        self.insert_template = list(self.modify.insert.triples) if self.modify.insert else []
+
+        where_classes = _variable_classes(self.required + self.optional)
+        template_classes = _variable_classes(self.insert_template)
+        for var, classes in where_classes.items():
+            template_classes[var] |= classes
+
+        self.reads = {_signature(t, where_classes) for t in self.required + self.optional}
+        self.writes = {_signature(t, template_classes) for t in self.delete_template + self.insert_template}
+
+        # Only plain BGP variables may be pre-bound; BIND targets must stay free
+        self.bindable = {v for t in self.required for v in t if isinstance(v, Variable)}
+
+    def __repr__(self):
+        return f"Rule({self.name!r})"
+
+    def plan(self, bound=frozenset()):
+        """ Algebra of the WHERE clause to evaluate when the given variables are pre-bound """
+        return self.modify.where
+
+    def solutions(self, ctx, bound=frozenset()):
+        """ Solutions of the WHERE clause in a query context whose given variables are pre-bound """
+        return evalPart(ctx, self.plan(bound))
+
+    def depends_on(self, other):
+        """ True if this rule reads a triple shape that the other rule writes """
+        return any(_overlaps(r, w) for r in self.reads for w in other.writes)
+
+    def reads_triple(self, triple):
+        """ True if a concrete triple could take part in this rule's WHERE clause """
+        return any(_match(pattern, triple) is not None for pattern in self.required)
+
+    def delta_bindings(self, triples):
+        """
+        Compute the distinct initial bindings obtained by joining the rule's required
+        patterns against a set of changed triples (the semi-naive delta).
+        """
+        bindings = set()
+        for triple in triples:
+            for pattern in self.required:
+                match = _match(pattern, triple)
+                if match:
+                    bindings.add(frozenset((k, v) for k, v in match.items() if k in self.bindable))
+        return [dict(b) for b in bindings]
+
+
+def _walk(node, optional=False):
+    """ Yield (triple pattern, is_optional) for every BGP triple under an algebra node """
+    if isinstance(node, CompValue):
+        if node.name == "BGP":
+            for triple in node.triples:
+                yield triple, optional
+            return
+        for key, value in node.items():
+            nested = optional or (node.name in ("LeftJoin", "Minus") and key == "p2")
+            yield from _walk(value, nested)
+    elif isinstance(node, (list, tuple)):
+        for value in node:
+            yield from _walk(value, optional)
+
+
+def _split_patterns(where):
+    required, optional = [], []
+    for triple, is_optional in _walk(where):
+        (optional if is_optional else required).append(triple)
+    return required, optional
+
+
+def _variable_classes(triples):
+    classes = defaultdict(set)
+    for s, p, o in triples:
+        if p == RDF.type and isinstance(s, Variable) and isinstance(o, URIRef):
+            classes[s].add(o)
+    return classes
+
+
+def _class_of(term, classes):
+    if isinstance(term, Variable):
+        found = classes.get(term)
+        return frozenset(found) if found else None
+    return None
+
+
+def _signature(triple, classes):
+    s, p, o = triple
+    predicate = None if isinstance(p, Variable) else p
+    if predicate == RDF.type and not isinstance(o, Variable):
+        return (None, predicate, frozenset([o]))
+    return (_class_of(s, classes), predicate, _class_of(o, classes))
+
+
+def _overlaps(a, b):
+    """ Two signatures overlap unless some position is set on both sides and disjoint """
+    for x, y in zip(a, b):
+        if x is None or y is None:
+            continue
+        if isinstance(x, frozenset):
+            if not x & y:
+                return False
+        elif x != y:
+            return False
+    return True
+
+
+def _match(pattern, triple):
+    """ Match a triple pattern against a concrete triple, returning the variable bindings or None """
+    bindings = {}
+    for term, value in zip(pattern, triple):
+        if isinstance(term, Variable):
+            if bindings.get(term, value) != value:
+                return None
+            bindings[term] = value
+        elif term != value:
+            return None
+    return bindings
+
+
+def load_rules(rules_dir=RULES_DIR):
+    """
+    Load every .sparql DELETE/INSERT rule from a directory.
+
+    :param rules_dir: Directory holding the rule files
+    :return: list of Rule objects sorted by name
+    """
+    rules = []
+    for path in sorted(glob.glob(os.path.join(rules_dir, '*.sparql'))):
+        with open(path, encoding='utf-8') as f:
+            text = f.read()
+        name = os.path.splitext(os.path.basename(path))[0]
+        rules.append(Rule(name, text, path))
+    return rules
+
+
+def rule_dependencies(rules):
+    """
+    Work out which rules read the output of which others.
+
+    :param rules: list of Rule objects
+    :return: dict mapping each rule name to the set of rule names it depends on
+    """
+    return {rule.name: {other.name for other in rules if rule.depends_on(other)} for rule in rules}
+
+
+def rule_strata(rules):
+    """
+    Group rules into strongly connected components listed in dependency order.
+
+    :param rules: list of Rule objects
+    :return: list of lists of Rule objects; every rule comes after the rules it depends on
+    """
+    by_name = {rule.name: rule for rule in rules}
+    depends = rule_dependencies(rules)
+
+    # Tarjan's algorithm emits components in reverse topological order of the
+    # "depends on" edges, i.e. dependencies first
+    index, low, stack, on_stack, strata = {}, {}, [], set(), []
+
+    def visit(name):
+        index[name] = low[name] = len(index)
+        stack.append(name)
+        on_stack.add(name)
+        for dep in sorted(depends[name]):
+            if dep not in index:
+                visit(dep)
+                low[name] = min(low[name], low[dep])
+            elif dep in on_stack:
+                low[name] = min(low[name], index[dep])
+        if low[name] == index[name]:
+            component = []
+            while True:
+                member = stack.pop()
+                on_stack.discard(member)
+                component.append(by_name[member])
+                if member == name:
+                    break
+            strata.append(sorted(component, key=lambda r: r.name))
+
+    for name in sorted(by_name):
+        if name not in index:
+            visit(name)
+    return strata
+
+
+def evaluate_rule(graph, rule, bindings=None):
+    """
+    Evaluate a rule's WHERE clause and instantiate its templates without touching the graph.
+
+    :param graph: rdflib Graph to read from
+    :param rule: Rule to evaluate
+    :param bindings: optional dict of Variable -> term used to seed the evaluation
+    :return: (triples to insert, triples to delete) as sets
+    """
+    ctx = QueryContext(graph, initBindings=bindings or {})
+    ctx.prologue = rule.modify.prologue
+    inserts, deletes = set(), set()
+    for solution in rule.solutions(ctx, frozenset(bindings or ())):
+        deletes.update(fill_template(rule.delete_template, solution))
+        inserts.update(fill_template(rule.insert_template, solution))
+    return inserts, deletes
+
+
+def apply_changes(graph, inserts, deletes):
+    """
+    Apply SPARQL 1.1 DELETE-then-INSERT semantics and return the net change.
+
+    :return: (added, removed) sets of triples that actually changed in the graph
+    """
+    removed = {t for t in deletes if t not in inserts and t in graph}
+    added = {t for t in inserts if t not in graph}
+    for triple in removed:
+        graph.remove(triple)
+    graph.addN((s, p, o, graph) for s, p, o in added)
+    return added, removed
+
+
+def merge_changes(total_added, total_removed, added, removed):
+    """ Fold one net change into running totals, cancelling additions that are later removed """
+    for triple in removed:
+        if triple in total_added:
+            total_added.discard(triple)
+        else:
+            total_removed.add(triple)
+    for triple in added:
+        if triple in total_removed:
+            total_removed.discard(triple)
+        else:
+            total_added.add(triple)
+
+
+def run_rules(graph, rules=None, changed=None, max_passes=100, on_change=None):
+    """
+    Run rules to a fixpoint with semi-naive evaluation.
+
+    Every rule is evaluated in full once, in dependency order. After that a rule is only
+    re-evaluated for the bindings produced by joining its required patterns against the
+    triples added since it last ran, so each pass only touches what changed.
+
+    :param graph: rdflib Graph updated in place
+    :param rules: list of Rule objects (defaults to every rule in resources/Rules)
+    :param changed: triples added to an already saturated graph; when given, the full
+        first pass is skipped and evaluation starts from this delta
+    :param max_passes: safety limit on the number of passes
+    :param on_change: optional callback called with (added, removed) after every change applied
+        to the graph, e.g. utils.property_views.PropertyViews.apply
+    :return: (added, removed) net sets of triples changed by the run
+    """
+    if rules is None:
+        rules = load_rules()
+    ordered = [rule for stratum in rule_strata(rules) for rule in stratum]
+    pending = {rule.name: set() for rule in ordered}
+    total_added, total_removed = set(), set()
+
+    def publish(added):
+        for rule in ordered:
+            pending[rule.name].update(t for t in added if rule.reads_triple(t))
+
+    if changed is not None:
+        publish(changed)
+    else:
+        # Naive first pass
+        for rule in ordered:
+            pending[rule.name].clear()
+            added, removed = apply_changes(graph, *evaluate_rule(graph, rule))
+            merge_changes(total_added, total_removed, added, removed)
+            if on_change is not None and (added or removed):
+                on_change(added, removed)
+            publish(added)
+
+    passes = 0 if changed is not None else 1
+    while any(pending.values()):
+        if passes >= max_passes:
+            raise RuntimeError(f"Rules did not reach a fixpoint after {max_passes} passes")
+        passes += 1
+        for rule in ordered:
+            delta = pending[rule.name]
+            if not delta:
+                continue
+            pending[rule.name] = set()
+            inserts, deletes = set(), set()
+            for bindings in rule.delta_bindings(delta):
+                rule_inserts, rule_deletes = evaluate_rule(graph, rule, bindings)
+                inserts |= rule_inserts
+                deletes |= rule_deletes
+            added, removed = apply_changes(graph, inserts, deletes)
+            merge_changes(total_added, total_removed, added, removed)
+            if on_change is not None and (added or removed):
+                on_change(added, removed)
+            publish(added)
+
+    print(f"✅ Rules reached a fixpoint after {passes} pass(es): "
+          f"+{len(total_added)} / -{len(total_removed)} triples")
+    return total_added, total_removed
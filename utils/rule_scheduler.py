@@ -0,0 +1,187 @@
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from rdflib import Graph
+from rdflib.store import Store
+from utils.rule_engine import Rule, load_rules, rule_dependencies, rule_strata, run_rules, merge_changes
+from utils.rule_compiler import compile_rules
+
+# Snapshot and rule texts installed in every worker process, and the number of merged
+# component changes already replayed on that snapshot
+_SNAPSHOT = None
+_RULE_TEXTS = None
+_APPLIED = 0
+
+
+def rule_levels(rules):
+    """
+    Build the rule DAG and split it into levels that can run concurrently.
+
+    Mutually recursive rules are collapsed into one component; a component lands one level
+    after the deepest component it depends on.
+
+    :param rules: list of Rule objects
+    :return: list of levels, each a list of components (lists of Rule objects)
+    """
+    depends = rule_dependencies(rules)
+    component_of = {}
+    level_of = {}
+    levels = []
+    for component in rule_strata(rules):
+        names = {rule.name for rule in component}
+        for name in names:
+            component_of[name] = id(component)
+        upstream = {component_of[dep] for name in names for dep in depends[name] if dep not in names}
+        level = max((level_of[c] for c in upstream), default=-1) + 1
+        level_of[id(component)] = level
+        while len(levels) <= level:
+            levels.append([])
+        levels[level].append(component)
+    return levels
+
+
+class _OverlayStore(Store):
+    """
+    rdflib Store reading through to a graph that is never written: triples added and removed
+    by a rule component are kept on the side, so the component sees its own changes without
+    copying the snapshot.
+    """
+
+    context_aware = False
+    formula_aware = False
+    transaction_aware = False
+    graph_aware = False
+
+    def __init__(self, base, configuration=None, identifier=None):
+        super().__init__(configuration)
+        self.base = base
+        self.added = Graph()
+        self.removed = set()
+
+    def add(self, triple, context, quoted=False):
+        if triple in self.removed:
+            self.removed.discard(triple)
+        elif triple not in self.base:
+            self.added.add(triple)
+
+    def remove(self, triple_pattern, context=None):
+        for triple in [t for t, _ in self.triples(triple_pattern)]:
+            if triple in self.added:
+                self.added.remove(triple)
+            else:
+                self.removed.add(triple)
+
+    def triples(self, triple_pattern, context=None):
+        for triple in self.base.triples(triple_pattern):
+            if triple not in self.removed:
+                yield triple, iter(())
+        for triple in self.added.triples(triple_pattern):
+            yield triple, iter(())
+
+    def __len__(self, context=None):
+        return len(self.base) - len(self.removed) + len(self.added)
+
+    def contexts(self, triple=None):
+        return iter(())
+
+
+def _init_worker(snapshot, rule_texts):
+    global _SNAPSHOT, _RULE_TEXTS, _APPLIED
+    if isinstance(snapshot, bytes):
+        graph = Graph()
+        graph.parse(data=snapshot, format='nt')
+        snapshot = graph
+    _SNAPSHOT = snapshot
+    _RULE_TEXTS = rule_texts
+    _APPLIED = 0
+
+
+def _run_component(snapshot, rule_texts, names, compile_plans):
+    """ Run one rule component to its own fixpoint over the snapshot, which is left untouched """
+    rules = [Rule(name, rule_texts[name]) for name in names]
+    if compile_plans:
+        rules = compile_rules(rules, snapshot)
+    return run_rules(Graph(store=_OverlayStore(snapshot)), rules)
+
+
+def _run_in_worker(names, compile_plans, changes):
+    """
+    Bring the worker's snapshot up to date with the changes merged since the pool started,
+    then run one component on it.
+
+    Replaying changes the snapshot already holds is harmless (the last change to a triple wins),
+    so workers forked after some levels ran end up in the same state as the others.
+    """
+    global _APPLIED
+    for added, removed in changes[_APPLIED:]:
+        _merge(_SNAPSHOT, added, removed)
+    _APPLIED = len(changes)
+    return _run_component(_SNAPSHOT, _RULE_TEXTS, names, compile_plans)
+
+
+def _merge(graph, added, removed):
+    """ Apply a component's net change in a deterministic order """
+    for triple in sorted(removed):
+        graph.remove(triple)
+    graph.addN((s, p, o, graph) for s, p, o in sorted(added))
+
+
+def run_rules_parallel(graph, rules=None, max_workers=None, compile_plans=True, on_change=None):
+    """
+    Run the rules level by level, evaluating independent rule components concurrently in a
+    process pool against a read-only snapshot of the graph taken before each level.
+
+    One pool serves the whole run: every task carries the component changes merged so far,
+    and each worker replays the ones it has not seen yet on its own snapshot.
+
+    :param graph: rdflib Graph updated in place
+    :param rules: list of Rule objects (defaults to every rule in resources/Rules)
+    :param max_workers: size of the process pool (defaults to the number of CPUs)
+    :param compile_plans: plan each rule against the snapshot with utils.rule_compiler
+    :param on_change: optional callback called with (added, removed) after each component's
+        change is merged into the graph
+    :return: (added, removed) net sets of triples changed
+    """
+    if rules is None:
+        rules = load_rules()
+    rule_texts = {rule.name: rule.text for rule in rules}
+    max_workers = max_workers or os.cpu_count() or 1
+    total_added, total_removed = set(), set()
+    levels = [sorted(sorted(rule.name for rule in component) for component in level)
+              for level in rule_levels(rules)]
+    widest = max((len(components) for components in levels), default=0)
+
+    pool = None
+    if widest > 1 and max_workers > 1:
+        # Forked workers inherit the snapshot for free; spawned ones get it as N-Triples
+        if 'fork' in multiprocessing.get_all_start_methods():
+            context = multiprocessing.get_context('fork')
+        else:
+            context = multiprocessing.get_context()
+        snapshot = graph if context.get_start_method() == 'fork' else \
+            graph.serialize(format='nt', encoding='utf-8')
+        pool = ProcessPoolExecutor(max_workers=min(max_workers, widest), mp_context=context,
+                                   initializer=_init_worker, initargs=(snapshot, rule_texts))
+    changes = []
+
+    try:
+        for components in levels:
+            if pool is None or len(components) == 1:
+                results = [_run_component(graph, rule_texts, names, compile_plans) for names in components]
+            else:
+                count = len(components)
+                results = list(pool.map(_run_in_worker, components, [compile_plans] * count, [changes] * count))
+
+            for added, removed in results:
+                _merge(graph, added, removed)
+                merge_changes(total_added, total_removed, added, removed)
+                if added or removed:
+                    changes.append((added, removed))
+                    if on_change is not None:
+                        on_change(added, removed)
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    print(f"✅ Parallel rule run completed: +{len(total_added)} / -{len(total_removed)} triples")
+    return total_added, total_removed
@@ -0,0 +1,276 @@
+import json
+import mmap
+import os
+import struct
+import numpy as np
+from rdflib import Graph
+from rdflib.store import Store
+from rdflib.util import from_n3
+from utils.comparisons import detect_format
+from utils.id_store import ORDERS, _range
+from utils.rdf_terms import nt_term
+
+# File signature and version of the snapshot format
+MAGIC = b'RDFSNAP1'
+
+# Sections are aligned so they can be mapped as NumPy arrays in place
+ALIGNMENT = 8
+
+
+def _encode(term):
+    """ N-Triples spelling of a term, as stored in the dictionary """
+    return nt_term(term).encode('utf-8')
+
+
+def _as_graph(source):
+    if isinstance(source, Graph):
+        return source
+    g = Graph()
+    g.parse(source, format=detect_format(source))
+    return g
+
+
+def write_snapshot(source, snapshot_path):
+    """
+    Write a graph as a binary snapshot: a sorted term dictionary plus sorted triple indexes.
+
+    Layout (little-endian): MAGIC, the length of a JSON header, the header, then 8-byte
+    aligned sections whose offsets are listed in the header:
+      - term_offsets: uint64[n_terms + 1] offsets of every term in term_data
+      - term_data: N-Triples spellings of the terms, sorted bytewise (a term's id is its rank)
+      - for each of spo, pos and osp: three uint32 columns sorted in that order, and
+        uint64[n_terms + 1] offsets of every id in the leading column
+
+    :param source: rdflib Graph, or an RDF file in any format rdflib reads
+    :param snapshot_path: destination file, e.g. output/reasoned_ontology.snap
+    :return: number of triples written
+    """
+    g = _as_graph(source)
+    encoded = {}
+    for triple in g:
+        for term in triple:
+            if term not in encoded:
+                encoded[term] = _encode(term)
+    terms = sorted(encoded, key=encoded.get)
+    ids = {term: i for i, term in enumerate(terms)}
+
+    spo = np.array([(ids[s], ids[p], ids[o]) for s, p, o in g], dtype=np.uint32).reshape(-1, 3)
+    blobs = [encoded[term] for term in terms]
+    term_offsets = np.zeros(len(blobs) + 1, dtype=np.uint64)
+    np.cumsum([len(blob) for blob in blobs], out=term_offsets[1:])
+
+    sections = [('term_offsets', term_offsets), ('term_data', b''.join(blobs))]
+    all_ids = np.arange(len(terms) + 1, dtype=np.uint32)
+    for order, (a, b, c) in ORDERS.items():
+        rank = np.lexsort((spo[:, c], spo[:, b], spo[:, a]))
+        columns = [np.ascontiguousarray(spo[rank, k]) for k in (a, b, c)]
+        for k, column in enumerate(columns):
+            sections.append((f'{order}{k}', column))
+        sections.append((f'{order}_starts', np.searchsorted(columns[0], all_ids).astype(np.uint64)))
+
+    header = {
+        'version': 1,
+        'terms': len(terms),
+        'triples': len(spo),
+        'namespaces': [[prefix, str(namespace)] for prefix, namespace in g.namespaces()],
+        'sections': {},
+    }
+    relative = {}
+    offset = 0
+    for name, data in sections:
+        size = data.nbytes if isinstance(data, np.ndarray) else len(data)
+        dtype = data.dtype.str if isinstance(data, np.ndarray) else '|u1'
+        relative[name] = (offset, size, dtype)
+        offset += size + (-size % ALIGNMENT)
+    # Offsets depend on the header length, which depends on the offsets: grow the reserved
+    # space until the header written with absolute offsets fits in it
+    start = 0
+    while True:
+        header['sections'] = {name: [start + offset, size, dtype] for name, (offset, size, dtype) in relative.items()}
+        raw = json.dumps(header).encode('utf-8')
+        needed = len(MAGIC) + 8 + len(raw)
+        needed += -needed % ALIGNMENT
+        if needed <= start:
+            break
+        start = needed
+    raw = raw.ljust(start - len(MAGIC) - 8)
+    assert len(MAGIC) + 8 + len(raw) == start
+
+    tmp_path = snapshot_path + '.tmp'
+    os.makedirs(os.path.dirname(snapshot_path) or '.', exist_ok=True)
+    with open(tmp_path, 'wb') as f:
+        f.write(MAGIC)
+        f.write(struct.pack('<Q', len(raw)))
+        f.write(raw)
+        for name, data in sections:
+            f.write(data.tobytes() if isinstance(data, np.ndarray) else data)
+            f.write(b'\0' * (-f.tell() % ALIGNMENT))
+    os.replace(tmp_path, snapshot_path)
+    print(f"✅ Snapshot written: {snapshot_path} ({len(spo)} triples, {len(terms)} terms)")
+    return len(spo)
+
+
+class Snapshot:
+    """
+    Read-only, memory-mapped view of a snapshot written by write_snapshot.
+
+    Nothing is loaded up front: the index arrays are NumPy views over the mapping, terms
+    are found by binary search in the sorted dictionary and decoded only when a matching
+    triple is returned. Processes opening the same file share its pages through the OS
+    page cache.
+    """
+
+    def __init__(self, snapshot_path):
+        self.path = snapshot_path
+        self._file = open(snapshot_path, 'rb')
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._map[:len(MAGIC)] != MAGIC:
+            self.close()
+            raise ValueError(f"{snapshot_path} is not an RDF snapshot")
+        (size,) = struct.unpack_from('<Q', self._map, len(MAGIC))
+        start = len(MAGIC) + 8
+        self.header = json.loads(bytes(self._map[start:start + size]))
+        self.sections = {}
+        for name, (offset, nbytes, dtype) in self.header['sections'].items():
+            dtype = np.dtype(dtype)
+            self.sections[name] = np.frombuffer(self._map, dtype=dtype, count=nbytes // dtype.itemsize, offset=offset)
+        self.offsets = self.sections['term_offsets']
+        self.data_start = self.header['sections']['term_data'][0]
+        self.columns = {order: tuple(self.sections[f'{order}{k}'] for k in range(3)) for order in ORDERS}
+        self.starts = {order: self.sections[f'{order}_starts'] for order in ORDERS}
+        self._terms = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self.sections = self.columns = self.starts = self.offsets = None
+        if self._map is not None:
+            try:
+                self._map.close()
+            except BufferError:
+                pass  # arrays handed out to callers still reference the mapping
+            self._map = None
+        self._file.close()
+
+    def __len__(self):
+        return self.header['triples']
+
+    def _bytes(self, i):
+        return self._map[self.data_start + int(self.offsets[i]):self.data_start + int(self.offsets[i + 1])]
+
+    def term(self, i):
+        """ rdflib term of an id """
+        term = self._terms.get(i)
+        if term is None:
+            term = self._terms[i] = from_n3(self._bytes(i).decode('utf-8'))
+        return term
+
+    def lookup(self, term):
+        """ Id of a term, or None if the snapshot does not contain it """
+        key = _encode(term)
+        lo, hi = 0, self.header['terms']
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._bytes(mid) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo if lo < self.header['terms'] and self._bytes(lo) == key else None
+
+    def triple_ids(self, ids):
+        """ Id triples matching a pattern of ids (None when unbound) """
+        s, p, o = ids
+        if s is not None:
+            order, keys = ('spo', [s, p, o]) if p is not None or o is None else ('osp', [o, s])
+        elif p is not None:
+            order, keys = 'pos', [p, o]
+        elif o is not None:
+            order, keys = 'osp', [o]
+        else:
+            order, keys = 'spo', []
+        while keys and keys[-1] is None:
+            keys.pop()
+
+        columns = self.columns[order]
+        lo, hi = _range(columns, keys, self.starts[order]) if keys else (0, len(columns[0]))
+        a, b, c = ORDERS[order]
+        by_position = {a: columns[0], b: columns[1], c: columns[2]}
+        # Decode in bounded chunks so a full scan never materializes the whole index
+        for chunk in range(lo, hi, 65536):
+            end = min(chunk + 65536, hi)
+            yield from zip(*(by_position[k][chunk:end].tolist() for k in range(3)))
+
+    def triples(self, pattern):
+        """ rdflib triples matching a (s, p, o) pattern, None being a wildcard """
+        ids = []
+        for term in pattern:
+            i = None if term is None else self.lookup(term)
+            if term is not None and i is None:
+                return
+            ids.append(i)
+        term = self.term
+        for s, p, o in self.triple_ids(ids):
+            yield term(s), term(p), term(o)
+
+    def graph(self):
+        """ Read-only rdflib Graph over the snapshot, for SPARQL queries and other Graph consumers """
+        g = Graph(store=SnapshotStore(self))
+        for prefix, namespace in self.header['namespaces']:
+            g.bind(prefix, namespace)
+        return g
+
+
+class SnapshotStore(Store):
+    """ rdflib Store answering triple patterns from a Snapshot; writes are refused """
+
+    context_aware = False
+    formula_aware = False
+    transaction_aware = False
+    graph_aware = False
+
+    def __init__(self, snapshot, configuration=None, identifier=None):
+        super().__init__(configuration)
+        self.snapshot = snapshot
+        self.identifier = identifier
+        self._namespace = {}
+        self._prefix = {}
+
+    def add(self, triple, context, quoted=False):
+        raise TypeError("Snapshots are read-only")
+
+    def remove(self, triple_pattern, context=None):
+        raise TypeError("Snapshots are read-only")
+
+    def triples(self, triple_pattern, context=None):
+        for triple in self.snapshot.triples(triple_pattern):
+            yield triple, iter(())
+
+    def __len__(self, context=None):
+        return len(self.snapshot)
+
+    def contexts(self, triple=None):
+        return iter(())
+
+    def bind(self, prefix, namespace, override=True):
+        if override or prefix not in self._namespace:
+            self._prefix.pop(self._namespace.get(prefix), None)
+            self._namespace[prefix] = namespace
+            self._prefix[namespace] = prefix
+
+    def namespace(self, prefix):
+        return self._namespace.get(prefix)
+
+    def prefix(self, namespace):
+        return self._prefix.get(namespace)
+
+    def namespaces(self):
+        return iter(list(self._namespace.items()))
+
+
+def open_snapshot(snapshot_path):
+    """ Read-only rdflib Graph over a snapshot file """
+    return Snapshot(snapshot_path).graph()
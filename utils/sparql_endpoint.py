@@ -0,0 +1,275 @@
+import argparse
+import asyncio
+import glob
+import json
+import os
+import threading
+import time
+from aiohttp import web
+from rdflib import BNode, Graph, Literal, URIRef, Variable
+from rdflib.util import from_n3, guess_format
+from fast_reason import infer_triples
+from utils.property_views import PropertyViews
+from utils.query_registry import QueryRegistry, prepare_query
+from utils.rule_engine import run_rules
+from utils.snapshot import open_snapshot
+
+# Graph served by default: the ontology modules, EC1990 and the test data
+script_dir = os.path.dirname(os.path.realpath(__file__))
+parent_dir = os.path.dirname(script_dir)
+DEFAULT_SOURCES = sorted(glob.glob(os.path.join(parent_dir, 'resources', 'Ontologies', '**', '*.ttl'), recursive=True)) + \
+    [os.path.join(parent_dir, 'ontologies', 'EC1990.ttl'),
+     os.path.join(parent_dir, 'resources', 'Graph_data', 'test_data.ttl')]
+
+# Local only by default: the endpoint has no authentication
+HOST = '127.0.0.1'
+PORT = 8890
+
+# Serialized results kept per graph version
+CACHE_SIZE = 1024
+
+SPARQL_JSON = 'application/sparql-results+json'
+
+
+def load_graph(sources=None, rules=False, reason=False):
+    """
+    Build the graph to serve.
+
+    :param sources: RDF files to merge (defaults to DEFAULT_SOURCES); a single .snap file
+                    written by utils.snapshot.write_snapshot is served from its mapping instead
+    :param rules: run the SPARQL rules of resources/Rules on the merged graph
+    :param reason: add the OWL RL inferences of fast_reason.infer_triples
+    :return: rdflib Graph
+    """
+    sources = sources or DEFAULT_SOURCES
+    if len(sources) == 1 and sources[0].endswith('.snap'):
+        if rules or reason:
+            raise ValueError("Snapshots are read-only: run the rules and the reasoner before writing them")
+        return open_snapshot(sources[0])
+    graph = Graph()
+    for path in sources:
+        graph.parse(path, format=guess_format(path) or 'turtle')
+    if rules:
+        run_rules(graph)
+    if reason:
+        graph.addN((s, p, o, graph) for s, p, o in infer_triples(graph))
+    return graph
+
+
+class GraphVersion:
+    """
+    One immutable state of the served graph, with its materialized property views and a cache
+    of serialized results. Requests take the current version once and only read from it, so
+    replacing the endpoint's version is atomic and never disturbs running queries.
+    """
+
+    def __init__(self, graph, number):
+        self.graph = graph
+        self.number = number
+        self.loaded_at = time.time()
+        self.triples = len(graph)
+        self.views = PropertyViews(graph)
+        self.cache = {}
+        self._lock = threading.Lock()
+
+    def cached(self, key, compute):
+        """ Serialized result for key, computed on a miss (oldest entries are evicted first) """
+        body = self.cache.get(key)
+        if body is None:
+            body = compute()
+            with self._lock:
+                if len(self.cache) >= CACHE_SIZE:
+                    self.cache.pop(next(iter(self.cache)))
+                self.cache[key] = body
+        return body
+
+
+def _term_json(term):
+    if isinstance(term, URIRef):
+        return {'type': 'uri', 'value': str(term)}
+    if isinstance(term, BNode):
+        return {'type': 'bnode', 'value': str(term)}
+    value = {'type': 'literal', 'value': str(term)}
+    if term.language:
+        value['xml:lang'] = term.language
+    elif term.datatype:
+        value['datatype'] = str(term.datatype)
+    return value
+
+
+def _select_json(variables, rows):
+    """ SPARQL 1.1 JSON results of a SELECT, rows being tuples in the order of variables """
+    names = [str(v) for v in variables]
+    bindings = [{name: _term_json(term) for name, term in zip(names, row) if term is not None} for row in rows]
+    return json.dumps({'head': {'vars': names}, 'results': {'bindings': bindings}}).encode('utf-8')
+
+
+def _result_body(result):
+    """ (body, content type) of an rdflib query Result """
+    if result.type == 'SELECT':
+        return _select_json(result.vars, [tuple(row) for row in result]), SPARQL_JSON
+    if result.type == 'ASK':
+        return json.dumps({'head': {}, 'boolean': result.askAnswer}).encode('utf-8'), SPARQL_JSON
+    return result.serialize(format='turtle'), 'text/turtle'
+
+
+def _parse_binding(text):
+    """ Query-string binding: N3 syntax (<iri>, "literal"^^<type>) or a bare IRI """
+    term = from_n3(text) if text[:1] in ('<', '"', '_') else URIRef(text)
+    if not isinstance(term, (URIRef, BNode, Literal)):
+        raise ValueError(f"{text!r} is not an IRI, blank node or literal")
+    return term
+
+
+class SparqlEndpoint:
+    """
+    Local HTTP SPARQL endpoint serving one shared, read-only graph.
+
+    The graph is loaded once and every request reads the current GraphVersion. Queries run in
+    the default thread pool so the event loop keeps accepting connections. Named queries with a
+    materialized view are answered from it, and repeated requests are served from the
+    version's result cache. reload() builds a new version in the background and swaps it in
+    with a single assignment, after rule or reasoning runs for instance.
+
+    Routes:
+      GET  /status                      graph version, triple count, load time
+      GET  /queries                     names of the queries of resources/Queries
+      GET  /queries/{name}?C=<iri>      run a named query, query-string values bound to its variables
+      GET  /sparql?query=...            ad-hoc SELECT/ASK/CONSTRUCT/DESCRIBE (also POST as a form
+      POST /sparql                      or as application/sparql-query); updates are refused
+      POST /reload?rules=1&reason=1     reload the sources (optionally with rules/reasoning) and swap
+    """
+
+    def __init__(self, sources=None, rules=False, reason=False):
+        self.sources = sources
+        self.settings = {'rules': rules, 'reason': reason}
+        self.registry = QueryRegistry()
+        self.version = GraphVersion(load_graph(sources, rules, reason), 1)
+        self._reloading = asyncio.Lock()
+
+    def swap(self, graph):
+        """ Serve a new graph; requests already running finish on the previous version """
+        self.version = GraphVersion(graph, self.version.number + 1)
+        return self.version
+
+    async def reload(self, rules=None, reason=None):
+        """ Rebuild the graph and its views from the sources without blocking the requests, then swap it in """
+        rules = self.settings['rules'] if rules is None else rules
+        reason = self.settings['reason'] if reason is None else reason
+        async with self._reloading:
+            loop = asyncio.get_running_loop()
+            number = self.version.number + 1
+            version = await loop.run_in_executor(
+                None, lambda: GraphVersion(load_graph(self.sources, rules, reason), number))
+            self.version = version
+            return version
+
+    def app(self):
+        app = web.Application()
+        app.add_routes([
+            web.get('/status', self.handle_status),
+            web.get('/queries', self.handle_list),
+            web.get('/queries/{name}', self.handle_named),
+            web.get('/sparql', self.handle_sparql),
+            web.post('/sparql', self.handle_sparql),
+            web.post('/reload', self.handle_reload),
+        ])
+        return app
+
+    # Query evaluation (runs in the thread pool)
+
+    def _named(self, version, name, bindings):
+        view = version.views.views.get(name)
+        if view is not None and set(bindings) <= {str(view.variables[0])}:
+            concrete = bindings.get(str(view.variables[0]))
+            return _select_json(view.variables, view.rows(concrete)), SPARQL_JSON
+        _, query = self.registry.queries[name]
+        init = {Variable(k): v for k, v in bindings.items()}
+        return _result_body(version.graph.query(query, initBindings=init))
+
+    def _adhoc(self, version, query):
+        return _result_body(version.graph.query(query))
+
+    async def _respond(self, version, key, compute):
+        loop = asyncio.get_running_loop()
+        body, content_type = await loop.run_in_executor(None, version.cached, key, compute)
+        return web.Response(body=body, content_type=content_type,
+                            headers={'X-Graph-Version': str(version.number)})
+
+    # Handlers
+
+    async def handle_status(self, request):
+        version = self.version
+        return web.json_response({'version': version.number, 'triples': version.triples,
+                                  'loaded_at': version.loaded_at, 'views': version.views.names()})
+
+    async def handle_list(self, request):
+        return web.json_response(self.registry.names())
+
+    async def handle_named(self, request):
+        name = request.match_info['name']
+        if name not in self.registry:
+            raise web.HTTPNotFound(text=f"Unknown query '{name}'; available: {', '.join(self.registry.names())}")
+        try:
+            bindings = {k: _parse_binding(v) for k, v in request.query.items()}
+            key = ('named', name, tuple(sorted((k, v.n3()) for k, v in bindings.items())))
+        except Exception as e:
+            raise web.HTTPBadRequest(text=f"Invalid binding: {e}")
+        version = self.version
+        return await self._respond(version, key, lambda: self._named(version, name, bindings))
+
+    async def handle_sparql(self, request):
+        text = request.query.get('query')
+        if text is None and request.method == 'POST':
+            if request.content_type == 'application/sparql-query':
+                text = await request.text()
+            else:
+                text = (await request.post()).get('query')
+        if not text:
+            raise web.HTTPBadRequest(text="Missing 'query' parameter")
+        try:
+            _, query, _ = prepare_query(text)
+        except Exception as e:
+            raise web.HTTPBadRequest(text=f"Invalid query (updates are not accepted): {e}")
+        version = self.version
+        return await self._respond(version, ('sparql', text), lambda: self._adhoc(version, query))
+
+    async def handle_reload(self, request):
+        flags = {k: request.query[k] not in ('0', 'false') for k in ('rules', 'reason') if k in request.query}
+        if self._reloading.locked():
+            raise web.HTTPConflict(text="A reload is already running")
+        try:
+            version = await self.reload(**flags)
+        except Exception as e:
+            raise web.HTTPInternalServerError(text=f"Reload failed, still serving version {self.version.number}: {e}")
+        print(f"✅ Graph version {version.number} loaded ({version.triples} triples)")
+        return web.json_response({'version': version.number, 'triples': version.triples})
+
+
+def serve(sources=None, host=HOST, port=PORT, rules=False, reason=False):
+    """
+    Load the graph and serve it until interrupted.
+
+    :param sources: RDF files to serve (defaults to DEFAULT_SOURCES), or a single .snap file
+    :param host: interface to listen on (local only by default)
+    :param port: TCP port
+    :param rules: run the SPARQL rules before serving (and on every reload)
+    :param reason: add the OWL RL inferences before serving (and on every reload)
+    """
+    async def make_app():
+        endpoint = SparqlEndpoint(sources, rules, reason)
+        print(f"✅ Serving {endpoint.version.triples} triples on http://{host}:{port}/sparql")
+        return endpoint.app()
+
+    web.run_app(make_app(), host=host, port=port, print=None)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Local SPARQL endpoint over the merged ontology graph")
+    parser.add_argument('sources', nargs='*', help="RDF files to serve, or one .snap snapshot")
+    parser.add_argument('--host', default=HOST)
+    parser.add_argument('--port', type=int, default=PORT)
+    parser.add_argument('--rules', action='store_true', help="run the rules of resources/Rules first")
+    parser.add_argument('--reason', action='store_true', help="add the OWL RL inferences first")
+    args = parser.parse_args()
+    serve(args.sources or None, args.host, args.port, args.rules, args.reason)
@@ -0,0 +1,187 @@
+from collections import defaultdict
+from rdflib import URIRef
+from rdflib.namespace import RDF, RDFS, OWL
+from utils.rdf_terms import read_list
+
+
+def _bits(mask):
+    """ Positions of the bits set in mask, lowest first """
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+def _members(mask, classes):
+    """ Classes whose bit is set in mask, lowest id first """
+    return [classes[i] for i in _bits(mask)]
+
+
+class SubsumptionIndex:
+    """
+    Precomputed class hierarchy of an ontology, answering subsumption and disjointness
+    questions without walking the graph.
+
+    Every named class gets an integer id; its reflexive-transitive superclasses
+    (rdfs:subClassOf, owl:equivalentClass) and subclasses are stored as bitsets in Python ints.
+    Disjointness (owl:disjointWith, owl:AllDisjointClasses) is inherited by subclasses: the
+    classes excluded by a class are kept as a bitset too, so every query is a couple of bit
+    operations. Classes are accepted as URIRefs or plain IRI strings (e.g. the constants of
+    core.ec1990_vocab); unknown classes only subsume themselves.
+    """
+
+    def __init__(self, graph):
+        parents = defaultdict(set)
+        declared = defaultdict(set)
+        names = set(c for c in graph.subjects(RDF.type, OWL.Class) if isinstance(c, URIRef))
+
+        for c, d in graph.subject_objects(RDFS.subClassOf):
+            if isinstance(c, URIRef) and isinstance(d, URIRef):
+                parents[c].add(d)
+                names.update((c, d))
+        for c, d in graph.subject_objects(OWL.equivalentClass):
+            if isinstance(c, URIRef) and isinstance(d, URIRef):
+                parents[c].add(d)
+                parents[d].add(c)
+                names.update((c, d))
+        for c, d in graph.subject_objects(OWL.disjointWith):
+            if isinstance(c, URIRef) and isinstance(d, URIRef):
+                declared[c].add(d)
+                declared[d].add(c)
+                names.update((c, d))
+        for node in graph.subjects(RDF.type, OWL.AllDisjointClasses):
+            for head in graph.objects(node, OWL.members):
+                members = [c for c in read_list(graph, head) if isinstance(c, URIRef)]
+                names.update(members)
+                for c in members:
+                    declared[c].update(d for d in members if d != c)
+
+        self.classes = sorted(names)
+        self.ids = {c: i for i, c in enumerate(self.classes)}
+        bits = [1 << i for i in range(len(self.classes))]
+        parent_ids = [[self.ids[d] for d in parents.get(c, ())] for c in self.classes]
+
+        # Ancestor closure, propagated until stable (a single pass unless there are cycles)
+        self.ancestors = list(bits)
+        order = self._topological_order(parent_ids)
+        changed = True
+        while changed:
+            changed = False
+            for i in order:
+                mask = self.ancestors[i]
+                for j in parent_ids[i]:
+                    mask |= self.ancestors[j]
+                if mask != self.ancestors[i]:
+                    self.ancestors[i] = mask
+                    changed = True
+
+        self.descendants = list(bits)
+        for i, mask in enumerate(self.ancestors):
+            for j in _bits(mask):
+                self.descendants[j] |= bits[i]
+
+        # Classes declared disjoint with a class, then with the class or any of its ancestors
+        self.disjoint = [0] * len(self.classes)
+        for c, others in declared.items():
+            for d in others:
+                self.disjoint[self.ids[c]] |= bits[self.ids[d]]
+        self.excluded = []
+        for mask in self.ancestors:
+            excluded = 0
+            for j in _bits(mask):
+                excluded |= self.disjoint[j]
+            self.excluded.append(excluded)
+
+    @staticmethod
+    def _topological_order(parent_ids):
+        """ Class ids with parents before children (iterative depth-first post-order) """
+        order, seen = [], set()
+        for root in range(len(parent_ids)):
+            if root in seen:
+                continue
+            seen.add(root)
+            stack = [(root, iter(parent_ids[root]))]
+            while stack:
+                node, pending = stack[-1]
+                nxt = next(pending, None)
+                if nxt is None:
+                    stack.pop()
+                    order.append(node)
+                elif nxt not in seen:
+                    seen.add(nxt)
+                    stack.append((nxt, iter(parent_ids[nxt])))
+        return order
+
+    def __len__(self):
+        return len(self.classes)
+
+    def __contains__(self, cls):
+        return URIRef(cls) in self.ids
+
+    def id(self, cls):
+        """ Integer id of a class, or None if it is not in the index """
+        return self.ids.get(URIRef(cls))
+
+    def is_subclass(self, cls, parent):
+        """ True if cls is parent or one of its (transitive) subclasses """
+        i, j = self.id(cls), self.id(parent)
+        if i is None or j is None:
+            return URIRef(cls) == URIRef(parent)
+        return (self.ancestors[i] >> j) & 1 == 1
+
+    def superclasses(self, cls):
+        """ All superclasses of a class, itself included """
+        i = self.id(cls)
+        return [URIRef(cls)] if i is None else _members(self.ancestors[i], self.classes)
+
+    def subclasses(self, cls):
+        """ All subclasses of a class, itself included """
+        i = self.id(cls)
+        return [URIRef(cls)] if i is None else _members(self.descendants[i], self.classes)
+
+    def common_ancestors(self, cls, other):
+        """ Classes subsuming both cls and other """
+        i, j = self.id(cls), self.id(other)
+        if i is None or j is None:
+            return [URIRef(cls)] if URIRef(cls) == URIRef(other) else []
+        return _members(self.ancestors[i] & self.ancestors[j], self.classes)
+
+    def least_common_ancestors(self, cls, other):
+        """ Most specific classes subsuming both cls and other """
+        i, j = self.id(cls), self.id(other)
+        if i is None or j is None:
+            return self.common_ancestors(cls, other)
+        common = self.ancestors[i] & self.ancestors[j]
+        # Keep the common ancestors with no strict subclass among them (equivalent classes stay together)
+        return [self.classes[k] for k in _bits(common) if common & self.descendants[k] & ~self.ancestors[k] == 0]
+
+    def are_disjoint(self, cls, other):
+        """ True if cls and other (or any of their superclasses) are declared disjoint """
+        i, j = self.id(cls), self.id(other)
+        if i is None or j is None:
+            return False
+        return self.excluded[i] & self.ancestors[j] != 0
+
+    def disjoint_pairs(self, cls, other):
+        """
+        Declared disjoint pairs (c, d), c a superclass of cls and d a superclass of other, that
+        make the two classes disjoint, as class id pairs with the lower id first
+        """
+        i, j = self.id(cls), self.id(other)
+        if i is None or j is None:
+            return []
+        pairs = set()
+        for c in _bits(self.ancestors[i]):
+            for d in _bits(self.disjoint[c] & self.ancestors[j]):
+                pairs.add((min(c, d), max(c, d)))
+        return sorted(pairs)
+
+    def unsatisfiable(self):
+        """ Classes that are subclasses of two disjoint classes, hence can have no instances """
+        return [c for i, c in enumerate(self.classes) if self.excluded[i] & self.ancestors[i]]
+
+
+def ec1990_index():
+    """ Subsumption index of the EC1990 ontology, built from core.Eurocode1990 without reading the TTL """
+    from core.Eurocode1990 import build_ec1990
+    return SubsumptionIndex(build_ec1990())
@@ -0,0 +1,214 @@
+import keyword
+import os
+import re
+from collections import defaultdict
+from rdflib import Graph, Literal, URIRef
+from rdflib.namespace import OWL, RDF, RDFS, SKOS
+from utils.hashing import file_hash
+
+# Default ontology and generated module
+script_dir = os.path.dirname(os.path.realpath(__file__))
+parent_dir = os.path.dirname(script_dir)
+EC1990_TTL = os.path.join(parent_dir, 'ontologies', 'EC1990.ttl')
+VOCAB_PATH = os.path.join(parent_dir, 'core', 'ec1990_vocab.py')
+
+# Sections of the generated module, by rdf:type of the term
+KINDS = [
+    (OWL.Class, 'CLASSES', 'Classes'),
+    (OWL.ObjectProperty, 'OBJECT_PROPERTIES', 'Object properties'),
+    (OWL.DatatypeProperty, 'DATATYPE_PROPERTIES', 'Datatype properties'),
+    (OWL.NamedIndividual, 'INDIVIDUALS', 'Individuals'),
+]
+
+# Names defined by the generated module itself, never used for a term constant
+_RESERVED = {'NAMESPACE', 'SOURCE_SHA256', 'LABELS', 'DEFINITIONS', 'SYMBOLS', 'PARENTS', 'CHILDREN',
+             'TYPES', 'ANCESTORS', 'is_subclass_of', 'is_instance_of'} | {kind[1] for kind in KINDS}
+
+_HEADER = '''\
+# Generated by utils/vocabulary.py from {source}; do not edit.
+# Regenerate with: python -m utils.vocabulary
+from sys import intern as _i
+
+SOURCE_SHA256 = {sha256!r}
+NAMESPACE = {namespace!r}
+'''
+
+_FUNCTIONS = '''
+
+def is_subclass_of(cls, parent):
+    """ True if cls is parent or one of its (transitive) subclasses """
+    return cls == parent or parent in ANCESTORS.get(cls, ())
+
+
+def is_instance_of(individual, cls):
+    """ True if one of the types of individual is cls or a subclass of it """
+    return any(is_subclass_of(t, cls) for t in TYPES.get(individual, ()))
+'''
+
+
+def generated_hash(module_path):
+    """ SHA-256 of the ontology a generated module was built from, read without importing it """
+    if not os.path.exists(module_path):
+        return None
+    with open(module_path, encoding='utf-8') as f:
+        match = re.search(r"^SOURCE_SHA256 = '([0-9a-f]+)'$", f.read(4096), re.MULTILINE)
+    return match.group(1) if match else None
+
+
+def _ontology_namespace(g):
+    for onto in g.subjects(RDF.type, OWL.Ontology):
+        iri = str(onto)
+        return iri if iri.endswith(('#', '/')) else iri + '#'
+    raise ValueError("No owl:Ontology in the graph")
+
+
+def _identifier(name, taken):
+    identifier = re.sub(r'\W', '_', name)
+    if not identifier or identifier[0].isdigit():
+        identifier = '_' + identifier
+    while keyword.iskeyword(identifier) or identifier in _RESERVED or identifier in taken:
+        identifier += '_'
+    return identifier
+
+
+def _literal(g, s, p):
+    """ English (or untagged) value of a literal property, if any """
+    values = [o for o in g.objects(s, p) if isinstance(o, Literal)]
+    for value in values:
+        if value.language in ('en', None):
+            return str(value)
+    return str(values[0]) if values else None
+
+
+def _ancestors(parents):
+    """ Transitive closure of the parent relation """
+    closure = {}
+
+    def visit(node, path):
+        if node in closure:
+            return closure[node]
+        found = set()
+        for parent in parents.get(node, ()):
+            found.add(parent)
+            if parent not in path:
+                found |= visit(parent, path | {parent})
+        closure[node] = found
+        return found
+
+    for node in parents:
+        visit(node, {node})
+    return closure
+
+
+def render_vocabulary(g, sha256='', source=''):
+    """
+    Python source of a vocabulary module for the terms of an ontology graph.
+
+    The module only holds string constants, dicts and tuples (no rdflib import): one interned
+    IRI constant per class, property and individual of the ontology namespace, their
+    labels, definitions and symbols, direct parents and children (rdfs:subClassOf and
+    rdfs:subPropertyOf), the types of individuals, the transitive ancestors and the
+    is_subclass_of / is_instance_of helpers.
+
+    :param g: rdflib Graph of the ontology
+    :param sha256: hash of the source file, stored as SOURCE_SHA256
+    :param source: name of the source file, for the header comment
+    :return: module source code
+    """
+    namespace = _ontology_namespace(g)
+    names = {}
+    sections = []
+    for kind, table, title in KINDS:
+        terms = sorted(s for s in g.subjects(RDF.type, kind)
+                       if isinstance(s, URIRef) and str(s).startswith(namespace) and s not in names)
+        for s in terms:
+            names[s] = _identifier(str(s)[len(namespace):], set(names.values()))
+        sections.append((table, title, terms))
+
+    def ref(node):
+        return names.get(node) or repr(str(node))
+
+    parents = defaultdict(list)
+    types = defaultdict(list)
+    for s in names:
+        for p in (RDFS.subClassOf, RDFS.subPropertyOf):
+            parents[s].extend(sorted(o for o in g.objects(s, p) if isinstance(o, URIRef)))
+        if (s, RDF.type, OWL.NamedIndividual) in g:
+            types[s] = sorted(o for o in g.objects(s, RDF.type) if isinstance(o, URIRef) and o != OWL.NamedIndividual)
+    children = defaultdict(list)
+    for s, ps in parents.items():
+        for parent in ps:
+            children[parent].append(s)
+    ancestors = _ancestors(parents)
+
+    lines = [_HEADER.format(source=source, sha256=sha256, namespace=namespace)]
+    for table, title, terms in sections:
+        lines.append(f"# {title}")
+        lines.extend(f"{names[s]} = _i({str(s)!r})" for s in terms)
+        lines.append('')
+    for table, title, terms in sections:
+        lines.append(f"{table} = (")
+        lines.extend(f"    {names[s]}," for s in terms)
+        lines.append(')')
+    lines.append('')
+
+    def mapping(name, items, comment):
+        lines.append(f"# {comment}")
+        lines.append(f"{name} = {{")
+        lines.extend(f"    {key}: {value}," for key, value in items)
+        lines.append('}')
+        lines.append('')
+
+    def values(nodes):
+        items = [ref(n) for n in nodes]
+        return '(' + items[0] + ',)' if len(items) == 1 else '(' + ', '.join(items) + ')'
+
+    mapping('LABELS', [(names[s], repr(v)) for s in names for v in [_literal(g, s, RDFS.label)] if v is not None],
+            'rdfs:label of every term')
+    mapping('DEFINITIONS', [(names[s], repr(v)) for s in names for v in [_literal(g, s, SKOS.definition)] if v is not None],
+            'skos:definition of every term')
+    mapping('SYMBOLS', [(names[s], repr(v)) for s in names for v in [_literal(g, s, SKOS.altLabel)] if v is not None],
+            'skos:altLabel (Eurocode notation)')
+    mapping('PARENTS', [(names[s], values(parents[s])) for s in names if parents[s]],
+            'Direct superclasses and superproperties')
+    mapping('CHILDREN', [(ref(parent), values(sorted(children[parent], key=str))) for parent in sorted(children, key=str)],
+            'Direct subclasses and subproperties')
+    mapping('TYPES', [(names[s], values(types[s])) for s in names if types[s]],
+            'Classes of the individuals')
+    mapping('ANCESTORS', [(names[s], 'frozenset(' + values(sorted(ancestors[s], key=str)) + ')') for s in names if ancestors.get(s)],
+            'Transitive superclasses and superproperties')
+    return '\n'.join(lines).rstrip('\n') + '\n' + _FUNCTIONS
+
+
+def generate_vocabulary(ttl_path=EC1990_TTL, module_path=VOCAB_PATH, force=False):
+    """
+    Write the vocabulary module of an ontology, unless it was generated from the same file.
+
+    The SHA-256 of the Turtle file is recorded in the module; as long as it matches, the
+    ontology is not parsed at all.
+
+    :param ttl_path: ontology file
+    :param module_path: Python module to write
+    :param force: regenerate even when the module is up to date
+    :return: True if the module was written, False if it was up to date
+    """
+    sha256 = file_hash(ttl_path)
+    if not force and generated_hash(module_path) == sha256:
+        print(f"⏭️ Up to date: {module_path}")
+        return False
+
+    g = Graph()
+    g.parse(ttl_path, format='turtle')
+    source = os.path.relpath(ttl_path, parent_dir).replace(os.sep, '/')
+    code = render_vocabulary(g, sha256, source)
+
+    tmp_path = module_path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(code)
+    os.replace(tmp_path, module_path)
+    print(f"✅ Generated {module_path} from {ttl_path}")
+    return True
+
+
+if __name__ == "__main__":
+    generate_vocabulary()